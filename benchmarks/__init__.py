@@ -0,0 +1 @@
+# Benchmarks package — synthetic products and timing runner for the core engines.
@@ -0,0 +1,150 @@
+"""
+Collibra Load Benchmark
+Imports a synthetic domain through the real CollibraClient and CollibraImporter against the fake server.
+
+Usage:
+    python -m benchmarks.collibra_load --size small
+    python -m benchmarks.collibra_load --size medium --latency-ms 40 --rate-limit 0.05 --retry-after 0.1
+    python -m benchmarks.collibra_load --size small --timeout 0.01 --client-timeout 0.5 --output load.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.fake_collibra_server import FakeCollibraServer, FaultProfile  # noqa: E402
+from benchmarks.synthetic import SIZES  # noqa: E402
+
+
+def _status_counts(server: FakeCollibraServer) -> Dict[str, int]:
+    return {str(key): count for key, count in sorted(server.stats.items(), key=str) if isinstance(key, int)}
+
+
+def _route_counts(server: FakeCollibraServer) -> Dict[str, int]:
+    return {
+        f"{key[0]} {key[1]}": count
+        for key, count in sorted(server.stats.items(), key=str)
+        if isinstance(key, tuple) and len(key) == 2
+    }
+
+
+def run_import(server: FakeCollibraServer, client, label: str) -> Dict:
+    """Run one full import and report wall time, throughput and what the server saw."""
+    from core.collibra_importer import CollibraImporter
+
+    server.reset_stats()
+    cache_before = client.cache.stats.as_dict() if client.cache is not None else {}
+    started = time.perf_counter()
+    error = None
+    try:
+        result = CollibraImporter(client, dialect="").import_all(server.domain_name)
+        entities = result["data_model"]["entities"]
+        summary = {
+            "entities": len(entities),
+            "attributes": sum(len(e["attributes"]) for e in entities),
+            "sources": len(result["sources"]),
+            "quality_rules": result["quality_rule_report"],
+        }
+    except Exception as e:  # report the failure mode rather than abort the benchmark
+        error = f"{type(e).__name__}: {e}"
+        summary = {}
+    elapsed = time.perf_counter() - started
+
+    cache_after = client.cache.stats.as_dict() if client.cache is not None else {}
+    report = {
+        "run": label,
+        "wall_seconds": round(elapsed, 3),
+        "assets_per_second": round(len(server.assets) / elapsed, 1) if elapsed else None,
+        "requests": sum(_route_counts(server).values()),
+        "statuses": _status_counts(server),
+        "routes": _route_counts(server),
+        "cache_hits": cache_after.get("hits", 0) - cache_before.get("hits", 0),
+        "cache_misses": cache_after.get("misses", 0) - cache_before.get("misses", 0),
+        "import": summary,
+    }
+    if error:
+        report["error"] = error
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Collibra imports against the fake server.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small", help="Synthetic domain preset")
+    parser.add_argument("--entities", type=int, help="Override the preset's table count")
+    parser.add_argument("--attributes", type=int, help="Override columns per table")
+    parser.add_argument("--sources", type=int, help="Override the source count")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Probability of a 429")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds on 429s")
+    parser.add_argument("--server-error", type=float, default=0.0, help="Probability of a 503")
+    parser.add_argument("--timeout", type=float, default=0.0, help="Probability of a hang")
+    parser.add_argument("--client-timeout", type=float, default=5.0, help="CollibraClient request timeout")
+    parser.add_argument("--page-size", type=int, help="CollibraClient page size")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the client's response cache")
+    parser.add_argument("--output", help="Write the results JSON here")
+    args = parser.parse_args(argv)
+
+    from core.collibra_cache import MemoryCache
+    from core.collibra_client import CollibraClient
+
+    entities, attributes, sources, _ = SIZES[args.size]
+    faults = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        server_error=args.server_error,
+        timeout=args.timeout,
+        hang_seconds=args.client_timeout * 2,
+    )
+    server = FakeCollibraServer.generate(
+        args.entities if args.entities is not None else entities,
+        args.attributes if args.attributes is not None else attributes,
+        args.sources if args.sources is not None else sources,
+        faults=faults,
+    )
+
+    reports = []
+    with server:
+        # A private cache, so the cold run starts empty whatever the process cache holds
+        cache = None if args.no_cache else MemoryCache()
+        client = CollibraClient(server.base_url, "benchmark", "benchmark", cache=cache)
+        client.timeout = args.client_timeout
+        if args.page_size:
+            client.page_size = args.page_size
+
+        print(f"Fake Collibra at {server.base_url}: {len(server.assets)} assets, {len(server.relations)} relations")
+        for label in ("cold", "warm"):
+            report = run_import(server, client, label)
+            reports.append(report)
+            print(f"  {label:<5} {report['wall_seconds']:>8.2f} s  {report['assets_per_second'] or 0:>10.0f} assets/s  "
+                  f"{report['requests']:>6} requests  statuses {report['statuses']}  "
+                  f"cache {report['cache_hits']} hits / {report['cache_misses']} misses")
+            if "error" in report:
+                print(f"        failed: {report['error']}")
+
+    if args.output:
+        document = {
+            "params": {
+                "assets": len(server.assets),
+                "relations": len(server.relations),
+                "faults": {k: v for k, v in vars(faults).items() if not k.startswith("_")},
+                "client_timeout": args.client_timeout,
+                "cache": not args.no_cache,
+            },
+            "runs": reports,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 1 if any("error" in r for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
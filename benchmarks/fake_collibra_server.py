@@ -0,0 +1,465 @@
+"""
+Fake Collibra Server
+Local stand-in for the Collibra REST API, serving a synthetic domain with injectable latency and faults.
+
+Usage:
+    python -m benchmarks.fake_collibra_server --size medium --port 8080 --latency-ms 40 --rate-limit 0.05
+
+Then point the app (or CollibraClient) at it:
+    COLLIBRA_BASE_URL=http://127.0.0.1:8080 COLLIBRA_USERNAME=x COLLIBRA_PASSWORD=x streamlit run streamlit_app.py
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import SIZES, make_domain  # noqa: E402
+
+API_PREFIX = "/api/v1/"
+DEFAULT_PAGE_SIZE = 1000
+
+
+class FaultProfile:
+    """What can go wrong on each request, drawn independently per request.
+
+    Checked in order: a hang (the response is delayed past the client's
+    timeout), a 429 with Retry-After, a 503, then normal latency.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after: Optional[float] = 1.0,
+        server_error: float = 0.0,
+        timeout: float = 0.0,
+        hang_seconds: float = 35.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            latency_ms: Added to every response
+            jitter_ms: Uniform random extra latency, 0..jitter_ms
+            rate_limit: Probability of a 429 response
+            retry_after: Retry-After header on 429s, in seconds (None to omit)
+            server_error: Probability of a 503 response
+            timeout: Probability the server hangs for hang_seconds before answering
+            hang_seconds: How long a hang lasts; set above the client's timeout
+            seed: Random seed, so fault sequences are repeatable
+        """
+        for name, p in (("rate_limit", rate_limit), ("server_error", server_error), ("timeout", timeout)):
+            if not 0.0 <= p <= 1.0:
+                raise ValueError(f"{name} must be a probability between 0 and 1")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.server_error = server_error
+        self.timeout = timeout
+        self.hang_seconds = hang_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> Tuple[Optional[int], float]:
+        """Return (fault status or None, seconds to wait before responding)."""
+        with self._lock:
+            roll = self._random.random()
+            jitter = self._random.random() * self.jitter_ms
+        delay = (self.latency_ms + jitter) / 1000
+        if roll < self.timeout:
+            return None, self.hang_seconds
+        roll -= self.timeout
+        if roll < self.rate_limit:
+            return 429, delay
+        roll -= self.rate_limit
+        if roll < self.server_error:
+            return 503, delay
+        return None, delay
+
+
+class FakeCollibraServer:
+    """Threaded HTTP server implementing the Collibra endpoints CollibraClient calls.
+
+    GET  assets                  (domainName, type, limit, offset, lastModifiedSince)
+    GET  assets/search           (query, limit)
+    GET  assets/{id}
+    GET  assets/{id}/relations
+    GET  assets/{id}/quality-rules
+    GET  relations               (relationType, domainName, limit, offset)
+    POST assets, assets/bulk; PATCH assets/{id}, assets/bulk
+
+    Relations in POST and PATCH payloads ({relation type: [{"name": target}]})
+    are stored with the new or updated asset as source, so repeat publishes
+    can be diffed against them. A PATCH replaces the asset's relations of
+    each type it lists.
+
+    Every response is counted in stats by method, route and status, so a
+    benchmark can tell how many calls a client made, retried or served
+    from its cache.
+    """
+
+    def __init__(
+        self,
+        assets: List[Dict],
+        relations: List[Dict],
+        domain_name: str = "Benchmark",
+        faults: Optional[FaultProfile] = None,
+        rules_every: int = 10,
+        max_page_size: int = DEFAULT_PAGE_SIZE,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            assets: Domain assets (e.g. from benchmarks.synthetic.make_domain)
+            relations: "is part of" relations between them
+            domain_name: Name the domain is served under
+            faults: Latency and failure injection (default none)
+            rules_every: Every Nth asset has one quality rule (0 for none)
+            max_page_size: Largest page served, whatever limit is requested (as real servers cap it)
+            host: Interface to bind
+            port: Port to bind; 0 picks a free one
+        """
+        self.domain_name = domain_name
+        self.assets = assets
+        self.relations = relations
+        self.faults = faults or FaultProfile()
+        self.rules_every = rules_every
+        self.max_page_size = max_page_size
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._by_id = {asset["id"]: asset for asset in assets}
+        self._by_name = {}
+        for asset in assets:
+            self._by_name.setdefault(asset.get("name", ""), asset)
+        self._index = {asset["id"]: i for i, asset in enumerate(assets)}
+        self._relations_by_source: Dict[str, List[Dict]] = {}
+        for relation in relations:
+            self._relations_by_source.setdefault(relation["sourceAsset"]["id"], []).append(relation)
+        self._created = 0
+        self._replaced = set()  # ids of relations superseded by a PATCH, pending removal from self.relations
+
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def generate(cls, entities: int, attributes: int, sources: int, seed: int = 0, **kwargs) -> "FakeCollibraServer":
+        """Serve a synthetic domain of the given size; kwargs as for __init__."""
+        assets, relations = make_domain(entities, attributes, sources, seed)
+        return cls(assets, relations, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeCollibraServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-collibra", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeCollibraServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def count(self, method: str, route: str, status: int):
+        """Record one response; stats keys are (method, route) -> total, (method, route, status) and status."""
+        with self._lock:
+            self.stats[(method, route)] += 1
+            self.stats[(method, route, status)] += 1
+            self.stats[status] += 1
+
+    # ── Routes ─────────────────────────────────────────────────────────
+
+    def route(self, method: str, parts: List[str], query: Dict[str, str], body) -> Tuple[int, Dict]:
+        """Return (status, JSON body) for one request; parts are the path segments after /api/v1/."""
+        if method == "GET":
+            if parts == ["assets"]:
+                return 200, self._list_assets(query)
+            if parts == ["assets", "search"]:
+                return 200, self._search(query)
+            if parts == ["relations"]:
+                return 200, self._list_relations(query)
+            if len(parts) >= 2 and parts[0] == "assets":
+                asset = self._by_id.get(parts[1])
+                if asset is None:
+                    return 404, {"message": f"Asset {parts[1]} not found"}
+                if len(parts) == 2:
+                    return 200, asset
+                if parts[2:] == ["relations"]:
+                    return 200, {"relations": self._relations_by_source.get(asset["id"], [])}
+                if parts[2:] == ["quality-rules"]:
+                    return 200, {"results": self._quality_rules(asset["id"])}
+        elif method == "POST" and parts == ["assets"]:
+            return 201, self._create(body)
+        elif method == "POST" and parts == ["assets", "bulk"]:
+            return 201, {"results": [self._create(item) for item in body or []]}
+        elif method == "PATCH" and parts == ["assets", "bulk"]:
+            results = [self._update(item.get("id"), item) for item in body or []]
+            self._drop_replaced_relations()
+            return 200, {"results": results}
+        elif method == "PATCH" and len(parts) == 2 and parts[0] == "assets":
+            if parts[1] not in self._by_id:
+                return 404, {"message": f"Asset {parts[1]} not found"}
+            asset = self._update(parts[1], body or {})
+            self._drop_replaced_relations()
+            return 200, asset
+
+        return 404, {"message": f"No route for {method} /{'/'.join(parts)}"}
+
+    def _page(self, items: List[Dict], query: Dict[str, str]) -> Dict:
+        limit = min(int(query.get("limit", DEFAULT_PAGE_SIZE)), self.max_page_size)
+        offset = int(query.get("offset", 0))
+        return {"results": items[offset:offset + limit], "total": len(items), "offset": offset, "limit": limit}
+
+    def _list_assets(self, query: Dict[str, str]) -> Dict:
+        items = self.assets
+        domain = query.get("domainName")
+        if domain is not None and domain != self.domain_name:
+            items = []
+        if "type" in query:
+            items = [a for a in items if a.get("type", {}).get("name") == query["type"]]
+        if "lastModifiedSince" in query:
+            since = int(query["lastModifiedSince"])
+            items = [a for a in items if a.get("lastModifiedOn", 0) >= since]
+        return self._page(items, query)
+
+    def _search(self, query: Dict[str, str]) -> Dict:
+        text = query.get("query", "").lower()
+        limit = int(query.get("limit", 50))
+        matches = []
+        for asset in self.assets:
+            if text in asset.get("name", "").lower() or text in (asset.get("description") or "").lower():
+                matches.append(asset)
+                if len(matches) >= limit:
+                    break
+        return {"results": matches}
+
+    def _list_relations(self, query: Dict[str, str]) -> Dict:
+        items = self.relations
+        domain = query.get("domainName")
+        if domain is not None and domain != self.domain_name:
+            items = []
+        relation_type = query.get("relationType")
+        if relation_type:
+            items = [r for r in items if r.get("relationType", "").lower() == relation_type.lower()]
+        return self._page(items, query)
+
+    def _quality_rules(self, asset_id: str) -> List[Dict]:
+        if not self.rules_every or self._index[asset_id] % self.rules_every:
+            return []
+        return [{"id": f"rule-{asset_id}", "name": "NOT_NULL", "type": "completeness",
+                 "definition": "value IS NOT NULL", "threshold": 99}]
+
+    def _create(self, payload: Dict) -> Dict:
+        with self._lock:
+            self._created += 1
+            asset_id = f"new-{self._created}"
+        asset = {
+            "id": asset_id,
+            "name": payload.get("name", ""),
+            "type": {"name": payload.get("type", "")},
+            "description": payload.get("description", ""),
+            "attributes": payload.get("attributes", {}),
+            "lastModifiedOn": int(time.time() * 1000),
+        }
+        with self._lock:
+            self.assets.append(asset)
+            self._by_id[asset_id] = asset
+            self._by_name.setdefault(asset["name"], asset)
+            self._index[asset_id] = len(self.assets) - 1
+            self._set_relations(asset, payload.get("relations") or {})
+        return asset
+
+    def _update(self, asset_id: Optional[str], updates: Dict) -> Dict:
+        asset = self._by_id.get(asset_id)
+        if asset is None:
+            return {"id": asset_id, "error": "not found"}
+        with self._lock:
+            for key, value in updates.items():
+                if key in ("id", "relations", "domain"):
+                    continue
+                # Payloads name the type; stored assets keep Collibra's {"name": ...} shape
+                asset[key] = {"name": value} if key == "type" and isinstance(value, str) else value
+            asset["lastModifiedOn"] = int(time.time() * 1000)
+            self._set_relations(asset, updates.get("relations") or {})
+        return asset
+
+    def _set_relations(self, source: Dict, relations: Dict):
+        """Replace source's relations of each given type with links to the named targets (call under _lock)."""
+        if not relations:
+            return
+        kept = []
+        for relation in self._relations_by_source.get(source["id"], []):
+            if relation.get("relationType") in relations:
+                self._replaced.add(id(relation))
+            else:
+                kept.append(relation)
+        for relation_type, targets in relations.items():
+            for target in targets:
+                name = target.get("name", "")
+                relation = {
+                    "sourceAsset": {"id": source["id"], "name": source.get("name", "")},
+                    "targetAsset": {"id": self._by_name.get(name, {}).get("id"), "name": name},
+                    "relationType": relation_type,
+                }
+                kept.append(relation)
+                self.relations.append(relation)
+        self._relations_by_source[source["id"]] = kept
+
+    def _drop_replaced_relations(self):
+        """Remove relations replaced by PATCHes from the bulk list, once per request."""
+        with self._lock:
+            if self._replaced:
+                self.relations[:] = [r for r in self.relations if id(r) not in self._replaced]
+                self._replaced.clear()
+
+
+def route_name(parts: List[str]) -> str:
+    """Stats label for a path, with asset IDs collapsed: assets/{id}/quality-rules."""
+    if len(parts) >= 2 and parts[0] == "assets" and parts[1] not in ("search", "bulk"):
+        return "/".join(["assets", "{id}"] + parts[2:])
+    return "/".join(parts) or "/"
+
+
+def _make_handler(server: FakeCollibraServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PATCH(self):
+            self._handle("PATCH")
+
+        def _handle(self, method: str):
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+
+            if not url.path.startswith(API_PREFIX):
+                self._send(method, "unknown", 404, {"message": "Not found"})
+                return
+            parts = [unquote(p) for p in url.path[len(API_PREFIX):].split("/") if p]
+            route = route_name(parts)
+
+            fault, delay = server.faults.draw()
+            if delay:
+                time.sleep(delay)
+            if fault == 429:
+                headers = {}
+                if server.faults.retry_after is not None:
+                    headers["Retry-After"] = f"{server.faults.retry_after:g}"
+                self._send(method, route, 429, {"message": "Too Many Requests"}, headers)
+                return
+            if fault == 503:
+                self._send(method, route, 503, {"message": "Service Unavailable"})
+                return
+
+            try:
+                body = json.loads(raw) if raw else None
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                status, payload = server.route(method, parts, query, body)
+            except (ValueError, TypeError, KeyError) as e:
+                status, payload = 400, {"message": str(e)}
+            self._send(method, route, status, payload)
+
+        def _send(self, method: str, route: str, status: int, payload, headers: Optional[Dict[str, str]] = None):
+            server.count(method, route, status)
+            data = json.dumps(payload).encode("utf-8")
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client gave up (e.g. timed out during an injected hang)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run a fake Collibra REST server over a synthetic domain.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small", help="Synthetic domain preset")
+    parser.add_argument("--entities", type=int, help="Override the preset's table count")
+    parser.add_argument("--attributes", type=int, help="Override columns per table")
+    parser.add_argument("--sources", type=int, help="Override the source count")
+    parser.add_argument("--domain", default="Benchmark", help="Domain name to serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Probability of a 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on 429s")
+    parser.add_argument("--server-error", type=float, default=0.0, help="Probability of a 503")
+    parser.add_argument("--timeout", type=float, default=0.0, help="Probability of a hang")
+    parser.add_argument("--hang-seconds", type=float, default=35.0)
+    parser.add_argument("--max-page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Cap on the page limit")
+    args = parser.parse_args(argv)
+
+    entities, attributes, sources, _ = SIZES[args.size]
+    server = FakeCollibraServer.generate(
+        args.entities if args.entities is not None else entities,
+        args.attributes if args.attributes is not None else attributes,
+        args.sources if args.sources is not None else sources,
+        domain_name=args.domain,
+        max_page_size=args.max_page_size,
+        faults=FaultProfile(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            rate_limit=args.rate_limit,
+            retry_after=args.retry_after,
+            server_error=args.server_error,
+            timeout=args.timeout,
+            hang_seconds=args.hang_seconds,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving domain '{args.domain}' ({len(server.assets)} assets, {len(server.relations)} relations) "
+          f"at {server.base_url}/api/v1/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Benchmark Runner
+Times the core engines on a synthetic product and compares the results with a stored baseline.
+
+Usage:
+    python -m benchmarks.run --size medium
+    python -m benchmarks.run --size large --repeat 3 --output results.json
+    python -m benchmarks.run --size medium --save-baseline
+    python -m benchmarks.run --entities 200 --attributes 250 --sources 1000 --transformations 5000
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import SIZES, FakeCollibraClient, make_domain, make_product  # noqa: E402
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+TOLERANCE = 0.25      # slower than baseline by more than this fraction is a regression
+NOISE_FLOOR_MS = 1.0  # ...unless the absolute difference is below this
+
+
+def build_cases(product: Dict, domain: Tuple[List[Dict], List[Dict]]) -> List[Tuple[str, Callable[[], object]]]:
+    """
+    Name every timed operation and bind it to the synthetic inputs.
+
+    Generators share one pre-built model, as on the Review & Export page,
+    so each generator timing covers its own output only.
+    """
+    from core.collibra_generator import CollibraGenerator
+    from core.collibra_importer import CollibraImporter
+    from core.dbt_generator import DbtGenerator
+    from core.document_engine import DocumentEngine
+    from core.model_ir import build_model
+    from core.pii_classifier import PIIClassifier
+    from core.scoring_engine import ScoringEngine
+    from core.snowflake_generator import SnowflakeGenerator
+    from core.validation_engine import IncrementalValidationEngine, ValidationEngine
+
+    model = build_model(product)
+    sf = SnowflakeGenerator(product, model)
+    dbt = DbtGenerator(product, model)
+    collibra = CollibraGenerator(product, model)
+    doc = DocumentEngine(product, model)
+
+    incremental = IncrementalValidationEngine()
+    versions = {"business_context": 1}
+    incremental.validate(product, versions)
+
+    assets, relations = domain
+    client = FakeCollibraClient(assets, relations)
+    importer = CollibraImporter(client, dialect="")
+
+    return [
+        ("model_ir.build_model", lambda: build_model(product)),
+        ("validation.validate", lambda: ValidationEngine(product).validate()),
+        ("validation.incremental_unchanged", lambda: incremental.validate(product, versions)),
+        ("scoring.overall_score", lambda: ScoringEngine(product).overall_score()),
+        ("pii.scan", lambda: PIIClassifier().scan(product["entities"])),
+        ("snowflake.generate_ddl", sf.generate_ddl),
+        ("snowflake.generate_masking_policies", sf.generate_masking_policies),
+        ("snowflake.generate_secure_views", sf.generate_secure_views),
+        ("snowflake.generate_grants", sf.generate_grants),
+        ("snowflake.generate_all", sf.generate_all),
+        ("snowflake.write_all", lambda: sf.write_all(io.StringIO())),
+        ("dbt.generate_schema_yaml", dbt.generate_schema_yaml),
+        ("dbt.generate_all_models", dbt.generate_all_models),
+        ("collibra.generate_asset_import", collibra.generate_asset_import),
+        ("collibra.to_json", collibra.to_json),
+        ("collibra.write_json", lambda: collibra.write_json(io.StringIO())),
+        ("document.generate_markdown", doc.generate_markdown),
+        ("importer.import_data_model", lambda: importer.import_data_model("Benchmark")),
+        ("importer.import_all", lambda: importer.import_all("Benchmark")),
+    ]
+
+
+def time_case(func: Callable[[], object], repeat: int) -> Dict:
+    """Run func repeat times; the first run is reported separately (cold caches)."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    warm = timings[1:] or timings
+    return {
+        "first_ms": round(timings[0], 3),
+        "median_ms": round(statistics.median(warm), 3),
+        "min_ms": round(min(warm), 3),
+        "runs": repeat,
+    }
+
+
+def run(
+    entities: int,
+    attributes: int,
+    sources: int,
+    transformations: int,
+    repeat: int = 5,
+    only: Optional[List[str]] = None,
+    size: str = "custom",
+) -> Dict:
+    """
+    Run every benchmark case against a synthetic product of the given size.
+
+    Args:
+        entities: Number of entities (and Collibra tables)
+        attributes: Attributes per entity
+        sources: Number of data sources
+        transformations: Number of transformation steps
+        repeat: Runs per case
+        only: Case-name prefixes to run (default all)
+        size: Preset name recorded in the results
+
+    Returns:
+        Results document: parameters, environment and per-case timings
+    """
+    product = make_product(entities, attributes, sources, transformations)
+    domain = make_domain(entities, attributes, sources)
+
+    results = {}
+    for name, func in build_cases(product, domain):
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        results[name] = time_case(func, repeat)
+        print(f"  {name:<38} {results[name]['median_ms']:>11.2f} ms", flush=True)
+
+    return {
+        "size": size,
+        "params": {
+            "entities": entities,
+            "attributes_per_entity": attributes,
+            "attributes": entities * attributes,
+            "sources": sources,
+            "transformations": transformations,
+            "repeat": repeat,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = TOLERANCE,
+            noise_floor_ms: float = NOISE_FLOOR_MS) -> List[Dict]:
+    """
+    Compare median timings with a baseline run.
+
+    Args:
+        current: Results document from run()
+        baseline: Results document stored earlier
+        tolerance: Allowed slowdown as a fraction of the baseline median
+        noise_floor_ms: Differences smaller than this are never regressions
+
+    Returns:
+        One row per case present in both: name, baseline/current medians, change, status
+    """
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        base_ms, now_ms = before["median_ms"], result["median_ms"]
+        change = (now_ms - base_ms) / base_ms if base_ms else 0.0
+        if change > tolerance and now_ms - base_ms > noise_floor_ms:
+            status = "regression"
+        elif change < -tolerance and base_ms - now_ms > noise_floor_ms:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name,
+            "baseline_ms": base_ms,
+            "current_ms": now_ms,
+            "change": round(change, 4),
+            "status": status,
+        })
+    return rows
+
+
+def _baseline_path(size: str) -> str:
+    return os.path.join(BASELINE_DIR, f"{size}.json")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Data Product Steward core engines.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium", help="Synthetic product preset")
+    parser.add_argument("--entities", type=int, help="Override the preset's entity count")
+    parser.add_argument("--attributes", type=int, help="Override attributes per entity")
+    parser.add_argument("--sources", type=int, help="Override the source count")
+    parser.add_argument("--transformations", type=int, help="Override the transformation count")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (first run reported as cold)")
+    parser.add_argument("--only", nargs="*", help="Run only cases whose names start with these prefixes")
+    parser.add_argument("--output", help="Write the results JSON here")
+    parser.add_argument("--baseline", help="Baseline JSON to compare with (default baselines/<size>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the size's baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown fraction")
+    args = parser.parse_args(argv)
+
+    entities, attributes, sources, transformations = SIZES[args.size]
+    overridden = any(v is not None for v in (args.entities, args.attributes, args.sources, args.transformations))
+    size = "custom" if overridden else args.size
+    entities = args.entities if args.entities is not None else entities
+    attributes = args.attributes if args.attributes is not None else attributes
+    sources = args.sources if args.sources is not None else sources
+    transformations = args.transformations if args.transformations is not None else transformations
+
+    print(f"Benchmark '{size}': {entities} entities x {attributes} attributes, "
+          f"{sources} sources, {transformations} transformations")
+    current = run(entities, attributes, sources, transformations, max(args.repeat, 1), args.only, size)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        if size == "custom":
+            parser.error("--save-baseline needs a preset size (no count overrides)")
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(_baseline_path(size), "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline saved to {_baseline_path(size)}")
+        return 0
+
+    baseline_path = args.baseline or _baseline_path(size)
+    if not os.path.exists(baseline_path):
+        print("No baseline to compare with.")
+        return 0
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("params", {}).get("attributes") != current["params"]["attributes"]:
+        print(f"Warning: baseline {baseline_path} was recorded at a different size.")
+
+    rows = compare(current, baseline, args.tolerance)
+    print(f"\nCompared with {baseline_path} (tolerance {args.tolerance:.0%}):")
+    for row in rows:
+        print(f"  {row['name']:<38} {row['baseline_ms']:>11.2f} -> {row['current_ms']:>11.2f} ms "
+              f"{row['change']:>+8.1%}  {row['status']}")
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s).")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Synthetic Data
+Deterministic products and Collibra domains of configurable size, for benchmarking.
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# name: (entities, attributes per entity, sources, transformations)
+SIZES = {
+    "small": (10, 10, 10, 20),
+    "medium": (100, 50, 200, 1000),
+    "large": (500, 100, 1000, 5000),
+}
+
+_COLUMN_STEMS = [
+    "ID", "NAME", "CODE", "STATUS", "AMOUNT", "CURRENCY", "TRADE_DATE", "SETTLE_DATE",
+    "QUANTITY", "PRICE", "CREATED_AT", "UPDATED_AT", "IS_ACTIVE", "REGION", "DESK",
+    "EMAIL", "PHONE_NUMBER", "DATE_OF_BIRTH", "HOME_ADDRESS", "NATIONAL_INSURANCE_NUMBER",
+    "IP_ADDRESS_COUNT", "FIRST_NAME", "LAST_NAME", "ACCOUNT_NUMBER",
+]
+_PII_STEMS = {
+    "EMAIL", "PHONE_NUMBER", "DATE_OF_BIRTH", "HOME_ADDRESS",
+    "NATIONAL_INSURANCE_NUMBER", "FIRST_NAME", "LAST_NAME",
+}
+_DATA_TYPES = [
+    "STRING", "NUMBER", "FLOAT", "BOOLEAN", "DATE", "TIMESTAMP",
+    "VARCHAR(255)", "NUMERIC(18,2)", "CHAR(3)", "BIGINT", "DATETIME2", "TEXT",
+]
+_SOURCE_TYPES = ["Database", "API", "File", "Stream"]
+_TRANSFORM_TYPES = ["Filter", "Join", "Aggregate", "Derive", "Deduplicate"]
+
+
+def _columns(count: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """(column name, stem) pairs; stems repeat with numeric suffixes, as in real wide tables."""
+    columns = []
+    for i in range(count):
+        stem = _COLUMN_STEMS[i % len(_COLUMN_STEMS)]
+        suffix = i // len(_COLUMN_STEMS)
+        columns.append((f"{stem}_{suffix}" if suffix else stem, stem))
+    rng.shuffle(columns)
+    return columns
+
+
+def make_product(
+    entities: int,
+    attributes: int,
+    sources: int,
+    transformations: int,
+    seed: int = 0,
+) -> Dict:
+    """
+    Build a fully populated data product.
+
+    Args:
+        entities: Number of entities
+        attributes: Attributes per entity
+        sources: Number of data sources
+        transformations: Number of transformation steps
+        seed: Random seed; equal arguments always give an equal product
+
+    Returns:
+        Product dict in session-state format
+    """
+    rng = random.Random(seed)
+    entity_list = []
+    attribute_rules = []
+    for e in range(entities):
+        entity_name = f"ENTITY_{e:05d}"
+        attrs = []
+        for name, stem in _columns(attributes, rng):
+            attrs.append({
+                "name": name,
+                "data_type": rng.choice(_DATA_TYPES),
+                "nullable": rng.random() < 0.7,
+                "pii": stem in _PII_STEMS,
+                "description": f"{stem.replace('_', ' ').title()} of the {entity_name.lower()} record"
+                if rng.random() < 0.8 else "",
+            })
+        entity_list.append({"name": entity_name, "attributes": attrs})
+        if attrs:
+            attribute_rules.append({
+                "attribute": f"{entity_name}.{attrs[0]['name']}",
+                "completeness": 100,
+                "uniqueness": 100,
+                "is_primary_key": True,
+                "is_foreign_key": False,
+            })
+
+    source_list = [
+        {
+            "name": f"SOURCE_{s:05d}",
+            "type": rng.choice(_SOURCE_TYPES),
+            "owner": f"owner{s % 17}@example.com",
+            "frequency": rng.choice(["Daily", "Hourly", "Real-time"]),
+            "volume": rng.choice(["Low", "Medium", "High"]),
+            "structure": "Structured",
+            "sla_required": rng.random() < 0.5,
+            "criticality": rng.choice(["Low", "Medium", "High"]),
+        }
+        for s in range(sources)
+    ]
+
+    transformation_list = [
+        {
+            "name": f"STEP_{t:05d}",
+            "type": rng.choice(_TRANSFORM_TYPES),
+            "source_entity": f"ENTITY_{rng.randrange(max(entities, 1)):05d}",
+            "target_entity": f"ENTITY_{rng.randrange(max(entities, 1)):05d}",
+            "logic": "SELECT * FROM source WHERE is_active",
+            "description": "" if t % 5 == 0 else f"Step {t}",
+        }
+        for t in range(transformations)
+    ]
+
+    return {
+        "name": "Synthetic Benchmark Product",
+        "domain": "Asset Management",
+        "objective": "Benchmark the core engines",
+        "regulatory_scope": ["GDPR", "FCA"],
+        "geo_scope": "UK",
+        "consumers": "Risk, Finance",
+        "sources": source_list,
+        "entities": entity_list,
+        "classification": "Restricted",
+        "pii": True,
+        "retention_policy": "7 Years",
+        "compliance_frameworks": ["GDPR"],
+        "access_roles": "ANALYST, DATA_ENGINEER, DATA_OWNER",
+        "lineage_notes": "",
+        "attribute_rules": attribute_rules,
+        "quality_rules": {"global_completeness": 95, "attribute_rules": attribute_rules},
+        "transformations": transformation_list,
+    }
+
+
+def make_domain(
+    entities: int,
+    attributes: int,
+    sources: int,
+    seed: int = 0,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Build the assets and "is part of" relations of a Collibra domain.
+
+    Args:
+        entities: Number of table assets
+        attributes: Column assets per table
+        sources: Number of data source assets
+        seed: Random seed
+
+    Returns:
+        (assets, relations) in Collibra REST format
+    """
+    rng = random.Random(seed)
+    assets, relations = [], []
+    modified = 1_700_000_000_000
+    for e in range(entities):
+        entity_id = f"ent-{e}"
+        entity_name = f"entity_{e:05d}"
+        assets.append({
+            "id": entity_id,
+            "name": entity_name,
+            "type": {"name": "Table"},
+            "description": f"Table {e}",
+            "lastModifiedOn": modified + e,
+            "attributes": {"Classification": [{"value": "Confidential"}]} if e % 50 == 0 else {},
+        })
+        for name, stem in _columns(attributes, rng):
+            attr_id = f"{entity_id}-{name}"
+            assets.append({
+                "id": attr_id,
+                "name": name.lower(),
+                "type": {"name": "Column"},
+                "description": f"{stem.title()} column" if rng.random() < 0.6 else "",
+                "lastModifiedOn": modified + e,
+                "attributes": {
+                    "Technical Data Type": [{"value": rng.choice(_DATA_TYPES)}],
+                    "Nullable": [{"value": str(rng.random() < 0.7).lower()}],
+                },
+            })
+            relations.append({
+                "sourceAsset": {"id": attr_id},
+                "targetAsset": {"id": entity_id, "name": entity_name},
+                "relationType": "is part of",
+            })
+    for s in range(sources):
+        assets.append({
+            "id": f"src-{s}",
+            "name": f"source_{s:05d}",
+            "type": {"name": rng.choice(["Database", "API", "System"])},
+            "description": "",
+            "lastModifiedOn": modified,
+            "attributes": {"Compliance": [{"value": "GDPR"}]} if s % 100 == 0 else {},
+        })
+    return assets, relations
+
+
+class FakeCollibraClient:
+    """In-memory stand-in for CollibraClient, serving a synthetic domain with no I/O.
+
+    Implements just the calls CollibraImporter makes, so import timings
+    measure conversion work rather than the network.
+    """
+
+    def __init__(self, assets: List[Dict], relations: List[Dict], rules_every: int = 10):
+        """
+        Args:
+            assets: Domain assets
+            relations: "is part of" relations
+            rules_every: Every Nth asset has one quality rule (0 for none)
+        """
+        self.assets = assets
+        self.relations = relations
+        self.rules_every = rules_every
+        self._relations_by_source = {}
+        for relation in relations:
+            self._relations_by_source.setdefault(relation["sourceAsset"]["id"], []).append(relation)
+        self._index = {asset["id"]: i for i, asset in enumerate(assets)}
+
+    def iter_domain_assets(self, domain_name: str, page_size: Optional[int] = None, prefetch: bool = False,
+                           use_cache: bool = True, modified_since: Optional[int] = None) -> Iterator[Dict]:
+        for asset in self.assets:
+            if modified_since is None or asset.get("lastModifiedOn", 0) >= modified_since:
+                yield asset
+
+    def iter_relations(self, relation_type: Optional[str] = None, domain_name: Optional[str] = None,
+                       page_size: Optional[int] = None, prefetch: bool = False,
+                       use_cache: bool = True) -> Iterator[Dict]:
+        return iter(self.relations)
+
+    def get_asset_relations(self, asset_id: str, use_cache: bool = True) -> List[Dict]:
+        return self._relations_by_source.get(asset_id, [])
+
+    def get_data_quality_rules(self, asset_id: str, use_cache: bool = True, raise_errors: bool = False,
+                               retry_rate_limits: bool = True) -> List[Dict]:
+        if not self.rules_every or self._index.get(asset_id, 1) % self.rules_every:
+            return []
+        return [{"id": f"rule-{asset_id}", "name": "NOT_NULL", "type": "completeness",
+                 "definition": "value IS NOT NULL", "threshold": 99}]
@@ -1,2 +1,2 @@
-# Components package — layout, sidebar, helpers, canvas.
-__all__ = ["layout", "sidebar", "helpers", "canvas"]
+# Components package — layout, sidebar, helpers, canvas, debug panel.
+__all__ = ["layout", "sidebar", "helpers", "canvas", "debug_panel"]
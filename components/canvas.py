@@ -6,6 +6,8 @@ Populated with every detail the user enters across all wizard steps.
 import json
 import streamlit as st
 
+from core.profiler import profiled
+
 
 def _section(title: str):
     """Render a canvas section header."""
@@ -36,6 +38,7 @@ def _empty_hint(text: str):
     )
 
 
+@profiled("render_canvas")
 def render_canvas():
     """Render the live canvas — glass panel populated with user data."""
     product = st.session_state.product
@@ -0,0 +1,47 @@
+"""
+Debug Panel — timing waterfall of the current page render.
+Shown at the bottom of every page while "Enable debug logging" is on (Settings).
+"""
+
+import html
+
+import streamlit as st
+
+from core.profiler import current_profile
+
+MAX_ROWS = 200
+
+
+def render_debug_panel():
+    """Render the current rerun's spans as a waterfall, plus per-call totals."""
+    if not st.session_state.get("debug"):
+        return
+
+    profile = current_profile()
+    st.divider()
+    with st.expander("Render profile (debug)", expanded=False):
+        if profile is None:
+            st.caption("Profiling starts on the next rerun.")
+            return
+
+        total = profile.elapsed
+        spans = profile.ordered()
+        st.caption(
+            f"{total * 1000:.1f} ms to this point · {len(spans)} spans"
+            + (f" (first {MAX_ROWS} shown)" if len(spans) > MAX_ROWS else "")
+        )
+
+        rows = []
+        for s in spans[:MAX_ROWS]:
+            left = s.start / total * 100 if total else 0
+            width = s.duration / total * 100 if total else 0
+            rows.append(
+                f'<div class="prof-row">'
+                f'<span class="prof-label" style="padding-left:{s.depth}rem">{html.escape(s.name)}</span>'
+                f'<span class="prof-track"><span class="prof-bar" style="left:{left:.2f}%;width:{width:.2f}%"></span></span>'
+                f'<span class="prof-ms">{s.duration * 1000:.1f} ms</span>'
+                f"</div>"
+            )
+        st.markdown("".join(rows), unsafe_allow_html=True)
+
+        st.dataframe(profile.totals(), use_container_width=True, hide_index=True)
@@ -6,6 +6,7 @@ Written for someone with zero data engineering experience.
 
 import streamlit as st
 from state_manager import get_progress, get_next_step
+from core.profiler import profiled
 
 # ── Page file paths for navigation ─────────────────────────────────────
 PAGE_MAP = {
@@ -49,6 +50,7 @@ def render_step_complete(current_step: int, is_complete: bool):
         st.page_link("streamlit_app.py", label="Back to Wizard Agent")
 
 
+@profiled("render_step_nav")
 def render_step_nav(current_step: int):
     """Render step indicator bar at top of page."""
     product = st.session_state.product
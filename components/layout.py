@@ -3,8 +3,13 @@ Theme — Collibra-aligned corporate design with white background.
 Primary colors: Collibra Navy (#003D82), Teal (#00A0E9), and Green (#00B050).
 """
 
+import re
+from functools import lru_cache
+
 import streamlit as st
 
+from core.profiler import profiled
+
 # ── Collibra Brand Colors ────────────────────────────────────────
 COLLIBRA_COLORS = {
     "navy": "#003D82",        # Primary brand color
@@ -87,29 +92,47 @@ _DATA_BOT_SVG_RAW = """
 """
 
 
-def _apply_theme(raw: str) -> str:
-    """Apply Collibra theme colors."""
-    # Swap teal/orange to Collibra navy/blue
-    raw = raw.replace("#2DD4BF", COLLIBRA_COLORS["light_blue"])  # teal → light blue
-    raw = raw.replace("#22D3EE", COLLIBRA_COLORS["blue"])        # cyan → blue
-    raw = raw.replace("#5EEAD4", COLLIBRA_COLORS["light_blue"])  # lt teal → light blue
-    raw = raw.replace("#F97316", COLLIBRA_COLORS["navy"])        # orange → navy
-    raw = raw.replace("#FB923C", COLLIBRA_COLORS["blue"])        # lt orange → blue
-    raw = raw.replace("45,212,191", "0,102,204")                 # teal rgb → blue rgb
-    raw = raw.replace("249,115,22", "0,61,130")                  # orange rgb → navy rgb
-    return raw
+# Source palette (teal/orange) → Collibra navy/blue, applied in one pass
+_THEME_SWAPS = {
+    "#2DD4BF": COLLIBRA_COLORS["light_blue"],  # teal → light blue
+    "#22D3EE": COLLIBRA_COLORS["blue"],        # cyan → blue
+    "#5EEAD4": COLLIBRA_COLORS["light_blue"],  # lt teal → light blue
+    "#F97316": COLLIBRA_COLORS["navy"],        # orange → navy
+    "#FB923C": COLLIBRA_COLORS["blue"],        # lt orange → blue
+    "45,212,191": "0,102,204",                 # teal rgb → blue rgb
+    "249,115,22": "0,61,130",                  # orange rgb → navy rgb
+}
+
+# Theme key → colour swaps; add a palette here to offer another theme
+_THEMES = {
+    "collibra": _THEME_SWAPS,
+}
+
+
+@lru_cache(maxsize=None)
+def _theme_pattern(theme: str) -> "re.Pattern":
+    return re.compile("|".join(re.escape(colour) for colour in _THEMES[theme]))
+
 
+def _apply_theme(raw: str, theme: str = "collibra") -> str:
+    """Apply the theme's colors (Collibra by default)."""
+    swaps = _THEMES[theme]
+    return _theme_pattern(theme).sub(lambda m: swaps[m.group(0)], raw)
 
-def get_bot_svg() -> str:
+
+@lru_cache(maxsize=None)
+def get_bot_svg(theme: str = "collibra") -> str:
     """Return the bot SVG with theme-appropriate colours."""
-    return _apply_theme(_DATA_BOT_SVG_RAW)
+    return _apply_theme(_DATA_BOT_SVG_RAW, theme)
 
 
 # Keep backward-compat import name — points to terminal version
 DATA_BOT_SVG = _DATA_BOT_SVG_RAW
 
 
-def _css() -> str:
+@lru_cache(maxsize=None)
+def _css(theme: str = "collibra") -> str:
+    """Themed stylesheet wrapped in <style>, built once per theme."""
     return _apply_theme("""
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Roboto+Mono:wght@400;500&display=swap');
@@ -1488,16 +1511,53 @@ def _css() -> str:
         background: rgba(45,212,191,0.08);
         border-color: #2DD4BF;
     }
+
+    /* ═══════════════════════════════════════════════════
+       DEBUG — render profile waterfall
+       ═══════════════════════════════════════════════════ */
+    .prof-row {
+        display: flex;
+        align-items: center;
+        font-family: 'Roboto Mono', monospace !important;
+        font-size: 0.75rem;
+        line-height: 1.4rem;
+    }
+    .prof-label {
+        flex: 0 0 16rem;
+        overflow: hidden;
+        white-space: nowrap;
+        text-overflow: ellipsis;
+    }
+    .prof-track {
+        flex: 1;
+        position: relative;
+        height: 0.8rem;
+        background: rgba(45,212,191,0.04);
+    }
+    .prof-bar {
+        position: absolute;
+        top: 0;
+        height: 100%;
+        min-width: 2px;
+        background: #2DD4BF;
+        border-radius: 2px;
+    }
+    .prof-ms {
+        flex: 0 0 5rem;
+        text-align: right;
+    }
 </style>
-""")
+""", theme)
 
 
+@profiled("inject_custom_css")
 def inject_custom_css():
     """Inject theme CSS with active palette applied."""
+    theme = _get_theme()
     # Re-point the compat alias so callers that read DATA_BOT_SVG get themed version
     global DATA_BOT_SVG
-    DATA_BOT_SVG = get_bot_svg()
-    st.markdown(_css(), unsafe_allow_html=True)
+    DATA_BOT_SVG = get_bot_svg(theme)
+    st.markdown(_css(theme), unsafe_allow_html=True)
 
 
 def step_header(step_num: int, title: str, subtitle: str):
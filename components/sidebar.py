@@ -5,6 +5,7 @@ Aligned with Collibra brand colors and design.
 
 import streamlit as st
 from state_manager import get_progress, get_next_step
+from core.profiler import profiled
 from components.helpers import STEP_GUIDES, PAGE_MAP, STEP_NAMES
 
 
@@ -73,6 +74,7 @@ GLOSSARY = {
 }
 
 
+@profiled("render_sidebar")
 def render_sidebar(step: int = None):
     """Render sidebar with progress, page tree, and glossary."""
     product = st.session_state.product
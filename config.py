@@ -21,6 +21,20 @@ STEPS = [
     {"key": "review_export", "label": "Review & Export", "page": 7},
 ]
 
+# Product keys owned by each workflow section (keys match STEPS)
+PRODUCT_SECTIONS = {
+    "business_context": ["name", "domain", "objective", "regulatory_scope", "geo_scope", "consumers"],
+    "data_sources": ["sources"],
+    "data_model": ["entities"],
+    "governance_security": [
+        "classification", "pii", "retention_policy", "compliance_frameworks", "access_roles", "lineage_notes",
+    ],
+    "data_quality": ["quality_rules"],
+    "transformations": ["transformations"],
+}
+
+DATA_TYPE_OPTIONS = ["STRING", "NUMBER", "FLOAT", "BOOLEAN", "DATE", "TIMESTAMP"]
+
 CLASSIFICATION_OPTIONS = ["Public", "Internal", "Confidential", "Restricted"]
 
 RETENTION_OPTIONS = ["30 Days", "90 Days", "1 Year", "3 Years", "7 Years", "Indefinite"]
@@ -41,6 +55,48 @@ SCORING_WEIGHTS = {
     "transformations": 0.15,
 }
 
+# PII keywords per regulation: phrase (space-separated column-name words) -> confidence
+PII_KEYWORDS = {
+    "GDPR": {
+        "first name": 0.9, "firstname": 0.9, "last name": 0.9, "lastname": 0.9,
+        "surname": 0.9, "forename": 0.9, "full name": 0.9, "given name": 0.9,
+        "email": 0.95, "email address": 0.95, "phone": 0.9, "telephone": 0.9, "mobile": 0.7,
+        "address": 0.7, "street": 0.7, "postcode": 0.8, "postal code": 0.8, "zip code": 0.7,
+        "date of birth": 0.95, "dob": 0.9, "birth date": 0.95, "birthdate": 0.95,
+        "passport": 0.9, "national id": 0.9, "nationality": 0.7, "gender": 0.6,
+        "ip address": 0.8, "device id": 0.6, "ethnicity": 0.9, "religion": 0.9,
+        "health": 0.6, "biometric": 0.9,
+    },
+    "CCPA": {
+        "ssn": 0.99, "social security": 0.99, "driver license": 0.9, "drivers license": 0.9,
+        "credit card": 0.95, "card number": 0.9, "bank account": 0.85,
+        "email": 0.95, "phone": 0.9, "address": 0.7, "geolocation": 0.8,
+        "latitude": 0.6, "longitude": 0.6, "password": 0.9, "username": 0.6,
+    },
+    "FCA": {
+        "national insurance": 0.95, "ni number": 0.9, "nino": 0.9,
+        "sort code": 0.9, "account number": 0.85, "iban": 0.9, "tax id": 0.9, "utr": 0.8,
+        "customer name": 0.8, "client name": 0.8, "investor name": 0.8,
+        "salary": 0.7, "income": 0.6, "net worth": 0.7,
+    },
+}
+
+PII_CONFIG = {
+    "threshold": 0.5,  # confidence at or above which a column is flagged
+    "description_weight": 0.6,  # keywords found only in the description count for less
+    # Words describing data *about* a PII field rather than the field itself (ip_address_count)
+    "qualifiers": [
+        "count", "cnt", "total", "flag", "ind", "indicator", "is", "has", "type",
+        "format", "status", "valid", "verified", "pct", "ratio", "len", "length",
+    ],
+    "qualifier_weight": 0.3,
+}
+
+# Firm-specific validation rules (YAML) added to the built-in rule set
+VALIDATION_CONFIG = {
+    "rules_path": os.getenv("VALIDATION_RULES_PATH", "validation_rules.yaml"),
+}
+
 # ── API Configuration ────────────────────────────────────────────────────
 
 # OpenAI API settings
@@ -60,11 +116,33 @@ COLLIBRA_CONFIG = {
     "timeout": 30,
     "max_retries": 3,
     "verify_ssl": True,
+    "page_size": 1000,  # assets/relations requested per page when iterating
+    "max_workers": 8,  # concurrent requests for per-asset fan-out
+    "max_concurrency": 100,  # in-flight request limit for AsyncCollibraClient
+    "bulk_batch_size": 500,  # assets per bulk create/update request
+    # Source system for imported column types: oracle, sqlserver, mysql, postgres, bigquery
+    "source_dialect": os.getenv("COLLIBRA_SOURCE_DIALECT", ""),
+}
+
+# Retry & circuit breaker settings shared by the OpenAI and Collibra clients
+RETRY_CONFIG = {
+    "base_delay": 1.0,  # seconds; backoff ceiling doubles per attempt, actual delay is jittered
+    "max_delay": 30.0,  # caps the computed backoff; a server's Retry-After is waited in full
+    "max_elapsed": 60.0,  # give up once retries would exceed this many seconds in total
+    "retry_statuses": [429, 500, 502, 503, 504],
+    "breaker_failure_threshold": 5,  # consecutive outage failures before calls fail fast
+    "breaker_reset_seconds": 30,
 }
 
 # Caching settings for Collibra data
 CACHE_CONFIG = {
+    "enabled": True,
+    "backend": os.getenv("COLLIBRA_CACHE_BACKEND", "memory"),  # "memory" or "sqlite"
+    "path": os.getenv("COLLIBRA_CACHE_PATH", ".cache/collibra.sqlite"),
     "ttl_seconds": 3600,  # 1 hour cache
     "max_size_mb": 100,
+    # Local metadata store of imported domains (shared across sessions)
+    "metadata_path": os.getenv("COLLIBRA_METADATA_PATH", ".cache/metadata.sqlite"),
+    "metadata_max_age_seconds": 86400,  # stored domains older than this are re-synced on import
 }
 
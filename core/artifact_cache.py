@@ -0,0 +1,57 @@
+"""
+Artifact Cache
+Reuses generated DDL, YAML, JSON and Markdown while the product definition is unchanged.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable
+
+from .collibra_cache import CacheStats
+
+
+class ArtifactCache:
+    """Generated artifacts grouped by product fingerprint, least recently used dropped first.
+
+    Keeping a few fingerprints means undoing an edit (or flipping between two
+    versions) reuses the earlier output instead of regenerating it.
+    """
+
+    def __init__(self, max_products: int = 4):
+        self.max_products = max_products
+        self.stats = CacheStats()
+        self._products = OrderedDict()  # fingerprint -> {artifact name: value}
+
+    def __len__(self) -> int:
+        return sum(len(artifacts) for artifacts in self._products.values())
+
+    def get(self, fingerprint: str, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Return a cached artifact, building and storing it on a miss.
+
+        Args:
+            fingerprint: Content hash of the product the artifact is built from
+            name: Artifact name, e.g. "ddl" or "schema_yaml"
+            build: Zero-argument callable that generates the artifact
+
+        Returns:
+            The artifact
+        """
+        artifacts = self._products.get(fingerprint)
+        if artifacts is None:
+            artifacts = self._products[fingerprint] = {}
+            while len(self._products) > self.max_products:
+                _, dropped = self._products.popitem(last=False)
+                self.stats.evictions += len(dropped)
+        else:
+            self._products.move_to_end(fingerprint)
+
+        if name in artifacts:
+            self.stats.hits += 1
+            return artifacts[name]
+
+        self.stats.misses += 1
+        artifacts[name] = build()
+        return artifacts[name]
+
+    def clear(self):
+        self._products.clear()
@@ -0,0 +1,263 @@
+"""
+Asset Index
+In-process inverted index over a domain snapshot for instant, ranked asset search.
+"""
+
+import heapq
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .domain_snapshot import DomainSnapshot, _modified_on
+from .metadata_store import MetadataStore
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Prefixes longer than this fall back to scanning the (short) posting list
+MAX_PREFIX = 12
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens; snake_case and spaced names split alike."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _version(asset: Dict) -> Tuple:
+    """Timestamp plus the indexed fields, so edits re-index even without lastModifiedOn."""
+    return (
+        _modified_on(asset),
+        asset.get("name", ""),
+        asset.get("description", ""),
+        asset.get("type", {}).get("name", ""),
+    )
+
+
+class AssetIndex:
+    """Token and prefix index over asset names and descriptions.
+
+    Names are indexed whole, by every prefix of the full name and by every
+    prefix of each name token (up to MAX_PREFIX characters), so a partially
+    typed word is a single dictionary lookup. Description tokens are indexed
+    whole. All query tokens must match; the last one may be a prefix.
+
+    Results are ranked in tiers, best first:
+
+    1. Full name equals the query
+    2. Full name starts with the query
+    3. Every query word is a whole word of the name
+    4. Every query word matches the start of a name word
+    5. Remaining matches (via the description)
+
+    Within a tier, names with fewer words come first, then alphabetical.
+    Tiers are plain set operations; only the tier that crosses the result
+    limit is sorted.
+    """
+
+    def __init__(self, snapshot: Optional[DomainSnapshot] = None):
+        self.domain_name = snapshot.domain_name if snapshot else ""
+        self.fetched_at = None
+        self._assets: Dict[str, Dict] = {}
+        self._versions: Dict[str, Tuple] = {}
+        self._terms: Dict[str, Tuple[str, Set[str], Set[str]]] = {}  # id -> (name, name tokens, description tokens)
+        self._order: Dict[str, Tuple[int, str]] = {}  # id -> in-tier sort key
+        self._types: Dict[str, Set[str]] = defaultdict(set)
+        self._names: Dict[str, Set[str]] = defaultdict(set)
+        self._name_starts: Dict[str, Set[str]] = defaultdict(set)
+        self._name_tokens: Dict[str, Set[str]] = defaultdict(set)
+        self._name_prefixes: Dict[str, Set[str]] = defaultdict(set)
+        self._description_tokens: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        if snapshot is not None:
+            self.update(snapshot)
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    # ── Maintenance ──────────────────────────────────────────────────
+
+    def update(self, snapshot: DomainSnapshot) -> Dict[str, int]:
+        """
+        Bring the index in line with a snapshot, re-indexing only what changed.
+
+        Args:
+            snapshot: Current snapshot of the indexed domain
+
+        Returns:
+            Counts of added, updated and removed assets
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            seen = set()
+            for asset in snapshot:
+                asset_id = asset.get("id", "")
+                seen.add(asset_id)
+                version = _version(asset)
+                if asset_id not in self._assets:
+                    counts["added"] += 1
+                elif self._versions[asset_id] != version:
+                    self._remove(asset_id)
+                    counts["updated"] += 1
+                else:
+                    continue
+                self._add(asset_id, asset, version)
+
+            for asset_id in [i for i in self._assets if i not in seen]:
+                self._remove(asset_id)
+                counts["removed"] += 1
+
+            self.domain_name = snapshot.domain_name
+            self.fetched_at = snapshot.fetched_at
+        return counts
+
+    def _postings(self, asset_id: str):
+        """Yield (posting dict, key) pairs an asset is indexed under."""
+        name, name_tokens, description_tokens = self._terms[asset_id]
+        yield self._types, self._assets[asset_id].get("type", {}).get("name", "")
+        yield self._names, name
+        for end in range(1, min(len(name), MAX_PREFIX) + 1):
+            yield self._name_starts, name[:end]
+        for token in name_tokens:
+            yield self._name_tokens, token
+            for end in range(1, min(len(token), MAX_PREFIX) + 1):
+                yield self._name_prefixes, token[:end]
+        for token in description_tokens:
+            yield self._description_tokens, token
+
+    def _add(self, asset_id: str, asset: Dict, version: Tuple):
+        words = tokenize(asset.get("name", ""))
+        name = " ".join(words)
+        self._assets[asset_id] = asset
+        self._versions[asset_id] = version
+        self._terms[asset_id] = (name, set(words), set(tokenize(asset.get("description", ""))))
+        self._order[asset_id] = (len(words), name)
+        for postings, key in self._postings(asset_id):
+            postings[key].add(asset_id)
+
+    def _remove(self, asset_id: str):
+        for postings, key in self._postings(asset_id):
+            ids = postings.get(key)
+            if ids is not None:
+                ids.discard(asset_id)
+                if not ids:
+                    del postings[key]
+        del self._assets[asset_id]
+        del self._versions[asset_id]
+        del self._terms[asset_id]
+        del self._order[asset_id]
+
+    # ── Search ───────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 20, asset_types: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Rank assets matching a (possibly partial) query.
+
+        Args:
+            query: Free text; the last word may be incomplete
+            limit: Max results
+            asset_types: Restrict to these asset type names
+
+        Returns:
+            Matching asset objects, best match first
+        """
+        tokens = tokenize(query)
+        if not tokens or limit <= 0:
+            return []
+        phrase = " ".join(tokens)
+        *complete, last = tokens
+
+        with self._lock:
+            type_sets = [self._types.get(t, set()) for t in asset_types or ()]
+            tiers = [
+                lambda: self._names.get(phrase, set()),
+                lambda: self._name_starting(phrase),
+                lambda: self._intersect([self._name_tokens.get(t, set()) for t in tokens]),
+                lambda: self._intersect(
+                    [self._name_tokens.get(t, set()) for t in complete] + [self._name_word_starts(last)]
+                ),
+                lambda: self._intersect(
+                    [self._word_matches(t, prefix=False) for t in complete] + [self._word_matches(last, prefix=True)]
+                ),
+            ]
+
+            results = []
+            seen = set()
+            for tier in tiers:
+                tier = tier() - seen
+                if asset_types:
+                    tier = set().union(*(tier & ids for ids in type_sets))
+                if not tier:
+                    continue
+                remaining = limit - len(results)
+                if len(tier) > remaining:
+                    ranked = heapq.nsmallest(remaining, tier, key=self._order.__getitem__)
+                else:
+                    ranked = sorted(tier, key=self._order.__getitem__)
+                results.extend(ranked)
+                if len(results) >= limit:
+                    break
+                seen |= tier
+            return [self._assets[asset_id] for asset_id in results]
+
+    @staticmethod
+    def _intersect(sets: List[Set[str]]) -> Set[str]:
+        sets = sorted(sets, key=len)
+        return sets[0].intersection(*sets[1:]) if sets[0] else set()
+
+    def _name_starting(self, phrase: str) -> Set[str]:
+        if len(phrase) <= MAX_PREFIX:
+            return self._name_starts.get(phrase, set())
+        return {i for i in self._name_starts.get(phrase[:MAX_PREFIX], ()) if self._terms[i][0].startswith(phrase)}
+
+    def _name_word_starts(self, token: str) -> Set[str]:
+        if len(token) <= MAX_PREFIX:
+            return self._name_prefixes.get(token, set())
+        return {
+            i for i in self._name_prefixes.get(token[:MAX_PREFIX], ())
+            if any(t.startswith(token) for t in self._terms[i][1])
+        }
+
+    def _word_matches(self, token: str, prefix: bool) -> Set[str]:
+        names = self._name_word_starts(token) if prefix else self._name_tokens.get(token, set())
+        return names | self._description_tokens.get(token, set())
+
+
+_indexes: Dict[Tuple[str, str], AssetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_domain_index(domain_name: str, store=None) -> Optional[AssetIndex]:
+    """
+    Return the process-wide index for a domain stored in the metadata store.
+
+    Indexes are kept per (store instance, domain), so equally named domains
+    on different Collibra instances never share one.
+
+    The index is rebuilt incrementally only when the store holds a newer sync
+    than the one last indexed, so repeated calls (one per keystroke) are cheap.
+
+    Args:
+        domain_name: Domain name
+        store: MetadataStore (defaults to a new store on the configured path)
+
+    Returns:
+        AssetIndex, or None if the domain has never been synced
+    """
+    if store is None:
+        store = MetadataStore()
+
+    info = store.domain_info(domain_name)
+    if info is None:
+        return None
+
+    with _indexes_lock:
+        key = (store.instance, domain_name)
+        index = _indexes.get(key)
+        if index is None or index.fetched_at != info["fetched_at"]:
+            snapshot = store.load(domain_name)
+            if index is None:
+                index = AssetIndex(snapshot)
+            else:
+                index.update(snapshot)
+            _indexes[key] = index
+        return index
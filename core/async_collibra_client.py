@@ -0,0 +1,568 @@
+"""
+Async Collibra API Client
+Non-blocking counterpart to CollibraClient on a pooled keep-alive HTTP connection.
+"""
+
+import asyncio
+import os
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from config import COLLIBRA_CONFIG
+from .collibra_cache import MISS, SHARED, cache_scope, make_cache_key, get_default_cache
+from .collibra_client import CollibraAPIError, CollibraClient
+from .profiler import profiled
+from .retry import IDEMPOTENT_METHODS, RetryPolicy, get_circuit_breaker, parse_retry_after
+
+
+class AsyncCollibraClient:
+    """Async wrapper around Collibra REST API with pooling, concurrency limits and retry.
+
+    Mirrors the CollibraClient method surface so imports and bulk publishes
+    can overlap hundreds of requests. Use as an async context manager, or
+    call close() when done.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache=SHARED,
+        cache_ttl: Optional[int] = None,
+        timeout: Optional[float] = None,
+        verify_ssl=None,
+        transport=None,
+    ):
+        """
+        Initialize async Collibra client.
+
+        Args:
+            base_url: Collibra instance URL (e.g. a local stub server in tests)
+            username: API username
+            password: API password
+            max_concurrency: In-flight request limit (defaults to COLLIBRA_CONFIG max_concurrency)
+            cache: Response cache backend; defaults to the shared process cache, None disables caching
+            cache_ttl: Seconds to keep this client's responses (defaults to the cache's TTL)
+            timeout: Request timeout in seconds (defaults to COLLIBRA_CONFIG timeout)
+            verify_ssl: TLS verification, True/False or a CA bundle path (defaults to COLLIBRA_CONFIG verify_ssl)
+            transport: Optional httpx transport, e.g. httpx.MockTransport for tests
+        """
+        if not httpx:
+            raise ImportError("httpx package not installed. Install with: pip install httpx")
+
+        self.base_url = base_url or COLLIBRA_CONFIG.get("base_url") or os.getenv("COLLIBRA_BASE_URL")
+        self.username = username or COLLIBRA_CONFIG.get("username") or os.getenv("COLLIBRA_USERNAME")
+        self.password = password or COLLIBRA_CONFIG.get("password") or os.getenv("COLLIBRA_PASSWORD")
+
+        if not self.base_url:
+            raise ValueError("COLLIBRA_BASE_URL not configured")
+        if not self.username or not self.password:
+            raise ValueError("COLLIBRA_USERNAME and COLLIBRA_PASSWORD not configured")
+
+        self.timeout = timeout or COLLIBRA_CONFIG.get("timeout", 30)
+        self.max_retries = COLLIBRA_CONFIG.get("max_retries", 3)
+        self.verify_ssl = COLLIBRA_CONFIG.get("verify_ssl", True) if verify_ssl is None else verify_ssl
+        self.page_size = COLLIBRA_CONFIG.get("page_size", 1000)
+        self.max_concurrency = max_concurrency or COLLIBRA_CONFIG.get("max_concurrency", 100)
+        self.cache = get_default_cache() if cache is SHARED else cache
+        self.cache_ttl = cache_ttl
+        self._cache_scope = cache_scope(self.base_url, self.username)
+        self.retry_policy = RetryPolicy(max_retries=self.max_retries)
+        self.circuit_breaker = get_circuit_breaker(f"Collibra ({self.base_url})")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.http = httpx.AsyncClient(
+            base_url=f"{self.base_url}/api/v1/",
+            auth=(self.username, self.password),
+            verify=self.verify_ssl,
+            timeout=self.timeout,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    @classmethod
+    def from_client(cls, client, max_concurrency: Optional[int] = None) -> "AsyncCollibraClient":
+        """
+        Async client for the same instance, credentials, cache, timeout and TLS settings as a CollibraClient.
+
+        Create it inside the event loop that will use it; pooled connections
+        cannot move between loops.
+
+        Args:
+            client: CollibraClient to mirror
+            max_concurrency: In-flight request limit
+
+        Returns:
+            AsyncCollibraClient, to be closed by the caller
+        """
+        async_client = cls(
+            client.base_url,
+            client.username,
+            client.password,
+            max_concurrency=max_concurrency,
+            cache=client.cache,
+            cache_ttl=client.cache_ttl,
+            timeout=client.timeout,
+            verify_ssl=client.session.verify,
+        )
+        async_client.page_size = client.page_size
+        return async_client
+
+    async def __aenter__(self) -> "AsyncCollibraClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close pooled connections."""
+        await self.http.aclose()
+
+    @profiled(lambda self, method, endpoint, *args, **kwargs: f"Collibra {method} {endpoint}")
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        use_cache: bool = True,
+        retry_rate_limits: bool = True,
+    ) -> Dict:
+        """
+        Make an HTTP request to Collibra API with retry and circuit breaking.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            data: Request body
+            use_cache: Set False to bypass the cache for this call
+            retry_rate_limits: Set False to raise 429s at once, for callers that pace themselves
+
+        Returns:
+            JSON response
+        """
+        cacheable = self.cache is not None and use_cache and method.upper() == "GET"
+        if cacheable:
+            cached = self.cache.get(make_cache_key(method, endpoint, params, self._cache_scope))
+            if cached is not MISS:
+                return cached
+
+        async def send() -> Dict:
+            async with self._semaphore:
+                response = await self.http.request(method, endpoint, params=params, json=data)
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            result = await self.retry_policy.run_async(
+                send, lambda e: self._classify_error(e, method, retry_rate_limits), self.circuit_breaker
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            raise CollibraAPIError(status, f"Collibra API error {status}: {str(e)}")
+        except httpx.TimeoutException as e:
+            raise ValueError(f"Timeout after {self.max_retries} retries: {str(e)}")
+        except httpx.TransportError as e:
+            raise ValueError(f"Connection error after {self.max_retries} retries: {str(e)}")
+
+        if cacheable:
+            self.cache.set(make_cache_key(method, endpoint, params, self._cache_scope), result, self.cache_ttl)
+        elif self.cache is not None and method.upper() != "GET":
+            # Any user's reads of this instance may be stale now
+            self.cache.clear(cache_scope(self.base_url))
+        return result
+
+    def _classify_error(
+        self, error: Exception, method: str = "GET", retry_rate_limits: bool = True
+    ) -> Tuple[bool, Optional[float], bool]:
+        """Return (retryable, retry_after, counts_as_outage) for a failed request.
+
+        Non-idempotent methods may already have been applied after a 5xx or
+        a timeout, so they are only retried on 429 or a connect failure.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if status == 429:
+                retryable = retry_rate_limits and self.retry_policy.should_retry_status(status)
+            else:
+                retryable = idempotent and self.retry_policy.should_retry_status(status)
+            return retryable, retry_after, status >= 500
+        if isinstance(error, httpx.TransportError):
+            never_sent = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+            return idempotent or never_sent, None, True
+        return False, None, False
+
+    async def get_assets(
+        self,
+        asset_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        use_cache: bool = True,
+    ) -> List[Dict]:
+        """
+        Retrieve assets from Collibra.
+
+        Args:
+            asset_type: Filter by asset type (e.g., 'Data Entity', 'Data Attribute')
+            limit: Number of results to return
+            offset: Pagination offset
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            List of asset objects
+        """
+        params = {"limit": limit, "offset": offset}
+        if asset_type:
+            params["type"] = asset_type
+
+        response = await self._request("GET", "assets", params=params, use_cache=use_cache)
+        return response.get("results", [])
+
+    async def iter_assets(
+        self,
+        asset_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily iterate over every asset, walking pages until an empty one.
+
+        Args:
+            asset_type: Filter by asset type (e.g., 'Data Entity', 'Data Attribute')
+            page_size: Assets requested per page (defaults to COLLIBRA_CONFIG page_size)
+            use_cache: Set False to bypass the response cache
+
+        Yields:
+            Asset objects
+        """
+        page_size = page_size or self.page_size
+        offset = 0
+        while True:
+            page = await self.get_assets(asset_type, page_size, offset, use_cache=use_cache)
+            for asset in page:
+                yield asset
+            if not page:
+                return
+            offset += len(page)
+
+    async def search_assets(self, query: str, limit: int = 50, use_cache: bool = True) -> List[Dict]:
+        """
+        Search for assets by name or description.
+
+        Args:
+            query: Search query
+            limit: Max results
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            List of matching assets
+        """
+        params = {"query": query, "limit": limit}
+        response = await self._request("GET", "assets/search", params=params, use_cache=use_cache)
+        return response.get("results", [])
+
+    async def get_asset(self, asset_id: str, use_cache: bool = True) -> Dict:
+        """
+        Get a single asset by ID.
+
+        Args:
+            asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            Asset object with full details
+        """
+        return await self._request("GET", f"assets/{asset_id}", use_cache=use_cache)
+
+    async def get_asset_attributes(self, asset_id: str) -> Dict:
+        """
+        Get all attributes of an asset.
+
+        Args:
+            asset_id: Asset UUID
+
+        Returns:
+            Dictionary of attribute name -> values
+        """
+        asset = await self.get_asset(asset_id)
+        return asset.get("attributes", {})
+
+    async def get_asset_relations(self, asset_id: str, use_cache: bool = True) -> List[Dict]:
+        """
+        Get relations/lineage for an asset.
+
+        Args:
+            asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            List of related assets
+        """
+        response = await self._request("GET", f"assets/{asset_id}/relations", use_cache=use_cache)
+        return response.get("relations", [])
+
+    async def get_relations(
+        self,
+        relation_type: Optional[str] = None,
+        domain_name: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        use_cache: bool = True,
+    ) -> List[Dict]:
+        """
+        Retrieve relations in bulk, one page at a time.
+
+        Args:
+            relation_type: Filter by relation type (e.g., 'is part of')
+            domain_name: Only relations whose source asset is in this domain
+            limit: Number of results to return
+            offset: Pagination offset
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            List of relation objects with sourceAsset and targetAsset
+        """
+        params = {"limit": limit, "offset": offset}
+        if relation_type:
+            params["relationType"] = relation_type
+        if domain_name:
+            params["domainName"] = domain_name
+
+        response = await self._request("GET", "relations", params=params, use_cache=use_cache)
+        return response.get("results", [])
+
+    async def iter_relations(
+        self,
+        relation_type: Optional[str] = None,
+        domain_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily iterate over every matching relation, walking pages until an empty one.
+
+        Args:
+            relation_type: Filter by relation type (e.g., 'is part of')
+            domain_name: Only relations whose source asset is in this domain
+            page_size: Relations requested per page (defaults to COLLIBRA_CONFIG page_size)
+            use_cache: Set False to bypass the response cache
+
+        Yields:
+            Relation objects
+        """
+        page_size = page_size or self.page_size
+        offset = 0
+        while True:
+            page = await self.get_relations(
+                relation_type, domain_name, page_size, offset, use_cache=use_cache
+            )
+            for relation in page:
+                yield relation
+            if not page:
+                return
+            offset += len(page)
+
+    async def get_domain_assets(
+        self,
+        domain_name: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        use_cache: bool = True,
+        modified_since: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get assets in a domain.
+
+        Args:
+            domain_name: Domain name
+            limit: Page size; omitted means the server default
+            offset: Pagination offset
+            use_cache: Set False to bypass the response cache
+            modified_since: Only assets with lastModifiedOn at or after this epoch-millis timestamp
+
+        Returns:
+            List of assets in that domain
+        """
+        params = {"domainName": domain_name}
+        if limit is not None:
+            params.update({"limit": limit, "offset": offset})
+        if modified_since is not None:
+            params["lastModifiedSince"] = modified_since
+
+        response = await self._request("GET", "assets", params=params, use_cache=use_cache)
+        return response.get("results", [])
+
+    async def iter_domain_assets(
+        self,
+        domain_name: str,
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+        modified_since: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily iterate over every asset in a domain, walking pages until an empty one.
+
+        Args:
+            domain_name: Domain name
+            page_size: Assets requested per page (defaults to COLLIBRA_CONFIG page_size)
+            use_cache: Set False to bypass the response cache
+            modified_since: Only assets with lastModifiedOn at or after this epoch-millis timestamp
+
+        Yields:
+            Asset objects in that domain
+        """
+        page_size = page_size or self.page_size
+        offset = 0
+        while True:
+            page = await self.get_domain_assets(
+                domain_name, page_size, offset, use_cache=use_cache, modified_since=modified_since
+            )
+            for asset in page:
+                yield asset
+            if not page:
+                return
+            offset += len(page)
+
+    async def get_data_quality_rules(
+        self,
+        asset_id: str,
+        use_cache: bool = True,
+        raise_errors: bool = False,
+        retry_rate_limits: bool = True,
+    ) -> List[Dict]:
+        """
+        Get data quality rules associated with an asset.
+
+        Args:
+            asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
+            raise_errors: Propagate API errors instead of returning an empty list
+            retry_rate_limits: Set False to raise 429s at once instead of retrying
+
+        Returns:
+            List of quality rules
+        """
+        try:
+            response = await self._request(
+                "GET", f"assets/{asset_id}/quality-rules",
+                use_cache=use_cache, retry_rate_limits=retry_rate_limits,
+            )
+            return response.get("results", [])
+        except ValueError:
+            # API may not support this endpoint in all versions
+            if raise_errors:
+                raise
+            return []
+
+    async def create_asset(
+        self,
+        name: str,
+        asset_type: str,
+        domain: str,
+        attributes: Optional[Dict] = None,
+        description: Optional[str] = None,
+    ) -> Dict:
+        """
+        Create a new asset in Collibra.
+
+        Args:
+            name: Asset name
+            asset_type: Type of asset
+            domain: Domain name
+            attributes: Optional attribute dictionary
+            description: Asset description
+
+        Returns:
+            Created asset object
+        """
+        payload = {
+            "name": name,
+            "type": asset_type,
+            "domain": domain,
+        }
+        if description:
+            payload["description"] = description
+        if attributes:
+            payload["attributes"] = attributes
+
+        return await self._request("POST", "assets", data=payload)
+
+    async def update_asset(self, asset_id: str, updates: Dict) -> Dict:
+        """
+        Update an existing asset.
+
+        Args:
+            asset_id: Asset UUID
+            updates: Dictionary of fields to update
+
+        Returns:
+            Updated asset object
+        """
+        return await self._request("PATCH", f"assets/{asset_id}", data=updates)
+
+    async def create_assets_bulk(self, assets: List[Dict]) -> List[Dict]:
+        """
+        Create many assets in one request.
+
+        Args:
+            assets: Asset payloads shaped like create_asset's (name, type, domain, ...)
+
+        Returns:
+            Created asset objects
+        """
+        response = await self._request("POST", "assets/bulk", data=assets)
+        return response.get("results", []) if isinstance(response, dict) else response
+
+    async def update_assets_bulk(self, updates: List[Dict]) -> List[Dict]:
+        """
+        Update many assets in one request.
+
+        Args:
+            updates: Update payloads, each with the asset "id" and fields to change
+
+        Returns:
+            Updated asset objects
+        """
+        response = await self._request("PATCH", "assets/bulk", data=updates)
+        return response.get("results", []) if isinstance(response, dict) else response
+
+    async def test_connection(self) -> bool:
+        """
+        Test connectivity to Collibra API.
+
+        Returns:
+            True if connection successful
+        """
+        try:
+            await self._request("GET", "assets", params={"limit": 1}, use_cache=False)
+            return True
+        except Exception:
+            return False
+
+
+def can_run_async(client) -> bool:
+    """
+    True if a fan-out for this client can run on an AsyncCollibraClient.
+
+    Needs httpx, a real CollibraClient to copy settings from, and no event
+    loop already running in this thread (asyncio.run cannot nest).
+    """
+    if httpx is None or not isinstance(client, CollibraClient):
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
@@ -0,0 +1,302 @@
+"""
+Collibra Response Cache
+TTL- and size-bounded caches for Collibra API responses.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config import CACHE_CONFIG
+
+# Sentinel returned by cache lookups that find nothing usable
+MISS = object()
+
+# Default for a client's cache argument: use the shared process cache (None disables caching)
+SHARED = object()
+
+
+def cache_scope(base_url: str, username: Optional[str] = None) -> str:
+    """
+    Key prefix for one Collibra instance, or one user on it.
+
+    Responses depend on the caller's permissions, so clients only share
+    entries when both base URL and user match. Writes invalidate the
+    instance prefix (no username), covering every user's entries.
+    """
+    scope = f"{base_url.rstrip('/')} "
+    return f"{scope}{username} " if username is not None else scope
+
+
+def make_cache_key(method: str, endpoint: str, params: Optional[Dict] = None, scope: str = "") -> str:
+    """Build a stable cache key from scope, method, endpoint and query parameters."""
+    encoded = json.dumps(params or {}, sort_keys=True, default=str)
+    return f"{scope}{method.upper()} {endpoint} {encoded}"
+
+
+class CacheStats:
+    """Hit/miss/eviction counters for a response cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def as_dict(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class MemoryCache:
+    """In-memory LRU cache with TTL expiry and byte-accounted eviction.
+
+    Values are stored as encoded JSON, so the byte budget reflects real
+    payload size and callers can never mutate a cached response in place.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600, max_size_mb: float = 100):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = CacheStats()
+        self._entries = OrderedDict()  # key -> (expires_at, payload bytes)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return MISS
+            expires_at, payload = entry
+            if expires_at < time.time():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
+        """Store a JSON-serialisable value, evicting least recently used entries.
+
+        ttl_seconds overrides the cache's TTL for this entry.
+        """
+        payload = json.dumps(value, default=str).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, payload)
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self, prefix: str = ""):
+        """Drop every entry, or only those whose key starts with prefix."""
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                self._size = 0
+                return
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._remove(key)
+
+    def _remove(self, key: str):
+        _, payload = self._entries.pop(key)
+        self._size -= len(payload)
+
+
+class SQLiteCache:
+    """On-disk cache backed by SQLite, shared across processes.
+
+    Entries expire after the TTL; when the stored payload exceeds the byte
+    budget the least recently used rows are evicted.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 3600, max_size_mb: float = 100):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return row[0]
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or MISS."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return MISS
+            payload, expires_at = row
+            if expires_at < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return MISS
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.stats.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
+        """Store a JSON-serialisable value, evicting least recently used rows.
+
+        ttl_seconds overrides the cache's TTL for this entry.
+        """
+        payload = json.dumps(value, default=str).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now + ttl, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self, prefix: str = ""):
+        """Drop every row, or only those whose key starts with prefix."""
+        with self._lock:
+            if prefix:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                )
+            else:
+                self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired rows, then LRU rows until the byte budget is met."""
+        expired = self._conn.execute(
+            "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+        ).rowcount
+        self.stats.expirations += max(expired, 0)
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.stats.evictions += 1
+
+
+def build_cache(config: Optional[Dict] = None):
+    """Create a cache backend from CACHE_CONFIG-style settings, or None if disabled."""
+    config = config or CACHE_CONFIG
+    if not config.get("enabled", True):
+        return None
+
+    ttl = config.get("ttl_seconds", 3600)
+    max_size_mb = config.get("max_size_mb", 100)
+    backend = config.get("backend", "memory")
+
+    if backend == "sqlite":
+        return SQLiteCache(config.get("path", ".cache/collibra.sqlite"), ttl, max_size_mb)
+    if backend == "memory":
+        return MemoryCache(ttl, max_size_mb)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Return the process-wide cache shared by all CollibraClient instances.
+
+    Streamlit builds a new client on every rerun, so a per-client cache would
+    never see a repeat request. Clients key their entries by cache_scope(),
+    so sessions on different instances or accounts never see each other's data.
+    """
+    global _default_cache
+    if not CACHE_CONFIG.get("enabled", True):
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = build_cache()
+    return _default_cache
@@ -4,17 +4,29 @@ Handles authentication, asset retrieval, and metadata operations.
 """
 
 import os
-from typing import Optional, Dict, List
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Optional, Dict, Iterator, List, Tuple
 
 try:
     import requests
     from requests.auth import HTTPBasicAuth
+    from urllib3.exceptions import NewConnectionError
 except ImportError:
     requests = None
 
 from config import COLLIBRA_CONFIG
+from .collibra_cache import MISS, SHARED, cache_scope, make_cache_key, get_default_cache
+from .profiler import profiled
+from .retry import IDEMPOTENT_METHODS, RetryPolicy, get_circuit_breaker, parse_retry_after
+
+
+class CollibraAPIError(ValueError):
+    """Collibra returned an HTTP error status."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class CollibraClient:
@@ -25,8 +37,19 @@ class CollibraClient:
         base_url: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        cache=SHARED,
+        cache_ttl: Optional[int] = None,
     ):
-        """Initialize Collibra client."""
+        """
+        Initialize Collibra client.
+
+        Args:
+            base_url: Collibra instance URL
+            username: API username
+            password: API password
+            cache: Response cache backend; defaults to the shared process cache, None disables caching
+            cache_ttl: Seconds to keep this client's responses (defaults to the cache's TTL)
+        """
         if not requests:
             raise ImportError("requests package not installed. Install with: pip install requests")
 
@@ -43,35 +66,58 @@ class CollibraClient:
         self.timeout = COLLIBRA_CONFIG.get("timeout", 30)
         self.max_retries = COLLIBRA_CONFIG.get("max_retries", 3)
         self.verify_ssl = COLLIBRA_CONFIG.get("verify_ssl", True)
+        self.page_size = COLLIBRA_CONFIG.get("page_size", 1000)
         self.session = requests.Session()
         self.session.auth = self.auth
         self.session.verify = self.verify_ssl
+        self.cache = get_default_cache() if cache is SHARED else cache
+        self.cache_ttl = cache_ttl
+        self._cache_scope = cache_scope(self.base_url, self.username)
+        self.retry_policy = RetryPolicy(max_retries=self.max_retries)
+        self.circuit_breaker = get_circuit_breaker(f"Collibra ({self.base_url})")
 
+    @profiled(lambda self, method, endpoint, *args, **kwargs: f"Collibra {method} {endpoint}")
     def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
-        retry_count: int = 0,
+        use_cache: bool = True,
+        retry_rate_limits: bool = True,
     ) -> Dict:
         """
         Make an HTTP request to Collibra API with retry logic.
 
+        Retries follow the shared RetryPolicy (jittered backoff, Retry-After,
+        5xx) and are skipped entirely while the circuit breaker is open.
+        POST/PATCH are only retried on 429 or when no connection was made,
+        so a bulk write is never applied twice.
+        GET responses are served from and stored in the response cache;
+        any successful write clears this instance's entries so later reads
+        see the change.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             params: Query parameters
             data: Request body
-            retry_count: Current retry attempt
+            use_cache: Set False to bypass the cache for this call
+            retry_rate_limits: Set False to raise 429s at once, for callers that pace themselves
 
         Returns:
             JSON response
         """
+        cacheable = self.cache is not None and use_cache and method.upper() == "GET"
+        if cacheable:
+            cached = self.cache.get(make_cache_key(method, endpoint, params, self._cache_scope))
+            if cached is not MISS:
+                return cached
+
         url = f"{self.base_url}/api/v1/{endpoint}"
         headers = {"Content-Type": "application/json"}
 
-        try:
+        def send() -> Dict:
             response = self.session.request(
                 method=method,
                 url=url,
@@ -82,31 +128,63 @@ class CollibraClient:
             )
             response.raise_for_status()
             return response.json()
+
+        try:
+            result = self.retry_policy.run(
+                send, lambda e: self._classify_error(e, method, retry_rate_limits), self.circuit_breaker
+            )
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429 and retry_count < self.max_retries:
-                # Rate limited - retry with backoff
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
-                return self._request(method, endpoint, params, data, retry_count + 1)
-            raise ValueError(f"Collibra API error {e.response.status_code}: {str(e)}")
+            raise CollibraAPIError(
+                e.response.status_code,
+                f"Collibra API error {e.response.status_code}: {str(e)}",
+            )
         except requests.exceptions.ConnectionError as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
-                return self._request(method, endpoint, params, data, retry_count + 1)
             raise ValueError(f"Connection error after {self.max_retries} retries: {str(e)}")
         except requests.exceptions.Timeout as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
-                return self._request(method, endpoint, params, data, retry_count + 1)
             raise ValueError(f"Timeout after {self.max_retries} retries: {str(e)}")
 
+        if cacheable:
+            self.cache.set(make_cache_key(method, endpoint, params, self._cache_scope), result, self.cache_ttl)
+        elif self.cache is not None and method.upper() != "GET":
+            # Any user's reads of this instance may be stale now
+            self.cache.clear(cache_scope(self.base_url))
+        return result
+
+    def _classify_error(
+        self, error: Exception, method: str = "GET", retry_rate_limits: bool = True
+    ) -> Tuple[bool, Optional[float], bool]:
+        """Return (retryable, retry_after, counts_as_outage) for a failed request.
+
+        Non-idempotent methods may already have been applied after a 5xx or
+        a timeout, so they are only retried on 429 or a connect failure.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = error.response.status_code
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if status == 429:
+                retryable = retry_rate_limits and self.retry_policy.should_retry_status(status)
+            else:
+                retryable = idempotent and self.retry_policy.should_retry_status(status)
+            return retryable, retry_after, status >= 500
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return idempotent or self._never_sent(error), None, True
+        return False, None, False
+
+    @staticmethod
+    def _never_sent(error: Exception) -> bool:
+        """True if the request failed while connecting, so the server never saw it."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
     def get_assets(
         self,
         asset_type: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        use_cache: bool = True,
     ) -> List[Dict]:
         """
         Retrieve assets from Collibra.
@@ -115,6 +193,7 @@ class CollibraClient:
             asset_type: Filter by asset type (e.g., 'Data Entity', 'Data Attribute')
             limit: Number of results to return
             offset: Pagination offset
+            use_cache: Set False to bypass the response cache
 
         Returns:
             List of asset objects
@@ -123,35 +202,62 @@ class CollibraClient:
         if asset_type:
             params["type"] = asset_type
 
-        response = self._request("GET", "assets", params=params)
+        response = self._request("GET", "assets", params=params, use_cache=use_cache)
         return response.get("results", [])
 
-    def search_assets(self, query: str, limit: int = 50) -> List[Dict]:
+    def iter_assets(
+        self,
+        asset_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over every asset, walking all pages.
+
+        Args:
+            asset_type: Filter by asset type (e.g., 'Data Entity', 'Data Attribute')
+            page_size: Assets requested per page (defaults to COLLIBRA_CONFIG page_size)
+            prefetch: Fetch the next page in a background thread while the current one is consumed
+            use_cache: Set False to bypass the response cache
+
+        Yields:
+            Asset objects
+        """
+        return self._iter_pages(
+            lambda limit, offset: self.get_assets(asset_type, limit, offset, use_cache=use_cache),
+            page_size,
+            prefetch,
+        )
+
+    def search_assets(self, query: str, limit: int = 50, use_cache: bool = True) -> List[Dict]:
         """
         Search for assets by name or description.
 
         Args:
             query: Search query
             limit: Max results
+            use_cache: Set False to bypass the response cache
 
         Returns:
             List of matching assets
         """
         params = {"query": query, "limit": limit}
-        response = self._request("GET", "assets/search", params=params)
+        response = self._request("GET", "assets/search", params=params, use_cache=use_cache)
         return response.get("results", [])
 
-    def get_asset(self, asset_id: str) -> Dict:
+    def get_asset(self, asset_id: str, use_cache: bool = True) -> Dict:
         """
         Get a single asset by ID.
 
         Args:
             asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
 
         Returns:
             Asset object with full details
         """
-        return self._request("GET", f"assets/{asset_id}")
+        return self._request("GET", f"assets/{asset_id}", use_cache=use_cache)
 
     def get_asset_attributes(self, asset_id: str) -> Dict:
         """
@@ -166,47 +272,205 @@ class CollibraClient:
         asset = self.get_asset(asset_id)
         return asset.get("attributes", {})
 
-    def get_asset_relations(self, asset_id: str) -> List[Dict]:
+    def get_asset_relations(self, asset_id: str, use_cache: bool = True) -> List[Dict]:
         """
         Get relations/lineage for an asset.
 
         Args:
             asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
 
         Returns:
             List of related assets
         """
-        response = self._request("GET", f"assets/{asset_id}/relations")
+        response = self._request("GET", f"assets/{asset_id}/relations", use_cache=use_cache)
         return response.get("relations", [])
 
-    def get_domain_assets(self, domain_name: str) -> List[Dict]:
+    def get_relations(
+        self,
+        relation_type: Optional[str] = None,
+        domain_name: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        use_cache: bool = True,
+    ) -> List[Dict]:
         """
-        Get all assets in a domain.
+        Retrieve relations in bulk, one page at a time.
+
+        Args:
+            relation_type: Filter by relation type (e.g., 'is part of')
+            domain_name: Only relations whose source asset is in this domain
+            limit: Number of results to return
+            offset: Pagination offset
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            List of relation objects with sourceAsset and targetAsset
+        """
+        params = {"limit": limit, "offset": offset}
+        if relation_type:
+            params["relationType"] = relation_type
+        if domain_name:
+            params["domainName"] = domain_name
+
+        response = self._request("GET", "relations", params=params, use_cache=use_cache)
+        return response.get("results", [])
+
+    def get_domain_assets(
+        self,
+        domain_name: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        use_cache: bool = True,
+        modified_since: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get assets in a domain.
 
         Args:
             domain_name: Domain name
+            limit: Page size; omitted means the server default
+            offset: Pagination offset
+            use_cache: Set False to bypass the response cache
+            modified_since: Only assets with lastModifiedOn at or after this epoch-millis timestamp
 
         Returns:
             List of assets in that domain
         """
-        response = self._request("GET", "assets", params={"domainName": domain_name})
+        params = {"domainName": domain_name}
+        if limit is not None:
+            params.update({"limit": limit, "offset": offset})
+        if modified_since is not None:
+            params["lastModifiedSince"] = modified_since
+
+        response = self._request("GET", "assets", params=params, use_cache=use_cache)
         return response.get("results", [])
 
-    def get_data_quality_rules(self, asset_id: str) -> List[Dict]:
+    def iter_domain_assets(
+        self,
+        domain_name: str,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        use_cache: bool = True,
+        modified_since: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over every asset in a domain, walking all pages.
+
+        Args:
+            domain_name: Domain name
+            page_size: Assets requested per page (defaults to COLLIBRA_CONFIG page_size)
+            prefetch: Fetch the next page in a background thread while the current one is consumed
+            use_cache: Set False to bypass the response cache
+            modified_since: Only assets with lastModifiedOn at or after this epoch-millis timestamp
+
+        Yields:
+            Asset objects in that domain
+        """
+        return self._iter_pages(
+            lambda limit, offset: self.get_domain_assets(
+                domain_name, limit, offset, use_cache=use_cache, modified_since=modified_since
+            ),
+            page_size,
+            prefetch,
+        )
+
+    def iter_relations(
+        self,
+        relation_type: Optional[str] = None,
+        domain_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over every matching relation, walking all pages.
+
+        Args:
+            relation_type: Filter by relation type (e.g., 'is part of')
+            domain_name: Only relations whose source asset is in this domain
+            page_size: Relations requested per page (defaults to COLLIBRA_CONFIG page_size)
+            prefetch: Fetch the next page in a background thread while the current one is consumed
+            use_cache: Set False to bypass the response cache
+
+        Yields:
+            Relation objects
+        """
+        return self._iter_pages(
+            lambda limit, offset: self.get_relations(
+                relation_type, domain_name, limit, offset, use_cache=use_cache
+            ),
+            page_size,
+            prefetch,
+        )
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], List[Dict]],
+        page_size: Optional[int],
+        prefetch: bool,
+    ) -> Iterator[Dict]:
+        """
+        Yield items from successive pages until an empty page is returned.
+
+        Servers may cap the page size below the requested limit, so a short
+        page does not mean the end, and the offset advances by the number of
+        items actually received. At most two pages (current and prefetched)
+        are held in memory.
+        """
+        page_size = page_size or self.page_size
+        if not prefetch:
+            offset = 0
+            while True:
+                page = fetch_page(page_size, offset)
+                if not page:
+                    return
+                yield from page
+                offset += len(page)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            pending = executor.submit(copy_context().run, fetch_page, page_size, offset)
+            while True:
+                page = pending.result()
+                if not page:
+                    return
+                offset += len(page)
+                pending = executor.submit(copy_context().run, fetch_page, page_size, offset)
+                yield from page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_data_quality_rules(
+        self,
+        asset_id: str,
+        use_cache: bool = True,
+        raise_errors: bool = False,
+        retry_rate_limits: bool = True,
+    ) -> List[Dict]:
         """
         Get data quality rules associated with an asset.
 
         Args:
             asset_id: Asset UUID
+            use_cache: Set False to bypass the response cache
+            raise_errors: Propagate API errors instead of returning an empty list
+            retry_rate_limits: Set False to raise 429s at once instead of retrying
 
         Returns:
             List of quality rules
         """
         try:
-            response = self._request("GET", f"assets/{asset_id}/quality-rules")
+            response = self._request(
+                "GET", f"assets/{asset_id}/quality-rules",
+                use_cache=use_cache, retry_rate_limits=retry_rate_limits,
+            )
             return response.get("results", [])
         except ValueError:
             # API may not support this endpoint in all versions
+            if raise_errors:
+                raise
             return []
 
     def create_asset(
@@ -255,6 +519,32 @@ class CollibraClient:
         """
         return self._request("PATCH", f"assets/{asset_id}", data=updates)
 
+    def create_assets_bulk(self, assets: List[Dict]) -> List[Dict]:
+        """
+        Create many assets in one request.
+
+        Args:
+            assets: Asset payloads shaped like create_asset's (name, type, domain, ...)
+
+        Returns:
+            Created asset objects
+        """
+        response = self._request("POST", "assets/bulk", data=assets)
+        return response.get("results", []) if isinstance(response, dict) else response
+
+    def update_assets_bulk(self, updates: List[Dict]) -> List[Dict]:
+        """
+        Update many assets in one request.
+
+        Args:
+            updates: Update payloads, each with the asset "id" and fields to change
+
+        Returns:
+            Updated asset objects
+        """
+        response = self._request("PATCH", "assets/bulk", data=updates)
+        return response.get("results", []) if isinstance(response, dict) else response
+
     def test_connection(self) -> bool:
         """
         Test connectivity to Collibra API.
@@ -263,7 +553,29 @@ class CollibraClient:
             True if connection successful
         """
         try:
-            self._request("GET", "assets", params={"limit": 1})
+            self._request("GET", "assets", params={"limit": 1}, use_cache=False)
             return True
         except Exception:
             return False
+
+    def cache_stats(self) -> Dict:
+        """
+        Report response cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations, entries and bytes
+        """
+        if self.cache is None:
+            return {"enabled": False}
+        stats = self.cache.stats.as_dict()
+        stats.update({
+            "enabled": True,
+            "entries": len(self.cache),
+            "size_bytes": self.cache.size_bytes,
+        })
+        return stats
+
+    def clear_cache(self):
+        """Drop every cached response for this Collibra instance."""
+        if self.cache is not None:
+            self.cache.clear(cache_scope(self.base_url))
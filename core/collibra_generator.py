@@ -3,22 +3,38 @@ Collibra Generator
 Produces metadata artifacts compatible with Collibra import formats.
 """
 
-import json
+from typing import Dict, Iterator, Optional, TextIO
+
+from .model_ir import DataModel, build_model
+from .profiler import profiled
+from .streaming import iter_json_array, write_chunks
 
 
 class CollibraGenerator:
     """Generates Collibra-compatible metadata from the data product definition."""
 
-    def __init__(self, product: dict):
+    def __init__(self, product: dict, model: Optional[DataModel] = None):
         self.product = product
+        self._model = model
+
+    @property
+    def model(self) -> DataModel:
+        """Normalised data model; pass one in to share it across generators."""
+        if self._model is None:
+            self._model = build_model(self.product)
+        return self._model
 
+    @profiled()
     def generate_asset_import(self) -> list:
         """Generate asset records for Collibra bulk import."""
+        return list(self.iter_assets())
+
+    def iter_assets(self) -> Iterator[Dict]:
+        """Yield asset records for Collibra bulk import, one at a time, in import order."""
         p = self.product
-        assets = []
 
         # Data product asset
-        assets.append({
+        yield {
             "resourceType": "Asset",
             "identifier": {
                 "name": p.get("name", "Unnamed"),
@@ -36,15 +52,17 @@ class CollibraGenerator:
             "relations": {
                 "Compliance": [{"name": f} for f in p.get("compliance_frameworks", [])],
             },
-        })
+        }
+
+        domain = p.get("domain", "")
 
         # Entity assets
-        for entity in p.get("entities", []):
+        for entity in self.model.entities:
             entity_asset = {
                 "resourceType": "Asset",
                 "identifier": {
-                    "name": entity.get("name", ""),
-                    "domain": p.get("domain", ""),
+                    "name": entity.name,
+                    "domain": domain,
                 },
                 "type": {"name": "Data Entity"},
                 "attributes": {},
@@ -54,29 +72,39 @@ class CollibraGenerator:
             }
 
             # Column-level assets
-            for attr in entity.get("attributes", []):
-                assets.append({
+            for attr in entity.attributes:
+                yield {
                     "resourceType": "Asset",
                     "identifier": {
-                        "name": f"{entity['name']}.{attr['name']}",
-                        "domain": p.get("domain", ""),
+                        "name": attr.qualified_name,
+                        "domain": domain,
                     },
                     "type": {"name": "Data Attribute"},
                     "attributes": {
-                        "Data Type": [{"value": attr.get("data_type", "")}],
-                        "Description": [{"value": attr.get("description", "")}],
-                        "PII": [{"value": str(attr.get("pii", False))}],
-                        "Nullable": [{"value": str(attr.get("nullable", True))}],
+                        "Data Type": [{"value": attr.data_type}],
+                        "Description": [{"value": attr.description}],
+                        "PII": [{"value": str(attr.pii)}],
+                        "Nullable": [{"value": str(attr.nullable)}],
                     },
                     "relations": {
-                        "is part of": [{"name": entity.get("name", "")}],
+                        "is part of": [{"name": entity.name}],
                     },
-                })
+                }
 
-            assets.append(entity_asset)
-
-        return assets
+            yield entity_asset
 
+    @profiled()
     def to_json(self) -> str:
         """Return the Collibra import payload as a JSON string."""
-        return json.dumps(self.generate_asset_import(), indent=2)
+        return "".join(iter_json_array(self.iter_assets(), indent=2))
+
+    def write_json(self, fp: TextIO) -> int:
+        """Write the Collibra import payload to a text file object, one asset at a time; returns characters written."""
+        return write_chunks(iter_json_array(self.iter_assets(), indent=2), fp)
+
+    def publish(self, collibra_client, domain_name: str = None, **kwargs):
+        """Push the generated assets to Collibra; see CollibraPublisher.publish."""
+        from .collibra_publisher import CollibraPublisher
+
+        publisher = CollibraPublisher(collibra_client, **kwargs)
+        return publisher.publish(self.generate_asset_import(), domain_name=domain_name)
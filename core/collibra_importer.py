@@ -3,204 +3,557 @@ Collibra Data Importer
 Fetches existing data models from Collibra and converts them to Data Product format.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Dict, List, Optional
-from .collibra_client import CollibraClient
+
+from config import COLLIBRA_CONFIG
+from .async_collibra_client import AsyncCollibraClient, can_run_async
+from .collibra_client import CollibraClient, CollibraAPIError
+from .domain_snapshot import DomainSnapshot
+from .metadata_store import MetadataStore
+from .pii_classifier import get_default_classifier
+from .type_mapping import map_type
+
+ENTITY_TYPES = ["Data Entity", "Table", "DataSet"]
+ATTRIBUTE_TYPES = ["Data Attribute", "Column", "Field"]
+SOURCE_TYPES = ["Data Source", "System", "Database", "API"]
+PARENT_RELATION_TYPES = ["is part of", "ispartof", "child of"]
+
+# Status codes meaning the quality-rules endpoint is unavailable, not that the call failed
+UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
+
+class QualityRuleImport:
+    """Outcome of a concurrent quality-rule import."""
+
+    def __init__(self):
+        self.rules = []
+        self.failures = {}  # asset ID -> error message
+        self.assets_scanned = 0
+        self.wall_time = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def summary(self) -> Dict:
+        return {
+            "rules": len(self.rules),
+            "assets_scanned": self.assets_scanned,
+            "failed_assets": len(self.failures),
+            "wall_time_seconds": round(self.wall_time, 3),
+        }
+
+
+class _SharedBackoff:
+    """Rate-limit pause shared by every worker in a fan-out.
+
+    When any worker is throttled, all workers hold off until the pause
+    expires instead of each hammering the server on its own schedule.
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._resume_at = 0.0
+        self._strikes = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def rate_limited(self):
+        with self._lock:
+            self._strikes += 1
+            delay = min(self.max_delay, self.base_delay * 2 ** (self._strikes - 1))
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def succeeded(self):
+        with self._lock:
+            self._strikes = 0
 
 
 class CollibraImporter:
     """Import data models from Collibra into Data Product format."""
 
-    def __init__(self, collibra_client: CollibraClient):
-        """Initialize importer with Collibra client."""
+    def __init__(
+        self,
+        collibra_client: Optional[CollibraClient],
+        store: Optional[MetadataStore] = None,
+        dialect: Optional[str] = None,
+    ):
+        """
+        Initialize importer.
+
+        Args:
+            collibra_client: Collibra client; may be None to import from the store only
+            store: Local metadata store that synced domains and relations are written to;
+                   scoped to the client's Collibra instance when a client is given
+            dialect: Source system of column types (defaults to COLLIBRA_CONFIG source_dialect)
+        """
         self.client = collibra_client
+        if store is not None and collibra_client is not None:
+            store = store.for_instance(collibra_client.base_url)
+        self.store = store
+        self.dialect = dialect if dialect is not None else COLLIBRA_CONFIG.get("source_dialect", "")
 
-    def import_data_model(self, domain_name: str) -> Dict:
+    def fetch_snapshot(self, domain_name: str) -> DomainSnapshot:
         """
-        Import a complete data model from a Collibra domain.
+        Fetch every asset in a domain once, for reuse by all import stages.
 
         Args:
             domain_name: Name of the domain to import
 
         Returns:
-            Dictionary with entities and attributes in Data Product format
+            DomainSnapshot of the domain's assets
         """
         try:
-            assets = self.client.get_domain_assets(domain_name)
+            return DomainSnapshot.fetch(self.client, domain_name)
         except Exception as e:
             raise ValueError(f"Failed to fetch assets from domain '{domain_name}': {str(e)}")
 
+    def sync_snapshot(
+        self,
+        domain_name: str,
+        full_refresh: bool = False,
+    ) -> DomainSnapshot:
+        """
+        Bring the domain's copy in the local metadata store up to date.
+
+        The first sync (or full_refresh=True) downloads the whole domain.
+        Later syncs fetch only assets modified since the stored high-water
+        mark and merge them into the stored snapshot.
+
+        Args:
+            domain_name: Name of the domain to import
+            full_refresh: Ignore the stored snapshot and re-download everything
+
+        Returns:
+            Up-to-date DomainSnapshot, also saved to the store
+        """
+        if self.store is None:
+            self.store = MetadataStore(instance=self.client.base_url)
+        store = self.store
+        snapshot = None if full_refresh else store.load(domain_name)
+
+        if snapshot is None:
+            snapshot = self.fetch_snapshot(domain_name)
+        else:
+            try:
+                snapshot = snapshot.refresh(self.client)
+            except Exception as e:
+                raise ValueError(f"Failed to sync domain '{domain_name}': {str(e)}")
+
+        store.save(snapshot)
+        return snapshot
+
+    def import_all(self, domain_name: str, snapshot: Optional[DomainSnapshot] = None) -> Dict:
+        """
+        Import data model, sources, governance and quality rules in one pass.
+
+        The domain's assets are downloaded once and walked a single time.
+
+        Args:
+            domain_name: Name of the domain to import
+            snapshot: Previously fetched (or synced) domain snapshot to reuse
+
+        Returns:
+            Dictionary with data_model, sources, governance and quality_rules
+        """
+        snapshot = snapshot or self.fetch_snapshot(domain_name)
+
         entities = []
-        attributes_by_entity = {}
+        attribute_assets = []
+        sources = []
+        governance = self._empty_governance()
 
-        # Process assets - separate entities from attributes
-        for asset in assets:
+        for asset in snapshot:
             asset_type = asset.get("type", {}).get("name", "")
-            asset_name = asset.get("name", "")
-            asset_id = asset.get("id", "")
-
-            if asset_type in ["Data Entity", "Table", "DataSet"]:
-                entity = {
-                    "name": asset_name.upper(),
-                    "attributes": [],
-                    "collibra_id": asset_id,
-                    "description": asset.get("description", ""),
-                }
-                entities.append(entity)
-                attributes_by_entity[asset_name] = entity
-
-            elif asset_type in ["Data Attribute", "Column", "Field"]:
-                # Find parent entity
-                relations = self.client.get_asset_relations(asset_id)
-                parent_entity = self._find_parent_entity(relations)
+            if asset_type in ENTITY_TYPES:
+                entities.append(self._convert_entity(asset))
+            elif asset_type in ATTRIBUTE_TYPES:
+                attribute_assets.append(asset)
+            elif asset_type in SOURCE_TYPES:
+                sources.append(self._convert_source(asset))
+            self._collect_governance(governance, asset)
 
-                if parent_entity:
-                    attr = {
-                        "name": asset_name.upper(),
-                        "data_type": self._infer_data_type(asset),
-                        "nullable": self._is_nullable(asset),
-                        "pii": self._is_pii(asset),
-                        "description": asset.get("description", ""),
-                        "collibra_id": asset_id,
-                    }
-                    if parent_entity in attributes_by_entity:
-                        attributes_by_entity[parent_entity]["attributes"].append(attr)
+        self._attach_attributes(domain_name, entities, attribute_assets)
+        quality = self.fetch_quality_rules(domain_name, snapshot=snapshot)
 
         return {
-            "entities": entities,
-            "import_source": "collibra",
-            "import_domain": domain_name,
+            "data_model": self._data_model(domain_name, entities),
+            "sources": sources,
+            "governance": governance,
+            "quality_rules": quality.rules,
+            "quality_rule_report": quality.summary(),
         }
 
-    def import_data_sources(self, domain_name: str) -> List[Dict]:
+    def import_data_model(self, domain_name: str, snapshot: Optional[DomainSnapshot] = None) -> Dict:
+        """
+        Import a complete data model from a Collibra domain.
+
+        Args:
+            domain_name: Name of the domain to import
+            snapshot: Previously fetched domain snapshot to reuse
+
+        Returns:
+            Dictionary with entities and attributes in Data Product format
+        """
+        snapshot = snapshot or self.fetch_snapshot(domain_name)
+
+        entities = [self._convert_entity(asset) for asset in snapshot.of_types(ENTITY_TYPES)]
+        self._attach_attributes(domain_name, entities, snapshot.of_types(ATTRIBUTE_TYPES))
+
+        return self._data_model(domain_name, entities)
+
+    def import_data_sources(self, domain_name: str, snapshot: Optional[DomainSnapshot] = None) -> List[Dict]:
         """
         Import data sources from Collibra.
 
         Args:
             domain_name: Domain name
+            snapshot: Previously fetched domain snapshot to reuse
 
         Returns:
             List of source configurations
         """
-        sources = []
         try:
-            assets = self.client.get_domain_assets(domain_name)
-            for asset in assets:
-                asset_type = asset.get("type", {}).get("name", "")
-                if asset_type in ["Data Source", "System", "Database", "API"]:
-                    source = {
-                        "name": asset.get("name", ""),
-                        "type": asset_type,
-                        "description": asset.get("description", ""),
-                        "collibra_id": asset.get("id", ""),
-                        "attributes": asset.get("attributes", {}),
-                    }
-                    sources.append(source)
+            snapshot = snapshot or DomainSnapshot.fetch(self.client, domain_name)
+            return [self._convert_source(asset) for asset in snapshot.of_types(SOURCE_TYPES)]
         except Exception as e:
             raise ValueError(f"Failed to import data sources: {str(e)}")
 
-        return sources
-
-    def import_governance_policies(self, domain_name: str) -> Dict:
+    def import_governance_policies(self, domain_name: str, snapshot: Optional[DomainSnapshot] = None) -> Dict:
         """
         Import governance and classification policies from Collibra.
 
         Args:
             domain_name: Domain name
+            snapshot: Previously fetched domain snapshot to reuse
 
         Returns:
             Dictionary with classification, compliance, and retention settings
         """
-        governance = {
-            "classification": None,
-            "compliance_frameworks": [],
-            "retention_policy": None,
-        }
+        governance = self._empty_governance()
 
         try:
-            assets = self.client.get_domain_assets(domain_name)
-            for asset in assets:
-                attrs = asset.get("attributes", {})
-
-                # Extract classification
-                if "Classification" in attrs:
-                    classification = attrs["Classification"][0].get("value")
-                    if classification:
-                        governance["classification"] = classification
-
-                # Extract compliance
-                if "Compliance" in attrs:
-                    for comp in attrs["Compliance"]:
-                        gov_framework = comp.get("value")
-                        if gov_framework:
-                            governance["compliance_frameworks"].append(gov_framework)
-
-                # Extract retention
-                if "Retention Policy" in attrs:
-                    retention = attrs["Retention Policy"][0].get("value")
-                    if retention:
-                        governance["retention_policy"] = retention
-
+            snapshot = snapshot or DomainSnapshot.fetch(self.client, domain_name)
+            for asset in snapshot:
+                self._collect_governance(governance, asset)
         except Exception as e:
             raise ValueError(f"Failed to import governance policies: {str(e)}")
 
         return governance
 
-    def import_quality_rules(self, domain_name: str) -> List[Dict]:
+    def import_quality_rules(self, domain_name: str, snapshot: Optional[DomainSnapshot] = None) -> List[Dict]:
         """
         Import data quality rules from Collibra.
 
         Args:
             domain_name: Domain name
+            snapshot: Previously fetched domain snapshot to reuse
 
         Returns:
             List of quality rules in Data Product format
         """
-        rules = []
         try:
-            assets = self.client.get_domain_assets(domain_name)
-            for asset in assets:
-                quality_rules = self.client.get_data_quality_rules(asset.get("id", ""))
-                for rule in quality_rules:
-                    converted_rule = {
-                        "attribute": f"{asset.get('name', '')}.{rule.get('name', '')}",
-                        "rule_type": rule.get("type", "custom"),
-                        "rule_definition": rule.get("definition", ""),
-                        "threshold": rule.get("threshold"),
-                        "collibra_id": rule.get("id", ""),
-                    }
-                    rules.append(converted_rule)
-        except Exception as e:
+            return self.fetch_quality_rules(domain_name, snapshot=snapshot).rules
+        except ValueError:
             # Quality rules might not be supported in all Collibra versions
-            pass
+            return []
+
+    def fetch_quality_rules(
+        self,
+        domain_name: str,
+        snapshot: Optional[DomainSnapshot] = None,
+        max_workers: Optional[int] = None,
+    ) -> QualityRuleImport:
+        """
+        Fetch quality rules for every asset in a domain concurrently.
+
+        With httpx installed, requests overlap on one pooled
+        AsyncCollibraClient; otherwise they fan out over a bounded thread
+        pool. A rate-limit response from any request pauses all of them.
+        Per-asset failures are recorded rather than swallowed.
+
+        Args:
+            domain_name: Domain name
+            snapshot: Previously fetched domain snapshot to reuse
+            max_workers: Concurrent requests (defaults to COLLIBRA_CONFIG max_concurrency
+                         on the async client, max_workers on threads)
+
+        Returns:
+            QualityRuleImport with rules, per-asset failures and wall time
+        """
+        result = QualityRuleImport()
+        started = time.perf_counter()
+        snapshot = snapshot or self.fetch_snapshot(domain_name)
+        backoff = _SharedBackoff()
+
+        if can_run_async(self.client):
+            asyncio.run(self._fetch_quality_rules_async(snapshot, backoff, result, max_workers))
+        else:
+            max_workers = max_workers or COLLIBRA_CONFIG.get("max_workers", 8)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    (asset, executor.submit(copy_context().run, self._fetch_asset_quality_rules, asset, backoff))
+                    for asset in snapshot
+                ]
+                for asset, future in futures:
+                    try:
+                        result.rules.extend(future.result())
+                    except Exception as e:
+                        result.failures[asset.get("id", "")] = str(e)
+
+        result.assets_scanned = len(snapshot)
+        result.wall_time = time.perf_counter() - started
+        return result
+
+    def _fetch_asset_quality_rules(self, asset: Dict, backoff: _SharedBackoff) -> List[Dict]:
+        """Fetch and convert one asset's quality rules, retrying when rate limited.
+
+        The client raises 429s at once, so the shared backoff is the only
+        layer retrying them and every worker pauses together.
+        """
+        max_retries = COLLIBRA_CONFIG.get("max_retries", 3)
+        for attempt in range(max_retries + 1):
+            backoff.wait()
+            try:
+                quality_rules = self.client.get_data_quality_rules(
+                    asset.get("id", ""), raise_errors=True, retry_rate_limits=False
+                )
+            except CollibraAPIError as e:
+                if e.status_code in UNSUPPORTED_STATUS_CODES:
+                    return []
+                if e.status_code == 429 and attempt < max_retries:
+                    backoff.rate_limited()
+                    continue
+                raise
+            backoff.succeeded()
+            return self._convert_quality_rules(asset, quality_rules)
+        return []
+
+    async def _fetch_quality_rules_async(
+        self,
+        snapshot: DomainSnapshot,
+        backoff: _SharedBackoff,
+        result: QualityRuleImport,
+        max_concurrency: Optional[int],
+    ):
+        """Fetch every asset's quality rules over one pooled async client."""
+        async with AsyncCollibraClient.from_client(self.client, max_concurrency) as client:
+            outcomes = await asyncio.gather(
+                *(self._fetch_asset_quality_rules_async(client, asset, backoff) for asset in snapshot),
+                return_exceptions=True,
+            )
+        for asset, outcome in zip(snapshot, outcomes):
+            if isinstance(outcome, BaseException):
+                result.failures[asset.get("id", "")] = str(outcome)
+            else:
+                result.rules.extend(outcome)
+
+    async def _fetch_asset_quality_rules_async(
+        self,
+        client: AsyncCollibraClient,
+        asset: Dict,
+        backoff: _SharedBackoff,
+    ) -> List[Dict]:
+        """Async counterpart of _fetch_asset_quality_rules."""
+        max_retries = COLLIBRA_CONFIG.get("max_retries", 3)
+        for attempt in range(max_retries + 1):
+            await backoff.wait_async()
+            try:
+                quality_rules = await client.get_data_quality_rules(
+                    asset.get("id", ""), raise_errors=True, retry_rate_limits=False
+                )
+            except CollibraAPIError as e:
+                if e.status_code in UNSUPPORTED_STATUS_CODES:
+                    return []
+                if e.status_code == 429 and attempt < max_retries:
+                    backoff.rate_limited()
+                    continue
+                raise
+            backoff.succeeded()
+            return self._convert_quality_rules(asset, quality_rules)
+        return []
+
+    def _convert_quality_rules(self, asset: Dict, quality_rules: List[Dict]) -> List[Dict]:
+        return [
+            {
+                "attribute": f"{asset.get('name', '')}.{rule.get('name', '')}",
+                "rule_type": rule.get("type", "custom"),
+                "rule_definition": rule.get("definition", ""),
+                "threshold": rule.get("threshold"),
+                "collibra_id": rule.get("id", ""),
+            }
+            for rule in quality_rules
+        ]
+
+    def _data_model(self, domain_name: str, entities: List[Dict]) -> Dict:
+        return {
+            "entities": entities,
+            "import_source": "collibra",
+            "import_domain": domain_name,
+        }
 
-        return rules
+    def _convert_entity(self, asset: Dict) -> Dict:
+        """Convert an entity asset to Data Product format (without attributes)."""
+        return {
+            "name": asset.get("name", "").upper(),
+            "attributes": [],
+            "collibra_id": asset.get("id", ""),
+            "description": asset.get("description", ""),
+        }
+
+    def _convert_attribute(self, asset: Dict) -> Dict:
+        """Convert an attribute asset to Data Product format."""
+        return {
+            "name": asset.get("name", "").upper(),
+            "data_type": self._infer_data_type(asset),
+            "nullable": self._is_nullable(asset),
+            "pii": self._is_pii(asset),
+            "description": asset.get("description", ""),
+            "collibra_id": asset.get("id", ""),
+        }
+
+    def _convert_source(self, asset: Dict) -> Dict:
+        """Convert a source asset to a source configuration."""
+        return {
+            "name": asset.get("name", ""),
+            "type": asset.get("type", {}).get("name", ""),
+            "description": asset.get("description", ""),
+            "collibra_id": asset.get("id", ""),
+            "attributes": asset.get("attributes", {}),
+        }
+
+    def _attach_attributes(self, domain_name: str, entities: List[Dict], attribute_assets: List[Dict]):
+        """Convert attribute assets and append each to its parent entity."""
+        # Parents are resolved by Collibra name; entity names are upper-cased on import
+        entities_by_name = {entity["name"]: entity for entity in entities}
+        parents = self._resolve_parent_entities(
+            domain_name, [asset.get("id", "") for asset in attribute_assets]
+        )
+
+        for asset in attribute_assets:
+            parent_entity = parents.get(asset.get("id", ""))
+            if parent_entity and parent_entity.upper() in entities_by_name:
+                entities_by_name[parent_entity.upper()]["attributes"].append(
+                    self._convert_attribute(asset)
+                )
+
+    def _empty_governance(self) -> Dict:
+        return {
+            "classification": None,
+            "compliance_frameworks": [],
+            "retention_policy": None,
+        }
+
+    def _collect_governance(self, governance: Dict, asset: Dict):
+        """Fold one asset's governance attributes into the governance settings."""
+        attrs = asset.get("attributes", {})
+
+        # Extract classification
+        if "Classification" in attrs:
+            classification = attrs["Classification"][0].get("value")
+            if classification:
+                governance["classification"] = classification
+
+        # Extract compliance
+        if "Compliance" in attrs:
+            for comp in attrs["Compliance"]:
+                gov_framework = comp.get("value")
+                if gov_framework:
+                    governance["compliance_frameworks"].append(gov_framework)
+
+        # Extract retention
+        if "Retention Policy" in attrs:
+            retention = attrs["Retention Policy"][0].get("value")
+            if retention:
+                governance["retention_policy"] = retention
+
+    def _resolve_parent_entities(self, domain_name: str, attribute_ids: List[str]) -> Dict[str, str]:
+        """
+        Map attribute asset IDs to their parent entity names.
+
+        Uses relations from the local metadata store when it is fresh and
+        covers every attribute. Otherwise pages through all "is part of"
+        relations in the domain, so the number of requests grows with pages
+        rather than with attribute count, and writes them to the store. Falls
+        back to one relations lookup per attribute only if the server does
+        not offer the bulk endpoint (404/405/501); other errors propagate.
+        """
+        if not attribute_ids:
+            return {}
+
+        wanted = set(attribute_ids)
+        if self.store is not None and (self.client is None or self.store.relations_fresh(domain_name)):
+            stored = self.store.parent_map(domain_name, PARENT_RELATION_TYPES)
+            if self.client is None or wanted.issubset(stored):
+                return {asset_id: stored[asset_id] for asset_id in attribute_ids if asset_id in stored}
+
+        parents = {}
+        parent_relations = []
+        try:
+            relations = self.client.iter_relations(
+                relation_type="is part of", domain_name=domain_name, prefetch=True
+            )
+            for relation in relations:
+                source_id = relation.get("sourceAsset", {}).get("id")
+                if source_id in wanted and source_id not in parents and self._is_parent_relation(relation):
+                    parents[source_id] = relation.get("targetAsset", {}).get("name")
+                    parent_relations.append(relation)
+        except CollibraAPIError as e:
+            # Older Collibra versions lack the bulk relations endpoint; anything else is a real failure
+            if e.status_code not in UNSUPPORTED_STATUS_CODES:
+                raise
+            parents = {}
+            parent_relations = []
+            for asset_id in attribute_ids:
+                relations = self.client.get_asset_relations(asset_id)
+                parent_entity = self._find_parent_entity(relations)
+                if parent_entity:
+                    parents[asset_id] = parent_entity
+                    parent_relations.append({
+                        "sourceAsset": {"id": asset_id},
+                        "targetAsset": {"name": parent_entity},
+                        "relationType": "is part of",
+                    })
+
+        if self.store is not None:
+            self.store.save_relations(domain_name, parent_relations)
+        return parents
+
+    def _is_parent_relation(self, relation: Dict) -> bool:
+        return relation.get("relationType", "").lower() in PARENT_RELATION_TYPES
 
     def _find_parent_entity(self, relations: List[Dict]) -> Optional[str]:
         """Find parent entity from relations."""
         for relation in relations:
-            if relation.get("relationType", "").lower() in ["is part of", "ispartof", "child of"]:
+            if self._is_parent_relation(relation):
                 return relation.get("targetAsset", {}).get("name")
         return None
 
     def _infer_data_type(self, asset: Dict) -> str:
-        """Infer data type from Collibra asset metadata."""
+        """Infer the Snowflake data type from Collibra asset metadata."""
         attrs = asset.get("attributes", {})
 
-        # Check explicit data type attribute
-        if "Data Type" in attrs:
-            dtype = attrs["Data Type"][0].get("value", "").upper()
-            if dtype:
-                # Map to standard types
-                if dtype.startswith("INT") or dtype.startswith("BIGINT"):
-                    return "NUMBER"
-                elif dtype.startswith("FLOAT") or dtype.startswith("DECIMAL"):
-                    return "FLOAT"
-                elif dtype.startswith("BOOL"):
-                    return "BOOLEAN"
-                elif "DATE" in dtype or "TIME" in dtype:
-                    return "TIMESTAMP" if "TIME" in dtype else "DATE"
-                elif dtype.startswith("VARCHAR") or dtype.startswith("TEXT"):
-                    return "STRING"
+        # Check explicit data type attributes
+        for attr_name in ("Data Type", "Technical Data Type"):
+            if attr_name in attrs:
+                dtype = attrs[attr_name][0].get("value", "")
+                if dtype:
+                    return map_type(dtype, self.dialect or None)
 
         # Default to STRING
         return "STRING"
@@ -222,19 +575,7 @@ class CollibraImporter:
             value = attrs["PII"][0].get("value", "").lower()
             return value == "true"
 
-        # Check name patterns
-        name = asset.get("name", "").lower()
-        pii_keywords = [
-            "email",
-            "phone",
-            "ssn",
-            "social_security",
-            "credit_card",
-            "password",
-            "firstname",
-            "lastname",
-            "address",
-            "dob",
-            "date_of_birth",
-        ]
-        return any(keyword in name for keyword in pii_keywords)
+        # Check name and description against the PII keyword dictionaries
+        return get_default_classifier().classify(
+            asset.get("name", ""), asset.get("description", "")
+        ).is_pii
@@ -0,0 +1,292 @@
+"""
+Collibra Publisher
+Pushes CollibraGenerator output to Collibra as batched, concurrent bulk upserts.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import COLLIBRA_CONFIG
+from .async_collibra_client import AsyncCollibraClient, can_run_async
+from .collibra_client import CollibraAPIError
+from .collibra_importer import UNSUPPORTED_STATUS_CODES
+from .domain_snapshot import DomainSnapshot
+
+# Assets are published in this order so relation targets exist before their sources
+PUBLISH_ORDER = ["Data Product", "Data Entity", "Data Attribute"]
+
+
+class PublishResult:
+    """Outcome of a publish run."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = []  # {"action", "names", "error"} per failed batch
+        self.batches = 0
+        self.wall_time = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Assets written per second."""
+        written = self.created + self.updated
+        return written / self.wall_time if self.wall_time else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "failed_assets": sum(len(f["names"]) for f in self.failed),
+            "batches": self.batches,
+            "wall_time_seconds": round(self.wall_time, 3),
+            "assets_per_second": round(self.throughput, 1),
+        }
+
+
+class CollibraPublisher:
+    """Diffs generated assets against a Collibra domain and upserts the changes in bulk."""
+
+    def __init__(
+        self,
+        collibra_client,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize publisher.
+
+        Args:
+            collibra_client: CollibraClient instance
+            batch_size: Assets per bulk request (defaults to COLLIBRA_CONFIG bulk_batch_size)
+            max_workers: Concurrent bulk requests (defaults to COLLIBRA_CONFIG max_workers)
+
+        Batches are sent over a pooled AsyncCollibraClient when httpx is
+        installed, otherwise over a thread pool.
+        """
+        self.client = collibra_client
+        self.batch_size = batch_size or COLLIBRA_CONFIG.get("bulk_batch_size", 500)
+        self.max_workers = max_workers or COLLIBRA_CONFIG.get("max_workers", 8)
+
+    def publish(
+        self,
+        assets: List[Dict],
+        domain_name: Optional[str] = None,
+        snapshot: Optional[DomainSnapshot] = None,
+        relations: Optional[List[Dict]] = None,
+    ) -> PublishResult:
+        """
+        Publish generated asset records to Collibra.
+
+        Existing assets are matched by name and type, and updated when
+        their attributes or relations (e.g. a re-parented attribute)
+        differ from the generated record.
+
+        Args:
+            assets: Records from CollibraGenerator.generate_asset_import()
+            domain_name: Target domain (defaults to the records' identifier domain)
+            snapshot: Previously fetched snapshot of the target domain to diff against
+            relations: Previously fetched relations of the domain (fetched when omitted)
+
+        Returns:
+            PublishResult with created/updated/unchanged counts and throughput
+        """
+        result = PublishResult()
+        started = time.perf_counter()
+
+        if domain_name is None:
+            domain_name = next((a["identifier"].get("domain") for a in assets if a.get("identifier")), "")
+        snapshot = snapshot or DomainSnapshot.fetch(self.client, domain_name)
+        existing = {}
+        for asset in snapshot:
+            asset_type = asset.get("type", {})
+            existing[(asset.get("name", ""), asset_type.get("name", ""))] = asset
+            if asset_type.get("id"):
+                existing[(asset.get("name", ""), asset_type["id"])] = asset
+
+        matched = [existing[key] for key in map(self._key_of, assets) if key in existing]
+        current_relations = self._current_relations(domain_name, matched, relations) if matched else {}
+
+        creates, updates = self._diff(assets, existing, current_relations, domain_name, result)
+        phases = self._phases(creates, updates)
+
+        if can_run_async(self.client):
+            asyncio.run(self._send_phases_async(phases, result))
+        else:
+            self._send_phases(phases, result)
+
+        result.wall_time = time.perf_counter() - started
+        return result
+
+    def _key_of(self, record: Dict) -> Tuple[str, str]:
+        """(name, type) lookup key of a generated record; the type ID when it carries one."""
+        asset_type = record.get("type", {})
+        return record.get("identifier", {}).get("name", ""), asset_type.get("id") or asset_type.get("name", "")
+
+    def _current_relations(
+        self,
+        domain_name: str,
+        matched: List[Dict],
+        relations: Optional[List[Dict]] = None,
+    ) -> Dict[str, Dict[str, Set[str]]]:
+        """Target names by lower-cased relation type, for each existing asset being published."""
+        ids = {asset.get("id", "") for asset in matched}
+        by_source: Dict[str, Dict[str, Set[str]]] = {}
+
+        def add(source_id: str, relation: Dict):
+            targets = by_source.setdefault(source_id, {}).setdefault(relation.get("relationType", "").lower(), set())
+            targets.add(relation.get("targetAsset", {}).get("name", ""))
+
+        if relations is None:
+            try:
+                relations = list(self.client.iter_relations(domain_name=domain_name, prefetch=True))
+            except CollibraAPIError as e:
+                # Older Collibra versions lack the bulk relations endpoint
+                if e.status_code not in UNSUPPORTED_STATUS_CODES:
+                    raise
+                for asset_id in ids:
+                    for relation in self.client.get_asset_relations(asset_id):
+                        add(asset_id, relation)
+                return by_source
+
+        for relation in relations:
+            source_id = relation.get("sourceAsset", {}).get("id")
+            if source_id in ids:
+                add(source_id, relation)
+        return by_source
+
+    def _diff(
+        self,
+        assets: List[Dict],
+        existing: Dict,
+        current_relations: Dict[str, Dict[str, Set[str]]],
+        domain_name: str,
+        result: PublishResult,
+    ):
+        """Split generated records into create and update payloads, counting unchanged ones."""
+        creates = []
+        updates = []
+        for record in assets:
+            name = record.get("identifier", {}).get("name", "")
+            type_name = record.get("type", {}).get("name", "")
+            attributes = record.get("attributes", {})
+            relations = record.get("relations", {})
+            current = existing.get(self._key_of(record))
+            desired = self._attribute_values(attributes, attributes)
+
+            if current is None:
+                creates.append({
+                    "name": name,
+                    "type": type_name,
+                    "domain": domain_name,
+                    "attributes": attributes,
+                    "relations": relations,
+                })
+                continue
+
+            attributes_changed = self._attribute_values(current.get("attributes", {}), attributes) != desired
+            relations_changed = self._relations_changed(relations, current_relations.get(current.get("id", ""), {}))
+            if attributes_changed or relations_changed:
+                update = {
+                    "id": current.get("id", ""),
+                    "name": name,
+                    "type": type_name,
+                    "attributes": attributes,
+                }
+                if relations_changed:
+                    update["relations"] = relations
+                updates.append(update)
+            else:
+                result.unchanged += 1
+        return creates, updates
+
+    def _relations_changed(self, desired: Dict, current: Dict[str, Set[str]]) -> bool:
+        """True if any published relation type points at different targets than in Collibra."""
+        return any(
+            {target.get("name", "") for target in targets} != current.get(relation_type.lower(), set())
+            for relation_type, targets in desired.items()
+        )
+
+    def _attribute_values(self, attrs: Dict, keys: Dict) -> Dict:
+        """Normalise attribute values for the keys being published."""
+        return {
+            key: [str(v.get("value", "")) for v in attrs.get(key, [])]
+            for key in keys
+        }
+
+    def _phase_of(self, payload: Dict) -> Optional[str]:
+        type_name = payload.get("type", "")
+        return type_name if type_name in PUBLISH_ORDER else None
+
+    def _batches(self, payloads: List[Dict]) -> List[List[Dict]]:
+        return [
+            payloads[i:i + self.batch_size]
+            for i in range(0, len(payloads), self.batch_size)
+        ]
+
+    def _phases(self, creates: List[Dict], updates: List[Dict]) -> List[List[Tuple[str, List[Dict]]]]:
+        """(action, batch) pairs per publish phase; each phase completes before the next starts."""
+        phases = []
+        for type_name in PUBLISH_ORDER + [None]:
+            phase = []
+            for action, payloads in (("create", creates), ("update", updates)):
+                group = [p for p in payloads if self._phase_of(p) == type_name]
+                phase.extend((action, batch) for batch in self._batches(group))
+            phases.append(phase)
+        return phases
+
+    def _send_phases(self, phases: List[List[Tuple[str, List[Dict]]]], result: PublishResult):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for phase in phases:
+                futures = [
+                    (action, batch, executor.submit(copy_context().run, self._send, action, batch))
+                    for action, batch in phase
+                ]
+                for action, batch, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._record(result, action, batch, e)
+                    else:
+                        self._record(result, action, batch)
+
+    async def _send_phases_async(self, phases: List[List[Tuple[str, List[Dict]]]], result: PublishResult):
+        async with AsyncCollibraClient.from_client(self.client, self.max_workers) as client:
+            for phase in phases:
+                outcomes = await asyncio.gather(
+                    *(self._send_async(client, action, batch) for action, batch in phase),
+                    return_exceptions=True,
+                )
+                for (action, batch), outcome in zip(phase, outcomes):
+                    self._record(result, action, batch, outcome if isinstance(outcome, BaseException) else None)
+
+    def _record(self, result: PublishResult, action: str, batch: List[Dict], error: Optional[BaseException] = None):
+        result.batches += 1
+        if error is not None:
+            result.failed.append({
+                "action": action,
+                "names": [p.get("name", "") for p in batch],
+                "error": str(error),
+            })
+        elif action == "create":
+            result.created += len(batch)
+        else:
+            result.updated += len(batch)
+
+    def _send(self, action: str, batch: List[Dict]) -> List[Dict]:
+        if action == "create":
+            return self.client.create_assets_bulk(batch)
+        return self.client.update_assets_bulk(batch)
+
+    async def _send_async(self, client: AsyncCollibraClient, action: str, batch: List[Dict]) -> List[Dict]:
+        if action == "create":
+            return await client.create_assets_bulk(batch)
+        return await client.update_assets_bulk(batch)
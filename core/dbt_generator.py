@@ -3,50 +3,81 @@ dbt Generator
 Generates dbt model files and schema YAML from the data product definition.
 """
 
+from typing import Dict, Iterator, Optional, TextIO, Tuple, Union
+
 import yaml
 
+from .model_ir import DataModel, Entity, build_entity, build_model
+from .profiler import profiled
+from .streaming import write_chunks
+
 
 class DbtGenerator:
     """Produces dbt model SQL and schema YAML from the data product definition."""
 
-    def __init__(self, product: dict):
+    def __init__(self, product: dict, model: Optional[DataModel] = None):
         self.product = product
+        self._model = model
 
+    @property
+    def model(self) -> DataModel:
+        """Normalised data model; pass one in to share it across generators."""
+        if self._model is None:
+            self._model = build_model(self.product)
+        return self._model
+
+    @profiled()
     def generate_schema_yaml(self) -> str:
         """Generate a dbt schema.yml file from the data model."""
-        entities = self.product.get("entities", [])
-
-        models = []
-        for entity in entities:
-            columns = []
-            for attr in entity.get("attributes", []):
-                col_def = {
-                    "name": attr["name"],
-                    "description": attr.get("description", ""),
-                }
-                tests = []
-                if not attr.get("nullable", True):
-                    tests.append("not_null")
-                if attr.get("pii"):
-                    col_def["meta"] = {"pii": True}
-                if tests:
-                    col_def["tests"] = tests
-                columns.append(col_def)
-
-            models.append({
-                "name": entity["name"],
-                "description": f"Entity: {entity['name']}",
-                "columns": columns,
-            })
-
-        schema = {"version": 2, "models": models}
-        return yaml.dump(schema, default_flow_style=False, sort_keys=False)
-
-    def generate_model_sql(self, entity: dict) -> str:
+        return "".join(self.iter_schema_yaml())
+
+    def iter_schema_yaml(self) -> Iterator[str]:
+        """
+        Yield schema.yml one model at a time.
+
+        Each model is dumped as a one-item sequence; PyYAML writes block
+        sequences under a mapping key without indentation, so the
+        concatenation matches dumping the whole document at once.
+        """
+        if not self.model.entities:
+            yield yaml.dump({"version": 2, "models": []}, default_flow_style=False, sort_keys=False)
+            return
+        yield "version: 2\nmodels:\n"
+        for entity in self.model.entities:
+            yield yaml.dump([self._model_schema(entity)], default_flow_style=False, sort_keys=False)
+
+    def write_schema_yaml(self, fp: TextIO) -> int:
+        """Write schema.yml to a text file object; returns characters written."""
+        return write_chunks(self.iter_schema_yaml(), fp)
+
+    def _model_schema(self, entity: Entity) -> Dict:
+        columns = []
+        for attr in entity.attributes:
+            col_def = {
+                "name": attr.name,
+                "description": attr.description,
+            }
+            tests = []
+            if not attr.nullable:
+                tests.append("not_null")
+            if attr.pii:
+                col_def["meta"] = {"pii": True}
+            if tests:
+                col_def["tests"] = tests
+            columns.append(col_def)
+
+        return {
+            "name": entity.name,
+            "description": f"Entity: {entity.name}",
+            "columns": columns,
+        }
+
+    def generate_model_sql(self, entity: Union[dict, Entity]) -> str:
         """Generate a dbt model SQL file for an entity."""
-        name = entity.get("name", "unnamed")
-        attributes = entity.get("attributes", [])
-        col_list = ",\n    ".join(a["name"] for a in attributes) if attributes else "*"
+        if isinstance(entity, dict):
+            entity = build_entity(entity, self.product)
+        name = entity.name
+        col_list = ",\n    ".join(entity.column_names) if entity.column_names else "*"
 
         return (
             f"-- dbt model for {name}\n"
@@ -55,10 +86,12 @@ class DbtGenerator:
             f"FROM {{{{ source('{name.lower()}_source', '{name.lower()}') }}}}\n"
         )
 
+    @profiled()
     def generate_all_models(self) -> dict:
         """Return a dict of filename -> SQL content for all entities."""
-        entities = self.product.get("entities", [])
-        return {
-            f"{ent['name'].lower()}.sql": self.generate_model_sql(ent)
-            for ent in entities
-        }
+        return dict(self.iter_models())
+
+    def iter_models(self) -> Iterator[Tuple[str, str]]:
+        """Yield (filename, SQL content) per entity, e.g. to write model files one by one."""
+        for ent in self.model.entities:
+            yield f"{ent.name.lower()}.sql", self.generate_model_sql(ent)
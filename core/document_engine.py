@@ -3,25 +3,55 @@ Document Engine
 Generates human-readable Markdown documentation for the data product.
 """
 
+from typing import Iterator, Optional, TextIO
+
+from .model_ir import DataModel, build_model
+from .profiler import profiled
+from .streaming import write_chunks
+
 
 class DocumentEngine:
     """Produces Markdown documentation from the data product definition."""
 
-    def __init__(self, product: dict):
+    def __init__(self, product: dict, model: Optional[DataModel] = None):
         self.product = product
+        self._model = model
 
+    @property
+    def model(self) -> DataModel:
+        """Normalised data model; pass one in to share it across generators."""
+        if self._model is None:
+            self._model = build_model(self.product)
+        return self._model
+
+    @profiled()
     def generate_markdown(self) -> str:
         """Generate a complete Markdown document."""
-        sections = [
-            self._title_section(),
-            self._business_context_section(),
-            self._data_sources_section(),
-            self._data_model_section(),
-            self._governance_section(),
-            self._data_quality_section(),
-            self._transformations_section(),
-        ]
-        return "\n\n---\n\n".join(s for s in sections if s)
+        return "".join(self.iter_markdown())
+
+    def iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown document in chunks; the data model tables are streamed row by row."""
+        sections = (
+            self._title_section,
+            self._business_context_section,
+            self._data_sources_section,
+            self._iter_data_model_section,
+            self._governance_section,
+            self._data_quality_section,
+            self._transformations_section,
+        )
+        for i, section in enumerate(sections):
+            if i:
+                yield "\n\n---\n\n"
+            chunks = section()
+            if isinstance(chunks, str):
+                yield chunks
+            else:
+                yield from chunks
+
+    def write_markdown(self, fp: TextIO) -> int:
+        """Write the Markdown document to a text file object; returns characters written."""
+        return write_chunks(self.iter_markdown(), fp)
 
     def _title_section(self) -> str:
         p = self.product
@@ -53,25 +83,21 @@ class DocumentEngine:
             )
         return "\n".join(lines)
 
-    def _data_model_section(self) -> str:
-        entities = self.product.get("entities", [])
-        lines = ["## Data Model"]
+    def _iter_data_model_section(self) -> Iterator[str]:
+        entities = self.model.entities
+        yield "## Data Model"
         if not entities:
-            lines.append("No entities defined.")
-            return "\n".join(lines)
+            yield "\nNo entities defined."
+            return
         for ent in entities:
-            lines.append(f"\n### {ent['name']}")
-            attrs = ent.get("attributes", [])
-            if attrs:
-                lines.append("| Attribute | Type | Nullable | PII | Description |")
-                lines.append("|-----------|------|----------|-----|-------------|")
-                for a in attrs:
-                    pii = "Yes" if a.get("pii") else "No"
-                    null = "Yes" if a.get("nullable") else "No"
-                    lines.append(
-                        f"| {a['name']} | {a['data_type']} | {null} | {pii} | {a.get('description', '')} |"
-                    )
-        return "\n".join(lines)
+            yield f"\n\n### {ent.name}"
+            if ent.attributes:
+                yield "\n| Attribute | Type | Nullable | PII | Description |"
+                yield "\n|-----------|------|----------|-----|-------------|"
+                for a in ent.attributes:
+                    pii = "Yes" if a.pii else "No"
+                    null = "Yes" if a.nullable else "No"
+                    yield f"\n| {a.name} | {a.data_type} | {null} | {pii} | {a.description} |"
 
     def _governance_section(self) -> str:
         p = self.product
@@ -0,0 +1,329 @@
+"""
+Metadata Store
+SQLite-backed local copy of imported Collibra domains, shared across sessions and processes.
+"""
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import CACHE_CONFIG
+from .domain_snapshot import DomainSnapshot
+
+# Bump when the tables change; older files are rebuilt (they only hold re-fetchable copies)
+_SCHEMA_VERSION = 2
+
+_TABLES = ("domains", "assets", "attributes", "relations", "relation_syncs")
+
+# Every table is keyed by instance (the Collibra base URL) and domain
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    instance TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    high_water_mark INTEGER NOT NULL,
+    PRIMARY KEY (instance, name)
+);
+CREATE TABLE IF NOT EXISTS assets (
+    instance TEXT NOT NULL,
+    id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    modified_on INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (instance, domain, id)
+);
+CREATE INDEX IF NOT EXISTS idx_assets_domain_type ON assets (instance, domain, type);
+CREATE INDEX IF NOT EXISTS idx_assets_name ON assets (name COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS attributes (
+    instance TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    asset_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_attributes_asset ON attributes (instance, domain, asset_id);
+CREATE INDEX IF NOT EXISTS idx_attributes_name ON attributes (name, value);
+CREATE TABLE IF NOT EXISTS relations (
+    instance TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    target_id TEXT,
+    target_name TEXT,
+    relation_type TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_relations_source ON relations (instance, domain, source_id);
+CREATE INDEX IF NOT EXISTS idx_relations_type ON relations (instance, domain, relation_type);
+CREATE TABLE IF NOT EXISTS relation_syncs (
+    instance TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (instance, domain)
+);
+"""
+
+
+class MetadataStore:
+    """Local store of Collibra assets, attributes and relations, indexed by domain, type and name.
+
+    Any number of Streamlit sessions or processes can share one database
+    file; writes for a domain happen in a single transaction. Domains are
+    stored per Collibra instance, so equally named domains on different
+    servers never mix; use for_instance() to address another instance.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age_seconds: Optional[int] = None,
+        instance: str = "",
+    ):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite file (defaults to CACHE_CONFIG metadata_path)
+            max_age_seconds: Freshness policy (defaults to CACHE_CONFIG metadata_max_age_seconds)
+            instance: Collibra base URL the domains belong to
+        """
+        self.instance = instance.rstrip("/")
+        self.path = path or CACHE_CONFIG.get("metadata_path", ".cache/metadata.sqlite")
+        if max_age_seconds is None:
+            max_age_seconds = CACHE_CONFIG.get("metadata_max_age_seconds", 86400)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            for table in _TABLES:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def for_instance(self, instance: str) -> "MetadataStore":
+        """Return a view of the same database for another Collibra instance (shares the connection)."""
+        view = copy.copy(self)
+        view.instance = (instance or "").rstrip("/")
+        return view
+
+    def close(self):
+        """Close the connection, for this store and every for_instance() view of it."""
+        self._conn.close()
+
+    # ── Snapshots ────────────────────────────────────────────────────
+
+    def save(self, snapshot: DomainSnapshot):
+        """Replace everything stored for the snapshot's domain."""
+        domain = snapshot.domain_name
+        asset_rows = []
+        attribute_rows = []
+        for position, asset in enumerate(snapshot):
+            asset_id = asset.get("id", "")
+            asset_rows.append((
+                self.instance,
+                asset_id,
+                domain,
+                asset.get("type", {}).get("name", ""),
+                asset.get("name", ""),
+                asset.get("description", ""),
+                int(asset.get("lastModifiedOn") or asset.get("createdOn") or 0),
+                json.dumps(asset, default=str),
+                position,
+            ))
+            for attr_name, values in asset.get("attributes", {}).items():
+                for value in values:
+                    attribute_rows.append((self.instance, domain, asset_id, attr_name, str(value.get("value", ""))))
+
+        key = (self.instance, domain)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM assets WHERE instance = ? AND domain = ?", key)
+            self._conn.execute("DELETE FROM attributes WHERE instance = ? AND domain = ?", key)
+            self._conn.executemany(
+                "INSERT INTO assets (instance, id, domain, type, name, description, modified_on, payload, position)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                asset_rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO attributes (instance, domain, asset_id, name, value) VALUES (?, ?, ?, ?, ?)",
+                attribute_rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO domains (instance, name, fetched_at, high_water_mark) VALUES (?, ?, ?, ?)",
+                key + (snapshot.fetched_at, snapshot.high_water_mark),
+            )
+
+    def load(self, domain_name: str) -> Optional[DomainSnapshot]:
+        """Return the stored snapshot for a domain, or None."""
+        with self._lock:
+            domain = self._conn.execute(
+                "SELECT fetched_at, high_water_mark FROM domains WHERE instance = ? AND name = ?",
+                (self.instance, domain_name),
+            ).fetchone()
+            if domain is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT payload FROM assets WHERE instance = ? AND domain = ? ORDER BY position",
+                (self.instance, domain_name),
+            ).fetchall()
+        assets = [json.loads(payload) for (payload,) in rows]
+        return DomainSnapshot(domain_name, assets, fetched_at=domain[0], high_water_mark=domain[1])
+
+    def domain_info(self, domain_name: str) -> Optional[Dict]:
+        """Return fetched_at, high_water_mark, asset count and freshness for a stored domain."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT d.fetched_at, d.high_water_mark, COUNT(a.id), r.synced_at FROM domains d"
+                " LEFT JOIN assets a ON a.instance = d.instance AND a.domain = d.name"
+                " LEFT JOIN relation_syncs r ON r.instance = d.instance AND r.domain = d.name"
+                " WHERE d.instance = ? AND d.name = ? GROUP BY d.name",
+                (self.instance, domain_name),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, high_water_mark, count, relations_synced_at = row
+        return {
+            "fetched_at": fetched_at,
+            "high_water_mark": high_water_mark,
+            "assets": count,
+            "age_seconds": time.time() - fetched_at,
+            "fresh": self._is_fresh(fetched_at),
+            "relations_synced_at": relations_synced_at,
+        }
+
+    def is_fresh(self, domain_name: str) -> bool:
+        """True if the domain's assets were synced within the freshness window."""
+        info = self.domain_info(domain_name)
+        return bool(info and info["fresh"])
+
+    def relations_fresh(self, domain_name: str) -> bool:
+        """True if the domain's relations were synced within the freshness window.
+
+        Tracked apart from the assets: saving a snapshot does not refresh relations.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM relation_syncs WHERE instance = ? AND domain = ?",
+                (self.instance, domain_name),
+            ).fetchone()
+        return row is not None and self._is_fresh(row[0])
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at <= self.max_age_seconds
+
+    def domains(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM domains WHERE instance = ? ORDER BY name", (self.instance,)
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def delete_domain(self, domain_name: str):
+        with self._lock, self._conn:
+            for table in _TABLES:
+                column = "name" if table == "domains" else "domain"
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE instance = ? AND {column} = ?", (self.instance, domain_name)
+                )
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def find_assets(
+        self,
+        domain_name: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        name: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """
+        Query stored assets using the domain/type/name indexes.
+
+        Args:
+            domain_name: Restrict to one domain
+            asset_type: Restrict to an asset type name
+            name: Case-insensitive exact name match
+            limit: Max results
+
+        Returns:
+            Matching asset objects
+        """
+        clauses = ["instance = ?"]
+        params = [self.instance]
+        for column, value in (("domain", domain_name), ("type", asset_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if name is not None:
+            clauses.append("name = ? COLLATE NOCASE")
+            params.append(name)
+        where = f"WHERE {' AND '.join(clauses)}"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM assets {where} ORDER BY domain, position LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def assets_with_attribute(self, domain_name: str, attr_name: str, value: Optional[str] = None) -> List[str]:
+        """Return IDs of assets in a domain carrying an attribute (optionally with a given value)."""
+        sql = "SELECT DISTINCT asset_id FROM attributes WHERE instance = ? AND domain = ? AND name = ?"
+        params = [self.instance, domain_name, attr_name]
+        if value is not None:
+            sql += " AND value = ?"
+            params.append(value)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [asset_id for (asset_id,) in rows]
+
+    # ── Relations ────────────────────────────────────────────────────
+
+    def save_relations(self, domain_name: str, relations: List[Dict]):
+        """Replace stored relations for a domain and record when they were synced."""
+        rows = [
+            (
+                self.instance,
+                domain_name,
+                r.get("sourceAsset", {}).get("id", ""),
+                r.get("targetAsset", {}).get("id"),
+                r.get("targetAsset", {}).get("name"),
+                r.get("relationType", "").lower(),
+            )
+            for r in relations
+        ]
+        key = (self.instance, domain_name)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM relations WHERE instance = ? AND domain = ?", key)
+            self._conn.executemany(
+                "INSERT INTO relations (instance, domain, source_id, target_id, target_name, relation_type)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO relation_syncs (instance, domain, synced_at) VALUES (?, ?, ?)",
+                key + (time.time(),),
+            )
+
+    def parent_map(self, domain_name: str, relation_types: List[str]) -> Dict[str, str]:
+        """Map source asset IDs to target names for the given relation types."""
+        placeholders = ", ".join("?" for _ in relation_types)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT source_id, target_name FROM relations"
+                f" WHERE instance = ? AND domain = ? AND relation_type IN ({placeholders})",
+                [self.instance, domain_name] + [t.lower() for t in relation_types],
+            ).fetchall()
+        parents = {}
+        for source_id, target_name in rows:
+            parents.setdefault(source_id, target_name)
+        return parents
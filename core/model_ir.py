@@ -0,0 +1,76 @@
+"""
+Model IR
+Normalised, read-only view of a product's data model, built in one pass and shared by the generators.
+"""
+
+from typing import Dict, List, Tuple
+
+from config import DATA_TYPE_OPTIONS
+from .profiler import profiled
+from .type_mapping import map_type
+
+
+class Attribute:
+    """One column, with defaults applied and derived flags precomputed."""
+
+    __slots__ = (
+        "name", "qualified_name", "data_type", "sql_type", "nullable", "pii",
+        "description", "is_primary_key", "is_foreign_key",
+    )
+
+    def __init__(self, entity_name: str, attr: Dict, keys: Dict[str, Tuple[bool, bool]]):
+        self.name = attr.get("name", "UNNAMED")
+        self.qualified_name = f"{entity_name}.{self.name}"
+        self.data_type = attr.get("data_type", "")
+        # The Data Model step's own types are Snowflake types already (NUMBER there means an integer)
+        self.sql_type = self.data_type if self.data_type in DATA_TYPE_OPTIONS else map_type(self.data_type)
+        self.nullable = attr.get("nullable", True)
+        self.pii = bool(attr.get("pii"))
+        self.description = attr.get("description", "") or ""
+        self.is_primary_key, self.is_foreign_key = keys.get(self.qualified_name, (False, False))
+
+
+class Entity:
+    """One table and its attributes."""
+
+    __slots__ = ("name", "description", "attributes", "pii_attributes", "column_names")
+
+    def __init__(self, entity: Dict, keys: Dict[str, Tuple[bool, bool]]):
+        self.name = entity.get("name", "UNNAMED")
+        self.description = entity.get("description", "") or ""
+        self.attributes = tuple(Attribute(self.name, a, keys) for a in entity.get("attributes", []))
+        self.pii_attributes = tuple(a for a in self.attributes if a.pii)
+        self.column_names = tuple(a.name for a in self.attributes)
+
+
+class DataModel:
+    """All entities of a product, plus model-wide facts the generators need."""
+
+    __slots__ = ("entities", "attribute_count", "has_pii_attributes")
+
+    def __init__(self, entities: List[Entity]):
+        self.entities = tuple(entities)
+        self.attribute_count = sum(len(e.attributes) for e in self.entities)
+        self.has_pii_attributes = any(e.pii_attributes for e in self.entities)
+
+
+def _key_flags(product: Dict) -> Dict[str, Tuple[bool, bool]]:
+    """Primary/foreign key flags from the Data Quality step's attribute rules, by ENTITY.ATTRIBUTE."""
+    rules = product.get("attribute_rules") or product.get("quality_rules", {}).get("attribute_rules", [])
+    flags = {}
+    for rule in rules or []:
+        pk, fk = flags.get(rule.get("attribute", ""), (False, False))
+        flags[rule.get("attribute", "")] = (pk or bool(rule.get("is_primary_key")), fk or bool(rule.get("is_foreign_key")))
+    return flags
+
+
+@profiled()
+def build_model(product: Dict) -> DataModel:
+    """Walk the product's entities and attributes once and return the shared model."""
+    keys = _key_flags(product)
+    return DataModel([Entity(e, keys) for e in product.get("entities", [])])
+
+
+def build_entity(entity: Dict, product: Dict = None) -> Entity:
+    """Normalise a single entity dict (key flags come from product, if given)."""
+    return Entity(entity, _key_flags(product or {}))
@@ -4,15 +4,22 @@ Handles chat completions, embeddings, and error handling.
 """
 
 import os
-from typing import Optional, List
-import time
+from typing import Optional, List, Tuple
 
 try:
-    from openai import OpenAI, RateLimitError, APIConnectionError, APITimeoutError
+    from openai import (
+        OpenAI,
+        RateLimitError,
+        APIConnectionError,
+        APITimeoutError,
+        APIStatusError,
+    )
 except ImportError:
     OpenAI = None
 
 from config import OPENAI_CONFIG
+from .profiler import profiled
+from .retry import RetryPolicy, get_circuit_breaker, parse_retry_after
 
 
 class OpenAIClient:
@@ -31,16 +38,19 @@ class OpenAIClient:
             api_key=self.api_key,
             base_url=OPENAI_CONFIG.get("base_url"),
             timeout=OPENAI_CONFIG.get("timeout", 30),
+            max_retries=0,  # every call below retries through self.retry_policy instead
         )
         self.model = OPENAI_CONFIG.get("model", "gpt-4-turbo")
         self.max_retries = OPENAI_CONFIG.get("max_retries", 3)
+        self.retry_policy = RetryPolicy(max_retries=self.max_retries)
+        self.circuit_breaker = get_circuit_breaker("OpenAI")
 
+    @profiled("OpenAI chat_completion")
     def chat_completion(
         self,
         messages: List[dict],
         temperature: float = 0.7,
         max_tokens: int = 2048,
-        retry_count: int = 0,
     ) -> str:
         """
         Send a chat completion request to OpenAI.
@@ -49,12 +59,11 @@ class OpenAIClient:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0-1)
             max_tokens: Max tokens in response
-            retry_count: Current retry attempt
 
         Returns:
             Response text from OpenAI
         """
-        try:
+        def send() -> str:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -62,30 +71,26 @@ class OpenAIClient:
                 max_tokens=max_tokens,
             )
             return response.choices[0].message.content
+
+        try:
+            return self.retry_policy.run(send, self._classify_error, self.circuit_breaker)
         except RateLimitError as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count  # Exponential backoff
-                time.sleep(wait_time)
-                return self.chat_completion(
-                    messages, temperature, max_tokens, retry_count + 1
-                )
             raise ValueError(f"Rate limited after {self.max_retries} retries: {str(e)}")
-        except APIConnectionError as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
-                return self.chat_completion(
-                    messages, temperature, max_tokens, retry_count + 1
-                )
-            raise ValueError(f"Connection error after {self.max_retries} retries: {str(e)}")
         except APITimeoutError as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
-                return self.chat_completion(
-                    messages, temperature, max_tokens, retry_count + 1
-                )
             raise ValueError(f"Timeout after {self.max_retries} retries: {str(e)}")
+        except APIConnectionError as e:
+            raise ValueError(f"Connection error after {self.max_retries} retries: {str(e)}")
+
+    def _classify_error(self, error: Exception) -> Tuple[bool, Optional[float], bool]:
+        """Return (retryable, retry_after, counts_as_outage) for a failed request."""
+        if isinstance(error, APIConnectionError):
+            # Includes APITimeoutError
+            return True, None, True
+        if isinstance(error, APIStatusError):
+            status = error.status_code
+            retry_after = parse_retry_after(error.response.headers.get("retry-after"))
+            return self.retry_policy.should_retry_status(status), retry_after, status >= 500
+        return False, None, False
 
     def system_prompt_completion(
         self,
@@ -121,6 +126,9 @@ class OpenAIClient:
         """
         Stream a chat completion response.
 
+        Opening the stream is retried like chat_completion; once text has
+        been yielded a failure is raised, since a retry would repeat it.
+
         Args:
             messages: List of message dicts
             temperature: Sampling temperature
@@ -129,20 +137,24 @@ class OpenAIClient:
         Yields:
             Text chunks from response
         """
-        try:
-            with self.client.chat.completions.create(
+        def send():
+            return self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=True,
-            ) as response:
+            )
+
+        try:
+            with self.retry_policy.run(send, self._classify_error, self.circuit_breaker) as response:
                 for chunk in response:
                     if chunk.choices[0].delta.content:
                         yield chunk.choices[0].delta.content
         except Exception as e:
             raise ValueError(f"Streaming error: {str(e)}")
 
+    @profiled("OpenAI embeddings")
     def embeddings(self, text: str) -> List[float]:
         """
         Generate embeddings for text.
@@ -153,11 +165,14 @@ class OpenAIClient:
         Returns:
             Embedding vector
         """
-        try:
+        def send() -> List[float]:
             response = self.client.embeddings.create(
                 model="text-embedding-3-small",
                 input=text,
             )
             return response.data[0].embedding
+
+        try:
+            return self.retry_policy.run(send, self._classify_error, self.circuit_breaker)
         except Exception as e:
             raise ValueError(f"Embedding error: {str(e)}")
@@ -0,0 +1,203 @@
+"""
+PII Classifier
+Flags personal-data columns from their names and descriptions using per-regulation keyword dictionaries.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from config import PII_CONFIG, PII_KEYWORDS
+
+# Splits snake_case, kebab-case, camelCase and acronyms: "customerDOB_2" -> customer, dob, 2
+_WORD_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def tokenize_column(text: str) -> List[str]:
+    """Split a column name (or free text) into lower-case words."""
+    return [word.lower() for word in _WORD_RE.findall(text or "")]
+
+
+class PIIMatch:
+    """Classification of one column."""
+
+    def __init__(self, confidence: float = 0.0, regulations: Optional[List[str]] = None,
+                 terms: Optional[List[str]] = None, threshold: float = 0.5):
+        self.confidence = confidence
+        self.regulations = regulations or []
+        self.terms = terms or []
+        self.is_pii = confidence >= threshold
+
+    def as_dict(self) -> Dict:
+        return {
+            "pii": self.is_pii,
+            "confidence": round(self.confidence, 2),
+            "regulations": self.regulations,
+            "terms": self.terms,
+        }
+
+
+class PIIClassifier:
+    """Compiled keyword matcher over tokenised column names.
+
+    All keyword phrases from the selected regulations are compiled into one
+    alternation anchored on word boundaries, so a column is scanned once
+    regardless of dictionary size and "address" never matches inside
+    "ipaddress" or "addressee". Confidence is the keyword's weight, combined
+    across keywords, and reduced when the name also carries a qualifier such
+    as "count" or "flag" (ip_address_count describes PII but is not PII).
+    """
+
+    def __init__(
+        self,
+        regulations: Optional[List[str]] = None,
+        keywords: Optional[Dict[str, Dict[str, float]]] = None,
+        threshold: Optional[float] = None,
+    ):
+        """
+        Build the classifier.
+
+        Args:
+            regulations: Regulations whose dictionaries apply (defaults to all)
+            keywords: {regulation: {phrase: confidence}} (defaults to PII_KEYWORDS)
+            threshold: Confidence at which a column is flagged (defaults to PII_CONFIG threshold)
+        """
+        keywords = keywords if keywords is not None else PII_KEYWORDS
+        if regulations is not None:
+            keywords = {reg: terms for reg, terms in keywords.items() if reg in regulations}
+        self.threshold = threshold if threshold is not None else PII_CONFIG["threshold"]
+        self.description_weight = PII_CONFIG["description_weight"]
+        self.qualifier_weight = PII_CONFIG["qualifier_weight"]
+        self.qualifiers = frozenset(PII_CONFIG["qualifiers"])
+
+        # phrase -> (confidence, regulations)
+        self._terms: Dict[str, tuple] = {}
+        for regulation, terms in keywords.items():
+            for phrase, confidence in terms.items():
+                phrase = " ".join(tokenize_column(phrase)) or phrase.lower()
+                best, regs = self._terms.get(phrase, (0.0, []))
+                self._terms[phrase] = (max(best, confidence), regs + [regulation])
+
+        # Longest phrases first so "email address" wins over "email"
+        alternation = "|".join(re.escape(p) for p in sorted(self._terms, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<!\S)(?:{alternation})(?!\S)") if alternation else None
+        self._classify_name = lru_cache(maxsize=65536)(self._classify_uncached)
+
+    def classify(self, name: str, description: str = "", data_type: str = "") -> PIIMatch:
+        """
+        Classify one column.
+
+        Args:
+            name: Column name
+            description: Column description (matches count for less)
+            data_type: Column type; boolean columns are flags, not personal data
+
+        Returns:
+            PIIMatch with confidence, regulations and matched terms
+        """
+        confidence, regulations, terms = self._classify_name(name, description, (data_type or "").upper())
+        return PIIMatch(confidence, list(regulations), list(terms), self.threshold)
+
+    def classify_many(self, columns: List[Dict]) -> List[PIIMatch]:
+        """Classify attribute dicts (name, description, data_type) in one pass."""
+        return [
+            self.classify(col.get("name", ""), col.get("description", ""), col.get("data_type", ""))
+            for col in columns
+        ]
+
+    def classify_entities(self, entities: List[Dict]) -> Dict[str, Dict[str, PIIMatch]]:
+        """
+        Classify every attribute of every entity.
+
+        Args:
+            entities: Data Product entities with their attributes
+
+        Returns:
+            {entity name: {attribute name: PIIMatch}}
+        """
+        return {
+            entity.get("name", ""): {
+                attr.get("name", ""): match
+                for attr, match in zip(entity.get("attributes", []), self.classify_many(entity.get("attributes", [])))
+            }
+            for entity in entities
+        }
+
+    def scan(self, entities: List[Dict]) -> List[Dict]:
+        """
+        Suggest PII tags for a whole data model in one pass.
+
+        Identical (name, description, type) columns are classified once,
+        so models with thousands of repeated audit or key columns stay cheap.
+
+        Args:
+            entities: Data Product entities with their attributes
+
+        Returns:
+            One suggestion per untagged attribute classified as PII:
+            {"entity", "attribute", "confidence", "regulations", "terms"}
+        """
+        rows = [
+            (entity.get("name", ""), attr)
+            for entity in entities
+            for attr in entity.get("attributes", [])
+            if not attr.get("pii")
+        ]
+        keys = [
+            (attr.get("name", ""), attr.get("description", "") or "", (attr.get("data_type", "") or "").upper())
+            for _, attr in rows
+        ]
+        results = {key: self._classify_name(*key) for key in set(keys)}
+
+        suggestions = []
+        for (entity_name, attr), key in zip(rows, keys):
+            confidence, regulations, terms = results[key]
+            if confidence >= self.threshold:
+                suggestions.append({
+                    "entity": entity_name,
+                    "attribute": attr.get("name", ""),
+                    "confidence": round(confidence, 2),
+                    "regulations": list(regulations),
+                    "terms": list(terms),
+                })
+        return suggestions
+
+    def _classify_uncached(self, name: str, description: str, data_type: str):
+        if self._pattern is None:
+            return 0.0, (), ()
+
+        name_words = tokenize_column(name)
+        found = {}
+        for text, weight in ((" ".join(name_words), 1.0),
+                             (" ".join(tokenize_column(description)), self.description_weight)):
+            if not text:
+                continue
+            for match in self._pattern.finditer(text):
+                phrase = match.group(0)
+                found[phrase] = max(found.get(phrase, 0.0), self._terms[phrase][0] * weight)
+
+        if not found:
+            return 0.0, (), ()
+
+        # Independent evidence: 1 - product of (1 - c)
+        remaining = 1.0
+        for confidence in found.values():
+            remaining *= 1.0 - confidence
+        confidence = 1.0 - remaining
+
+        if self.qualifiers.intersection(name_words) or data_type.startswith("BOOL"):
+            confidence *= self.qualifier_weight
+
+        regulations = sorted({reg for phrase in found for reg in self._terms[phrase][1]})
+        return confidence, tuple(regulations), tuple(sorted(found))
+
+
+_default_classifier: Optional[PIIClassifier] = None
+
+
+def get_default_classifier() -> PIIClassifier:
+    """Return the process-wide classifier over every regulation's dictionary."""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = PIIClassifier()
+    return _default_classifier
@@ -0,0 +1,154 @@
+"""
+Profiler
+Opt-in timing spans for one page render: CSS, sidebar, validation, generators and API calls.
+"""
+
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Union
+
+
+class Span:
+    """One timed call; start is seconds since the profile began, depth its nesting level."""
+
+    __slots__ = ("name", "start", "duration", "depth")
+
+    def __init__(self, name: str, start: float, duration: float, depth: int):
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.depth = depth
+
+    def as_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "start_ms": round(self.start * 1000, 2),
+            "duration_ms": round(self.duration * 1000, 2),
+            "depth": self.depth,
+        }
+
+
+class Profile:
+    """Spans recorded during one rerun, in start order once finished."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the profile began."""
+        return time.perf_counter() - self.started
+
+    def ordered(self) -> List[Span]:
+        """Spans sorted by start time (parents before their children)."""
+        return sorted(self.spans, key=lambda s: (s.start, s.depth))
+
+    def totals(self) -> List[Dict]:
+        """Per-name call counts and total milliseconds, slowest first."""
+        totals: Dict[str, List[float]] = {}
+        for s in self.spans:
+            entry = totals.setdefault(s.name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += s.duration
+        return [
+            {"name": name, "calls": calls, "total_ms": round(seconds * 1000, 2)}
+            for name, (calls, seconds) in sorted(totals.items(), key=lambda kv: -kv[1][1])
+        ]
+
+
+_current: ContextVar[Optional[Profile]] = ContextVar("profile", default=None)
+# Per task/thread, so overlapping spans (asyncio.gather, worker threads) nest correctly
+_depth: ContextVar[int] = ContextVar("profile_depth", default=0)
+
+
+def start_profile() -> Profile:
+    """Begin recording spans for the current thread/task; replaces any previous profile.
+
+    Tasks and contextvars.copy_context().run calls started afterwards record
+    into the same profile; plain worker threads do not.
+    """
+    profile = Profile()
+    _current.set(profile)
+    _depth.set(0)
+    return profile
+
+
+def stop_profile():
+    """Stop recording; span() and @profiled become no-ops again."""
+    _current.set(None)
+
+
+def current_profile() -> Optional[Profile]:
+    return _current.get()
+
+
+class span:
+    """
+    Context manager timing a block into the current profile.
+
+    Does nothing (beyond one context-variable lookup) when no profile is active.
+
+    Args:
+        name: Label shown in the waterfall
+    """
+
+    __slots__ = ("name", "_profile", "_start", "_depth", "_token")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._profile = _current.get()
+        if self._profile is not None:
+            self._depth = _depth.get()
+            self._token = _depth.set(self._depth + 1)
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        profile = self._profile
+        if profile is not None:
+            end = time.perf_counter()
+            _depth.reset(self._token)
+            profile.spans.append(
+                Span(self.name, self._start - profile.started, end - self._start, self._depth)
+            )
+        return False
+
+
+def profiled(name: Union[str, Callable, None] = None):
+    """
+    Decorator recording each call of a function as a span.
+
+    Args:
+        name: Span label; defaults to the function's qualified name. May be a
+              callable taking the call's arguments and returning the label,
+              e.g. lambda self, method, endpoint, **kw: f"{method} {endpoint}".
+    """
+    def decorate(func):
+        label = name if name is not None else func.__qualname__
+
+        def resolve(args, kwargs) -> str:
+            return label(*args, **kwargs) if callable(label) else label
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current.get() is None:
+                    return await func(*args, **kwargs)
+                with span(resolve(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with span(resolve(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,223 @@
+"""
+Retry Policy & Circuit Breaker
+Shared retry behaviour for the Collibra and OpenAI clients.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from config import RETRY_CONFIG
+
+# classify(exc) -> (retryable, retry_after_seconds, counts_as_outage)
+Classifier = Callable[[Exception], Tuple[bool, Optional[float], bool]]
+
+# Methods that are safe to resend after an ambiguous failure (timeout, 5xx)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitOpenError(ValueError):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} is unavailable; skipping calls for another {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Stops calling a failing service until a cool-down has passed.
+
+    After failure_threshold consecutive outage failures the circuit opens and
+    calls fail immediately. Once reset_seconds have elapsed a single trial
+    call is let through; success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if the circuit is open; return True if this call is the trial."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_seconds or self._trial_in_flight:
+                raise CircuitOpenError(self.name, max(self.reset_seconds - elapsed, 0.0))
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self):
+        """Let another trial through, e.g. after the trial call was cancelled without an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    """Full-jitter exponential backoff bounded by attempts and total elapsed time.
+
+    A server-supplied Retry-After takes precedence over the computed delay and
+    is waited in full; max_delay caps only the computed backoff. If the
+    requested wait would run past max_elapsed, the policy gives up instead.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        max_elapsed: Optional[float] = None,
+        retry_statuses=None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay if base_delay is not None else RETRY_CONFIG["base_delay"]
+        self.max_delay = max_delay if max_delay is not None else RETRY_CONFIG["max_delay"]
+        self.max_elapsed = max_elapsed if max_elapsed is not None else RETRY_CONFIG["max_elapsed"]
+        self.retry_statuses = set(retry_statuses or RETRY_CONFIG["retry_statuses"])
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def next_delay(self, attempt: int, started: float, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before retry number attempt + 1, or None to give up.
+
+        Args:
+            attempt: Retries already made
+            started: time.monotonic() when the first attempt began
+            retry_after: Server-requested delay in seconds, if any
+        """
+        if attempt >= self.max_retries:
+            return None
+        if retry_after is not None:
+            # Retrying earlier than asked only earns another 429
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if time.monotonic() - started + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def run(self, func: Callable, classify: Classifier, breaker: Optional[CircuitBreaker] = None):
+        """Call func until it succeeds or the policy gives up, re-raising the last error."""
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            trial = breaker.before_call() if breaker else False
+            try:
+                result = func()
+                if breaker:
+                    breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._handle_failure(e, classify, breaker, attempt, started)
+                if delay is None:
+                    raise
+            finally:
+                if trial:
+                    # No-op once recorded; frees the breaker if func was interrupted
+                    breaker.release_trial()
+            time.sleep(delay)
+            attempt += 1
+
+    async def run_async(self, func: Callable, classify: Classifier, breaker: Optional[CircuitBreaker] = None):
+        """Async counterpart of run(); func returns an awaitable."""
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            trial = breaker.before_call() if breaker else False
+            try:
+                result = await func()
+                if breaker:
+                    breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._handle_failure(e, classify, breaker, attempt, started)
+                if delay is None:
+                    raise
+            finally:
+                if trial:
+                    # No-op once recorded; frees the breaker if the task was cancelled
+                    breaker.release_trial()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _handle_failure(self, exc, classify, breaker, attempt, started) -> Optional[float]:
+        retryable, retry_after, outage = classify(exc)
+        if breaker:
+            if outage:
+                breaker.record_failure()
+            else:
+                # The service answered, so it is up even though this call failed
+                breaker.record_success()
+        if not retryable:
+            return None
+        return self.next_delay(attempt, started, retry_after)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a service, creating it on first use.
+
+    Streamlit builds new clients on every rerun, so breakers are shared by
+    name rather than owned by a client instance.
+    """
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=RETRY_CONFIG["breaker_failure_threshold"],
+                reset_seconds=RETRY_CONFIG["breaker_reset_seconds"],
+            )
+        return _breakers[name]
@@ -3,116 +3,150 @@ Snowflake Generator
 Generates DDL, masking policies, secure views, and grants from the product definition.
 """
 
+from typing import Iterator, Optional, TextIO
+
+from .model_ir import DataModel, Entity, build_model
+from .profiler import profiled
+from .streaming import join_chunks, write_chunks
+
 
 class SnowflakeGenerator:
     """Produces Snowflake-compatible DDL from the data product definition."""
 
-    def __init__(self, product: dict):
+    def __init__(self, product: dict, model: Optional[DataModel] = None):
         self.product = product
+        self._model = model
 
+    @property
+    def model(self) -> DataModel:
+        """Normalised data model; pass one in to share it across generators."""
+        if self._model is None:
+            self._model = build_model(self.product)
+        return self._model
+
+    @profiled()
     def generate_ddl(self) -> str:
         """Generate CREATE TABLE statements for all entities."""
-        entities = self.product.get("entities", [])
-        if not entities:
-            return "-- No entities defined."
+        return "".join(self.iter_ddl())
 
-        statements = []
-        for entity in entities:
-            statements.append(self._create_table(entity))
-        return "\n\n".join(statements)
+    def iter_ddl(self) -> Iterator[str]:
+        """Yield the CREATE TABLE script one statement at a time."""
+        if not self.model.entities:
+            yield "-- No entities defined."
+            return
+        yield from join_chunks((self._create_table(entity) for entity in self.model.entities), "\n\n")
 
-    def _create_table(self, entity: dict) -> str:
-        """Generate a single CREATE TABLE statement."""
-        name = entity.get("name", "UNNAMED")
-        attributes = entity.get("attributes", [])
+    def write_ddl(self, fp: TextIO) -> int:
+        """Write the CREATE TABLE script to a text file object; returns characters written."""
+        return write_chunks(self.iter_ddl(), fp)
 
+    def _create_table(self, entity: Entity) -> str:
+        """Generate a single CREATE TABLE statement."""
         col_defs = []
-        for attr in attributes:
-            col_name = attr.get("name", "UNNAMED")
-            col_type = attr.get("data_type", "VARCHAR")
-            nullable = "NULL" if attr.get("nullable", True) else "NOT NULL"
-            comment = f" COMMENT '{attr.get('description', '')}'" if attr.get("description") else ""
-            col_defs.append(f"    {col_name} {col_type} {nullable}{comment}")
+        for attr in entity.attributes:
+            nullable = "NULL" if attr.nullable else "NOT NULL"
+            comment = f" COMMENT '{attr.description}'" if attr.description else ""
+            col_defs.append(f"    {attr.name} {attr.sql_type} {nullable}{comment}")
 
         cols_sql = ",\n".join(col_defs) if col_defs else "    -- no columns defined"
 
         return (
             f"-- Generated by GDP Data Product Steward\n"
-            f"CREATE TABLE IF NOT EXISTS {name} (\n{cols_sql}\n);"
+            f"CREATE TABLE IF NOT EXISTS {entity.name} (\n{cols_sql}\n);"
         )
 
+    @profiled()
     def generate_masking_policies(self) -> str:
         """Generate masking policies for PII attributes."""
-        if not self.product.get("pii"):
-            return "-- No PII detected. No masking policies required."
-
-        policies = ["-- Masking Policies for PII Attributes\n"]
-
-        for entity in self.product.get("entities", []):
-            for attr in entity.get("attributes", []):
-                if attr.get("pii"):
-                    policy_name = f"MASK_{entity['name']}_{attr['name']}"
-                    dtype = attr.get("data_type", "STRING")
-                    policies.append(
-                        f"CREATE OR REPLACE MASKING POLICY {policy_name}\n"
-                        f"  AS (val {dtype})\n"
-                        f"  RETURNS {dtype} ->\n"
-                        f"  CASE\n"
-                        f"    WHEN CURRENT_ROLE() IN ('DATA_ENGINEER', 'DATA_OWNER') THEN val\n"
-                        f"    ELSE '***MASKED***'\n"
-                        f"  END;\n"
-                    )
-                    policies.append(
-                        f"ALTER TABLE {entity['name']} ALTER COLUMN {attr['name']} "
-                        f"SET MASKING POLICY {policy_name};\n"
-                    )
-
-        return "\n".join(policies)
+        return "".join(self.iter_masking_policies())
 
+    def iter_masking_policies(self) -> Iterator[str]:
+        """Yield masking policies for PII attributes one statement at a time."""
+        if not self.product.get("pii"):
+            yield "-- No PII detected. No masking policies required."
+            return
+        yield from join_chunks(self._masking_statements(), "\n")
+
+    def _masking_statements(self) -> Iterator[str]:
+        yield "-- Masking Policies for PII Attributes\n"
+        for entity in self.model.entities:
+            for attr in entity.pii_attributes:
+                policy_name = f"MASK_{entity.name}_{attr.name}"
+                dtype = attr.sql_type
+                yield (
+                    f"CREATE OR REPLACE MASKING POLICY {policy_name}\n"
+                    f"  AS (val {dtype})\n"
+                    f"  RETURNS {dtype} ->\n"
+                    f"  CASE\n"
+                    f"    WHEN CURRENT_ROLE() IN ('DATA_ENGINEER', 'DATA_OWNER') THEN val\n"
+                    f"    ELSE '***MASKED***'\n"
+                    f"  END;\n"
+                )
+                yield (
+                    f"ALTER TABLE {entity.name} ALTER COLUMN {attr.name} "
+                    f"SET MASKING POLICY {policy_name};\n"
+                )
+
+    @profiled()
     def generate_secure_views(self) -> str:
         """Generate secure views if classification is Restricted."""
+        return "".join(self.iter_secure_views())
+
+    def iter_secure_views(self) -> Iterator[str]:
+        """Yield secure views one statement at a time."""
         classification = self.product.get("classification", "")
         if classification not in ("Restricted", "Confidential"):
-            return "-- Classification does not require secure views."
-
-        views = [f"-- Secure Views ({classification} classification)\n"]
-
-        for entity in self.product.get("entities", []):
-            name = entity["name"]
-            attrs = entity.get("attributes", [])
-            col_list = ", ".join(a["name"] for a in attrs) if attrs else "*"
-
-            views.append(
-                f"CREATE OR REPLACE SECURE VIEW V_{name} AS\n"
+            yield "-- Classification does not require secure views."
+            return
+        yield from join_chunks(self._secure_view_statements(classification), "\n")
+
+    def _secure_view_statements(self, classification: str) -> Iterator[str]:
+        yield f"-- Secure Views ({classification} classification)\n"
+        for entity in self.model.entities:
+            col_list = ", ".join(entity.column_names) if entity.column_names else "*"
+            yield (
+                f"CREATE OR REPLACE SECURE VIEW V_{entity.name} AS\n"
                 f"SELECT\n    {col_list}\n"
-                f"FROM {name};\n"
+                f"FROM {entity.name};\n"
             )
 
-        return "\n".join(views)
-
+    @profiled()
     def generate_grants(self) -> str:
         """Generate GRANT statements based on access roles."""
+        return "".join(self.iter_grants())
+
+    def iter_grants(self) -> Iterator[str]:
+        """Yield GRANT statements one at a time."""
         roles_raw = self.product.get("access_roles", "")
         if not roles_raw:
-            return "-- No access roles defined."
+            yield "-- No access roles defined."
+            return
 
         roles = [r.strip() for r in roles_raw.split(",") if r.strip()]
-        entities = self.product.get("entities", [])
-
-        grants = ["-- Access Grants\n"]
-        for entity in entities:
-            table = entity.get("name", "UNNAMED")
-            for role in roles:
-                grants.append(f"GRANT SELECT ON TABLE {table} TO ROLE {role};")
-
-        return "\n".join(grants)
+        statements = (
+            f"GRANT SELECT ON TABLE {entity.name} TO ROLE {role};"
+            for entity in self.model.entities
+            for role in roles
+        )
+        yield "-- Access Grants\n"
+        for statement in statements:
+            yield "\n"
+            yield statement
 
+    @profiled()
     def generate_all(self) -> str:
         """Generate complete Snowflake deployment script."""
-        sections = [
-            self.generate_ddl(),
-            self.generate_masking_policies(),
-            self.generate_secure_views(),
-            self.generate_grants(),
-        ]
-        return "\n\n-- " + "=" * 60 + "\n\n".join(sections)
+        return "".join(self.iter_all())
+
+    def iter_all(self) -> Iterator[str]:
+        """Yield the complete deployment script section by section, statement by statement."""
+        yield "\n\n-- " + "=" * 60
+        sections = (self.iter_ddl, self.iter_masking_policies, self.iter_secure_views, self.iter_grants)
+        for i, section in enumerate(sections):
+            if i:
+                yield "\n\n"
+            yield from section()
+
+    def write_all(self, fp: TextIO) -> int:
+        """Write the complete deployment script to a text file object; returns characters written."""
+        return write_chunks(self.iter_all(), fp)
@@ -0,0 +1,69 @@
+"""
+Streaming
+Helpers for emitting large artifacts in chunks instead of building one string.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, TextIO
+
+WRITE_BUFFER_CHARS = 1 << 16
+
+
+def join_chunks(items: Iterable[str], separator: str) -> Iterator[str]:
+    """Yield items with separator between them; "".join() of the result equals separator.join(items)."""
+    first = True
+    for item in items:
+        if not first:
+            yield separator
+        first = False
+        yield item
+
+
+def iter_json_array(items: Iterable[Any], indent: int = 2) -> Iterator[str]:
+    """
+    Encode items as a JSON array, one element at a time.
+
+    The concatenated output is identical to json.dumps(list(items), indent=indent),
+    but only one element is ever encoded in memory.
+
+    Args:
+        items: JSON-serialisable elements
+        indent: Indentation width, as for json.dumps
+
+    Yields:
+        Chunks of the JSON document
+    """
+    pad = " " * indent
+    first = True
+    for item in items:
+        # json.dumps escapes newlines inside strings, so every "\n" here is layout
+        body = json.dumps(item, indent=indent).replace("\n", "\n" + pad)
+        yield ("[\n" if first else ",\n") + pad + body
+        first = False
+    yield "[]" if first else "\n]"
+
+
+def write_chunks(chunks: Iterable[str], fp: TextIO, buffer_chars: int = WRITE_BUFFER_CHARS) -> int:
+    """
+    Write chunks to a text file object, batching small chunks into fewer writes.
+
+    Args:
+        chunks: Text chunks, e.g. from a generator's iter_* method
+        fp: Writable text file object
+        buffer_chars: Characters to collect before each write
+
+    Returns:
+        Number of characters written
+    """
+    buffer, size, total = [], 0, 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_chars:
+            fp.write("".join(buffer))
+            total += size
+            buffer, size = [], 0
+    if buffer:
+        fp.write("".join(buffer))
+        total += size
+    return total
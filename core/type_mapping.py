@@ -0,0 +1,149 @@
+"""
+Type Mapping
+Maps source-system column types to Snowflake types, keeping length, precision and scale.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# "DECIMAL(18, 2)", "NUMBER(*,0)", "VARCHAR(MAX)", "VARCHAR2(100 BYTE)", "TIMESTAMP(6) WITH TIME ZONE",
+# "INT UNSIGNED"
+_TYPE_RE = re.compile(
+    r"^(?P<base>[A-Z][A-Z0-9_]*(?: (?:PRECISION|VARYING|VARCHAR|CHAR))?)"
+    r"\s*(?:\(\s*(?P<p>\d+|MAX|\*)(?:\s+(?:BYTE|CHAR))?\s*(?:,\s*(?P<s>\d+)\s*)?\))?"
+    r"(?P<suffix>.*)$"
+)
+
+# (base-name pattern, Snowflake type with parameters, bare Snowflake type) —
+# first match wins. {p} / {s} are the source length or precision / scale; the
+# bare type applies when the source type has no parameters. Bare names use the
+# Data Model step's families (STRING, NUMBER, FLOAT, BOOLEAN, DATE, TIMESTAMP)
+# where one means the same thing. Examples:
+#
+#   DECIMAL(18,2)  -> NUMBER(18,2)      NUMBER(*,0) -> NUMBER(38,0)
+#   DECIMAL        -> NUMBER(38,10)     (bare Snowflake NUMBER has scale 0)
+#   CHAR(3)        -> VARCHAR(3)        CHAR        -> VARCHAR(1)
+#   VARCHAR2(100 BYTE) -> VARCHAR(100)  DATETIME2(7) -> TIMESTAMP_NTZ(7)
+_RULES: List[Tuple[str, str, str]] = [
+    (r"NUMBER|NUMERIC|DECIMAL|DEC|BIGNUMERIC|BIGDECIMAL", "NUMBER({p},{s})", "NUMBER(38,10)"),
+    (r"(?:TINY|SMALL|MEDIUM|BIG|BYTE)?INT(?:EGER)?\d*|(?:SMALL|BIG)?SERIAL\d*|LONG", "NUMBER", "NUMBER"),
+    (r"FLOAT\d*|DOUBLE(?: PRECISION)?|REAL|BINARY_(?:FLOAT|DOUBLE)", "FLOAT", "FLOAT"),
+    (r"MONEY|SMALLMONEY", "NUMBER(19,4)", "NUMBER(19,4)"),
+    (r"BOOL(?:EAN)?|BIT|LOGICAL", "BOOLEAN", "BOOLEAN"),
+    (r"TIMESTAMP_NTZ|DATETIME\d?|SMALLDATETIME", "TIMESTAMP_NTZ({p})", "TIMESTAMP_NTZ"),
+    (r"TIMESTAMP_LTZ", "TIMESTAMP_LTZ({p})", "TIMESTAMP_LTZ"),
+    (r"TIMESTAMP_TZ|TIMESTAMPTZ|DATETIMEOFFSET", "TIMESTAMP_TZ({p})", "TIMESTAMP_TZ"),
+    (r"TIMESTAMP", "TIMESTAMP({p})", "TIMESTAMP"),
+    (r"DATE", "DATE", "DATE"),
+    (r"TIME(?:TZ)?", "TIME({p})", "TIME"),
+    (r"N?CHAR(?:ACTER)?", "VARCHAR({p})", "VARCHAR(1)"),  # bare CHAR is CHAR(1) in every dialect
+    (
+        r"N?VARCHAR2?|N?CHAR(?:ACTER)? VARYING|STRING|N?TEXT|TINYTEXT|MEDIUMTEXT|LONGTEXT"
+        r"|N?CLOB|UUID|UNIQUEIDENTIFIER|CITEXT|ENUM|XML",
+        "VARCHAR({p})",
+        "STRING",
+    ),
+    (r"BINARY|VARBINARY|BYTES|BYTEA|BLOB|RAW|IMAGE", "BINARY({p})", "BINARY"),
+    (r"VARIANT|JSONB?|SUPER", "VARIANT", "VARIANT"),
+    (r"OBJECT|STRUCT|RECORD|MAP", "OBJECT", "OBJECT"),
+    (r"ARRAY", "ARRAY", "ARRAY"),
+    (r"GEOGRAPHY", "GEOGRAPHY", "GEOGRAPHY"),
+    (r"GEOMETRY", "GEOMETRY", "GEOMETRY"),
+]
+
+# Types whose meaning differs by source system: {dialect: {normalised type: Snowflake type}}
+DIALECT_OVERRIDES: Dict[str, Dict[str, str]] = {
+    "oracle": {
+        "DATE": "TIMESTAMP_NTZ",  # Oracle DATE carries a time of day
+        "NUMBER": "NUMBER(38,10)",  # unconstrained decimal, not an integer
+        "LONG": "STRING",  # character data, not an integer
+    },
+    "sqlserver": {
+        "TIMESTAMP": "BINARY(8)",  # rowversion, not a point in time
+        "DATETIME": "TIMESTAMP_NTZ(3)",
+    },
+    "mysql": {
+        "TINYINT(1)": "BOOLEAN",
+        "TIMESTAMP": "TIMESTAMP_LTZ",
+    },
+    "postgres": {
+        "TIMESTAMP WITH TIME ZONE": "TIMESTAMP_TZ",
+        "TIME WITH TIME ZONE": "TIME",
+        "NUMERIC": "NUMBER(38,10)",  # unconstrained decimal, not an integer
+    },
+    "bigquery": {
+        "NUMERIC": "NUMBER(38,9)",
+        "BIGNUMERIC": "NUMBER(38,38)",
+        "TIMESTAMP": "TIMESTAMP_TZ",
+        "DATETIME": "TIMESTAMP_NTZ",
+    },
+}
+
+_COMPILED = [(re.compile(f"(?:{pattern})"), with_params, bare) for pattern, with_params, bare in _RULES]
+_WITH_TIME_ZONE = re.compile(r"\bWITH(?: LOCAL)? TIME ZONE\b")
+_PUNCT_SPACE = re.compile(r"\s*([(),])\s*")
+
+
+def normalize_type(raw: str) -> str:
+    """Upper-case and collapse whitespace: ' decimal( 18 ,2 ) ' -> 'DECIMAL(18,2)'."""
+    text = " ".join((raw or "").upper().split())
+    return _PUNCT_SPACE.sub(r"\1", text)
+
+
+@lru_cache(maxsize=4096)
+def map_type(raw: str, dialect: Optional[str] = None) -> str:
+    """
+    Map a source column type to a Snowflake type.
+
+    Results are memoised per (type, dialect); a 100k-column import usually
+    has only a few dozen distinct type strings. Types this module does not
+    recognise, or whose parameters it cannot parse, are returned as written,
+    so hand-typed Snowflake types such as "VECTOR(FLOAT, 256)" survive.
+
+    Args:
+        raw: Source type as written in the catalog, e.g. "decimal(18, 2)"
+        dialect: Source system ("oracle", "sqlserver", "mysql", "postgres", "bigquery")
+
+    Returns:
+        Snowflake type, e.g. "NUMBER(18,2)"; empty types map to "STRING"
+    """
+    text = normalize_type(raw)
+    if not text:
+        return "STRING"
+
+    overrides = DIALECT_OVERRIDES.get((dialect or "").lower(), {})
+    if text in overrides:
+        return overrides[text]
+
+    match = _TYPE_RE.match(text)
+    if not match:
+        return raw.strip()
+    base, precision, scale, suffix = match.group("base", "p", "s", "suffix")
+    suffix = suffix.strip()
+    if suffix.startswith("("):
+        return raw.strip()
+
+    if base in overrides and precision is None and not suffix:
+        return overrides[base]
+
+    # "TIMESTAMP WITH TIME ZONE" / "TIMESTAMP(6) WITH LOCAL TIME ZONE"
+    if base == "TIMESTAMP" and _WITH_TIME_ZONE.search(suffix):
+        base = "TIMESTAMP_LTZ" if "LOCAL" in suffix else "TIMESTAMP_TZ"
+
+    for pattern, with_params, bare in _COMPILED:
+        if not pattern.fullmatch(base):
+            continue
+        if precision is None or "{p}" not in with_params:
+            return bare
+        if precision == "MAX":
+            return bare
+        if precision == "*":
+            # Oracle NUMBER(*,s): maximum precision
+            if "{s}" not in with_params:
+                return bare
+            precision = "38"
+        if "{s}" in with_params:
+            return with_params.format(p=precision, s=scale or "0")
+        return with_params.format(p=precision)
+    return raw.strip()
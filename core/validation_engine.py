@@ -3,23 +3,109 @@ Validation Engine
 Validates data product definitions for completeness, consistency, and policy compliance.
 """
 
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from config import PRODUCT_SECTIONS, VALIDATION_CONFIG
+from .validation_rules import RuleRegistry
+
+# Product sections plus "other" (keys no section owns, e.g. attribute_rules)
+_ALL_SECTIONS = list(PRODUCT_SECTIONS) + ["other"]
+
+# ── Built-in rules ──────────────────────────────────────────────────────
+
+DEFAULT_RULES = RuleRegistry()
+rule = DEFAULT_RULES.rule
+
+# Business context
+rule("product.name", "Product name is required.", depends_on=["name"])(lambda p: bool(p.get("name")))
+rule("product.domain", "Business domain is required.", depends_on=["domain"])(lambda p: bool(p.get("domain")))
+rule("product.objective", "Business objective is required.", depends_on=["objective"])(
+    lambda p: bool(p.get("objective"))
+)
+rule("product.consumers", "No primary consumers specified.", "warning", depends_on=["consumers"])(
+    lambda p: bool(p.get("consumers"))
+)
+
+# Data sources
+rule("sources.required", "At least one data source is required.", depends_on=["sources"])(
+    lambda p: bool(p.get("sources"))
+)
+
+
+@rule("source.sla", "Source '{name}' is high criticality without an SLA.", "warning", scope="source")
+def _source_has_sla(src, context):
+    return not (src.get("criticality") == "High" and not src.get("sla_required"))
+
+
+# Data model
+rule("entities.required", "At least one entity must be defined.", depends_on=["entities"])(
+    lambda p: bool(p.get("entities"))
+)
+rule("entity.attributes", "Entity '{name}' has no attributes defined.", "warning", scope="entity")(
+    lambda ent, context: bool(ent.get("attributes"))
+)
+
+# Governance
+rule("governance.classification", "Data classification is not set.", "warning", depends_on=["classification"])(
+    lambda p: bool(p.get("classification"))
+)
+rule(
+    "governance.pii_frameworks",
+    "PII detected but no compliance frameworks selected.",
+    "warning",
+    depends_on=["pii", "compliance_frameworks"],
+)(lambda p: not (p.get("pii") and not p.get("compliance_frameworks")))
+rule(
+    "governance.restricted_roles",
+    "Restricted classification requires explicit access roles.",
+    "warning",
+    depends_on=["classification", "access_roles"],
+)(lambda p: not (p.get("classification") == "Restricted" and not p.get("access_roles")))
+
+# Data quality & transformations
+rule("quality.rules", "No data quality rules defined.", "warning", depends_on=["quality_rules"])(
+    lambda p: bool(p.get("quality_rules", {}))
+)
+rule("transformations.required", "No transformations defined.", "warning", depends_on=["transformations"])(
+    lambda p: bool(p.get("transformations"))
+)
+
+del rule
+
+_default_registry: Optional[RuleRegistry] = None
+
+
+def get_default_registry() -> RuleRegistry:
+    """Built-in rules plus any firm-specific rules from VALIDATION_CONFIG rules_path."""
+    global _default_registry
+    if _default_registry is None:
+        registry = RuleRegistry()
+        for builtin in DEFAULT_RULES:
+            registry.add(builtin)
+        rules_path = VALIDATION_CONFIG.get("rules_path")
+        if rules_path and os.path.exists(rules_path):
+            registry.load_yaml(rules_path)
+        _default_registry = registry
+    return _default_registry
+
 
 class ValidationEngine:
     """Runs validation checks against the data product definition."""
 
-    def __init__(self, product: dict):
+    def __init__(self, product: dict, registry: Optional[RuleRegistry] = None):
         self.product = product
         self.errors = []
         self.warnings = []
+        self.plan = (registry or get_default_registry()).compile()
 
     def validate(self) -> dict:
         """Run all validations and return results."""
-        self._validate_business_context()
-        self._validate_data_sources()
-        self._validate_data_model()
-        self._validate_governance()
-        self._validate_data_quality()
-        self._validate_transformations()
+        findings = self.plan.evaluate(self.product)
+        self.errors = findings["errors"]
+        self.warnings = findings["warnings"]
         return {
             "valid": len(self.errors) == 0,
             "errors": self.errors,
@@ -27,53 +113,6 @@ class ValidationEngine:
             "score": self._compute_score(),
         }
 
-    def _validate_business_context(self):
-        p = self.product
-        if not p.get("name"):
-            self.errors.append("Product name is required.")
-        if not p.get("domain"):
-            self.errors.append("Business domain is required.")
-        if not p.get("objective"):
-            self.errors.append("Business objective is required.")
-        if not p.get("consumers"):
-            self.warnings.append("No primary consumers specified.")
-
-    def _validate_data_sources(self):
-        sources = self.product.get("sources", [])
-        if not sources:
-            self.errors.append("At least one data source is required.")
-        for src in sources:
-            if src.get("criticality") == "High" and not src.get("sla_required"):
-                self.warnings.append(
-                    f"Source '{src['name']}' is high criticality without an SLA."
-                )
-
-    def _validate_data_model(self):
-        entities = self.product.get("entities", [])
-        if not entities:
-            self.errors.append("At least one entity must be defined.")
-        for ent in entities:
-            if not ent.get("attributes"):
-                self.warnings.append(f"Entity '{ent['name']}' has no attributes defined.")
-
-    def _validate_governance(self):
-        p = self.product
-        if not p.get("classification"):
-            self.warnings.append("Data classification is not set.")
-        if p.get("pii") and not p.get("compliance_frameworks"):
-            self.warnings.append("PII detected but no compliance frameworks selected.")
-        if p.get("classification") == "Restricted" and not p.get("access_roles"):
-            self.warnings.append("Restricted classification requires explicit access roles.")
-
-    def _validate_data_quality(self):
-        qr = self.product.get("quality_rules", {})
-        if not qr:
-            self.warnings.append("No data quality rules defined.")
-
-    def _validate_transformations(self):
-        if not self.product.get("transformations"):
-            self.warnings.append("No transformations defined.")
-
     def _compute_score(self) -> int:
         """Compute a readiness score (0-100)."""
         total = 7
@@ -96,3 +135,71 @@ class ValidationEngine:
             score += 1
 
         return int(score / total * 100)
+
+
+class IncrementalValidationEngine(ValidationEngine):
+    """ValidationEngine that keeps each section's findings between runs.
+
+    A section's rules are re-run only when a section they read has changed, so a
+    long-lived instance (e.g. one per Streamlit session) re-validates only
+    what was edited since the previous call. Results have the same shape as
+    ValidationEngine.validate().
+    """
+
+    def __init__(self, registry: Optional[RuleRegistry] = None):
+        super().__init__({}, registry)
+        self._groups = {}  # section -> (dependency versions, errors, warnings)
+        self._score = None  # (all section versions, score)
+        self.last_run = []  # sections evaluated by the latest validate()
+
+    def validate(self, product: Optional[dict] = None, section_versions: Optional[Dict] = None) -> dict:
+        """
+        Validate a product, reusing findings for unchanged sections.
+
+        Args:
+            product: Product definition (defaults to the last one validated)
+            section_versions: {section: version} from state_manager.get_section_versions();
+                section content hashes are computed here when omitted
+
+        Returns:
+            {"valid", "errors", "warnings", "score"}
+        """
+        if product is not None:
+            self.product = product
+        versions = section_versions or self._hash_sections(self.product)
+
+        errors = []
+        warnings = []
+        self.last_run = []
+        for section in self.plan.sections:
+            key = tuple(versions.get(s) for s in sorted(self.plan.dependencies(section)))
+            cached = self._groups.get(section)
+            if cached is None or cached[0] != key:
+                findings = self.plan.evaluate_section(self.product, section)
+                cached = self._groups[section] = (key, findings["errors"], findings["warnings"])
+                self.last_run.append(section)
+            errors.extend(cached[1])
+            warnings.extend(cached[2])
+
+        self.errors, self.warnings = errors, warnings
+        score_key = tuple(versions.get(s) for s in _ALL_SECTIONS)
+        if self._score is None or self._score[0] != score_key:
+            self._score = (score_key, self._compute_score())
+            self.last_run.append("_compute_score")
+
+        return {
+            "valid": len(errors) == 0,
+            "errors": list(errors),
+            "warnings": list(warnings),
+            "score": self._score[1],
+        }
+
+    @staticmethod
+    def _hash_sections(product: dict) -> Dict[str, str]:
+        owned = {key for keys in PRODUCT_SECTIONS.values() for key in keys}
+        values = {section: {k: product.get(k) for k in keys} for section, keys in PRODUCT_SECTIONS.items()}
+        values["other"] = {k: v for k, v in product.items() if k not in owned}
+        return {
+            section: hashlib.sha1(json.dumps(v, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            for section, v in values.items()
+        }
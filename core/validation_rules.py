@@ -0,0 +1,226 @@
+"""
+Validation Rules
+Declarative rule registry compiled into a single-pass evaluation plan.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from config import PRODUCT_SECTIONS
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+SEVERITIES = ("error", "warning")
+
+# Item scopes: (section, product key of the collection). Attributes are walked inside their entity.
+SCOPES = {
+    "product": None,
+    "source": ("data_sources", "sources"),
+    "entity": ("data_model", "entities"),
+    "attribute": ("data_model", "attributes"),
+    "transformation": ("transformations", "transformations"),
+}
+
+_SECTION_OF_KEY = {key: section for section, keys in PRODUCT_SECTIONS.items() for key in keys}
+
+
+class _Fields(dict):
+    """Message fields; unknown placeholders render as empty strings."""
+
+    def __missing__(self, key):
+        return ""
+
+
+class Rule:
+    """One validation check.
+
+    The predicate returns True when the item passes. It is called as
+    predicate(product) for product-scope rules and predicate(item, context)
+    otherwise, where context holds "product" and, for attributes, "entity".
+    The message is a str.format template over the item's fields (product
+    fields for product scope) plus {entity} for attributes.
+    """
+
+    def __init__(
+        self,
+        rule_id: str,
+        predicate: Callable,
+        message: str,
+        severity: str = "error",
+        scope: str = "product",
+        depends_on: Optional[List[str]] = None,
+    ):
+        if severity not in SEVERITIES:
+            raise ValueError(f"Rule '{rule_id}': severity must be one of {SEVERITIES}")
+        if scope not in SCOPES:
+            raise ValueError(f"Rule '{rule_id}': scope must be one of {list(SCOPES)}")
+        self.id = rule_id
+        self.predicate = predicate
+        self.message = message
+        self.severity = severity
+        self.scope = scope
+        self.depends_on = list(depends_on or [])
+
+        if scope != "product":
+            self.section = SCOPES[scope][0]
+        elif self.depends_on:
+            self.section = _SECTION_OF_KEY.get(self.depends_on[0].split(".")[0], "other")
+        else:
+            raise ValueError(f"Rule '{rule_id}': product-scope rules must declare depends_on")
+        # Every section whose content can change this rule's outcome
+        self.sections = {self.section} | {
+            _SECTION_OF_KEY.get(path.split(".")[0], "other") for path in self.depends_on
+        }
+
+    def format(self, fields: Dict, entity: Optional[Dict] = None) -> str:
+        values = _Fields(fields)
+        if entity is not None:
+            values["entity"] = entity.get("name", "")
+        return self.message.format_map(values)
+
+
+class RuleRegistry:
+    """Ordered collection of rules; later registrations with the same ID replace earlier ones."""
+
+    def __init__(self):
+        self._rules: Dict[str, Rule] = {}
+        self._plan = None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __iter__(self):
+        return iter(self._rules.values())
+
+    def add(self, rule: Rule):
+        self._rules[rule.id] = rule
+        self._plan = None
+
+    def remove(self, rule_id: str):
+        self._rules.pop(rule_id, None)
+        self._plan = None
+
+    def rule(self, rule_id: str, message: str, severity: str = "error", scope: str = "product",
+             depends_on: Optional[List[str]] = None):
+        """Decorator registering a predicate as a rule."""
+        def register(predicate):
+            self.add(Rule(rule_id, predicate, message, severity, scope, depends_on))
+            return predicate
+        return register
+
+    def load_yaml(self, path: str):
+        """
+        Register rules declared in a YAML file.
+
+        Each entry has id, message, scope, severity and depends_on, plus a
+        predicate written as:
+            when:    {field: value}   # rule applies only to items matching all of these
+            require: [field, ...]     # item passes if every field is non-empty
+
+        Args:
+            path: YAML file containing a list of rule entries
+        """
+        if yaml is None:
+            raise ImportError("pyyaml is required to load validation rules: pip install pyyaml")
+        with open(path, "r", encoding="utf-8") as f:
+            entries = yaml.safe_load(f) or []
+        for entry in entries:
+            self.add(Rule(
+                entry["id"],
+                _declarative_predicate(entry.get("when", {}), entry.get("require", []), entry.get("scope", "product")),
+                entry["message"],
+                entry.get("severity", "error"),
+                entry.get("scope", "product"),
+                entry.get("depends_on"),
+            ))
+
+    def compile(self) -> "EvaluationPlan":
+        """Return the evaluation plan for the current rules (rebuilt only after changes)."""
+        if self._plan is None:
+            self._plan = EvaluationPlan(list(self._rules.values()))
+        return self._plan
+
+
+def _declarative_predicate(when: Dict, require: List[str], scope: str) -> Callable:
+    when_items = list(when.items())
+    required = list(require)
+
+    def passes(item, context=None):
+        if any(item.get(field) != value for field, value in when_items):
+            return True
+        return all(item.get(field) for field in required)
+
+    if scope == "product":
+        return lambda product: passes(product)
+    return passes
+
+
+class EvaluationPlan:
+    """Rules grouped by section and scope, evaluated with one walk per collection.
+
+    Within a section, product-scope rules run first, then the section's
+    collection is walked once: every source, entity and transformation rule
+    runs on each item as it is visited. Every attribute rule runs on each
+    attribute, inside the same entity loop.
+    """
+
+    def __init__(self, rules: List[Rule]):
+        self.sections: List[str] = []
+        self._product: Dict[str, List[Rule]] = {}
+        self._items: Dict[str, Dict[str, List[Rule]]] = {}
+        self._dependencies: Dict[str, set] = {}
+        for rule in rules:
+            if rule.section not in self.sections:
+                self.sections.append(rule.section)
+            if rule.scope == "product":
+                self._product.setdefault(rule.section, []).append(rule)
+            else:
+                self._items.setdefault(rule.section, {}).setdefault(rule.scope, []).append(rule)
+            self._dependencies.setdefault(rule.section, set()).update(rule.sections)
+
+        # Report in workflow order regardless of registration order
+        order = list(PRODUCT_SECTIONS) + ["other"]
+        self.sections.sort(key=lambda s: order.index(s) if s in order else len(order))
+
+    def dependencies(self, section: str) -> set:
+        """Sections whose changes can alter the findings reported under section."""
+        return self._dependencies.get(section, set())
+
+    def evaluate(self, product: Dict) -> Dict[str, List[str]]:
+        """Evaluate every section; returns {"errors": [...], "warnings": [...]}."""
+        findings = {"errors": [], "warnings": []}
+        for section in self.sections:
+            result = self.evaluate_section(product, section)
+            findings["errors"].extend(result["errors"])
+            findings["warnings"].extend(result["warnings"])
+        return findings
+
+    def evaluate_section(self, product: Dict, section: str) -> Dict[str, List[str]]:
+        """Evaluate the rules reported under one section."""
+        findings = {"error": [], "warning": []}
+
+        for rule in self._product.get(section, ()):
+            if not rule.predicate(product):
+                findings[rule.severity].append(rule.format(product))
+
+        scoped = self._items.get(section, {})
+        context = {"product": product}
+        for scope in ("source", "entity", "transformation"):
+            rules = scoped.get(scope, ())
+            attribute_rules = scoped.get("attribute", ()) if scope == "entity" else ()
+            if not rules and not attribute_rules:
+                continue
+            for item in product.get(SCOPES[scope][1], []) or []:
+                for rule in rules:
+                    if not rule.predicate(item, context):
+                        findings[rule.severity].append(rule.format(item))
+                if attribute_rules:
+                    attr_context = {"product": product, "entity": item}
+                    for attr in item.get("attributes", []) or []:
+                        for rule in attribute_rules:
+                            if not rule.predicate(attr, attr_context):
+                                findings[rule.severity].append(rule.format(attr, item))
+
+        return {"errors": findings["error"], "warnings": findings["warning"]}
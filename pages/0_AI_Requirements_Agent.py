@@ -2,9 +2,10 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state
+from state_manager import collibra_cache_options, get_metadata_store, initialize_state
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from core.openai_client import OpenAIClient
 from core.collibra_client import CollibraClient
 from core.collibra_importer import CollibraImporter
@@ -94,29 +95,52 @@ with st.expander("📥 Import from Collibra", expanded=False):
             placeholder="e.g. Asset Management",
             help="The Collibra domain to import",
         )
+        full_refresh = st.checkbox(
+            "Full refresh",
+            help="Re-download the whole domain instead of only assets changed since the last import.",
+        )
+
+        store = get_metadata_store().for_instance(collibra_url)
+        local = store.domain_info(collibra_domain) if collibra_domain else None
+        if local:
+            age_min = int(local["age_seconds"] // 60)
+            st.caption(
+                f"Local copy: {local['assets']} assets, synced {age_min} min ago"
+                + ("" if local["fresh"] else " — stale, changes will be synced from Collibra")
+            )
 
         if st.button("Import Domain", use_container_width=True):
             try:
-                collibra = CollibraClient(
-                    base_url=collibra_url,
-                    username=collibra_user,
-                    password=collibra_pass,
-                )
-
-                # Test connection
-                if not collibra.test_connection():
-                    st.error("Cannot connect to Collibra. Check your credentials.")
+                model = None
+                if local and local["fresh"] and not full_refresh:
+                    # Fresh local copy - no need to contact Collibra
+                    importer = CollibraImporter(None, store=store)
+                    model = importer.import_data_model(collibra_domain, snapshot=store.load(collibra_domain))
                 else:
-                    # Import the domain
-                    importer = CollibraImporter(collibra)
-                    model = importer.import_data_model(collibra_domain)
-
+                    collibra = CollibraClient(
+                        base_url=collibra_url,
+                        username=collibra_user,
+                        password=collibra_pass,
+                        **collibra_cache_options(),
+                    )
+
+                    # Test connection
+                    if not collibra.test_connection():
+                        st.error("Cannot connect to Collibra. Check your credentials.")
+                    else:
+                        # Import the domain
+                        importer = CollibraImporter(collibra, store=store)
+                        snapshot = importer.sync_snapshot(collibra_domain, full_refresh=full_refresh)
+                        model = importer.import_data_model(collibra_domain, snapshot=snapshot)
+
+                if model is not None:
                     st.success(f"✅ Imported {len(model['entities'])} entities and "
                               f"{sum(len(e.get('attributes', [])) for e in model['entities'])} attributes")
 
                     # Store in session
                     st.session_state.product = model
                     st.session_state.collibra_domain = collibra_domain
+                    st.session_state.collibra_instance = store.instance
                     st.info("Domain imported! Start the conversation or click 'Begin' to use the workflow.")
 
             except Exception as e:
@@ -227,3 +251,5 @@ with st.expander("❓ How This Works"):
     - Give context: "We're in asset management" helps the agent understand
     - If the agent asks, give more detail — vagueness wastes back-and-forth
     """)
+
+render_debug_panel()
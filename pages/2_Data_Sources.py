@@ -2,9 +2,10 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state
+from state_manager import initialize_state, mark_changed
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom, render_step_complete
 
 initialize_state()
@@ -79,6 +80,7 @@ with st.form("add_source_form"):
                 "sla_required": sla_required,
                 "criticality": criticality,
             })
+            mark_changed("data_sources")
             st.success(f"Source **{source_name}** registered.")
 
 # ── Registered Sources ──────────────────────────────────────────
@@ -98,6 +100,7 @@ if product["sources"]:
                 st.markdown(f"**SLA:** {'Yes' if src['sla_required'] else 'No'}")
             if st.button("Remove", key=f"rm_src_{i}"):
                 product["sources"].pop(i)
+                mark_changed("data_sources")
                 st.rerun()
 
     # ── Governance Alerts ───────────────────────────────────────
@@ -122,3 +125,5 @@ render_step_complete(2, step_done)
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(2)
+
+render_debug_panel()
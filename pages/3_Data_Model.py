@@ -2,10 +2,12 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state
+from state_manager import get_metadata_store, initialize_state, mark_changed
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom, render_step_complete
+from config import DATA_TYPE_OPTIONS
 
 initialize_state()
 inject_custom_css()
@@ -29,8 +31,45 @@ if st.button("Add Entity"):
         st.error("Entity name is required.")
     else:
         product["entities"].append({"name": entity_name.upper(), "attributes": []})
+        mark_changed("data_model")
         st.success(f"Entity **{entity_name.upper()}** created. Add attributes below.")
 
+# ── Collibra lookup (searches the local copy of the imported domain) ────
+collibra_domain = st.session_state.get("collibra_domain")
+if collibra_domain:
+    from core.asset_index import get_domain_index
+    from core.collibra_importer import ENTITY_TYPES
+
+    store = get_metadata_store().for_instance(st.session_state.get("collibra_instance", ""))
+    index = get_domain_index(collibra_domain, store)
+    if index is not None:
+        lookup = st.text_input(
+            f"Find in Collibra ({collibra_domain})",
+            placeholder="Start typing an entity name...",
+            key="collibra_lookup",
+        )
+        if lookup:
+            matches = index.search(lookup, limit=8, asset_types=ENTITY_TYPES)
+            if not matches:
+                st.caption("No matching entities.")
+            existing = {e["name"] for e in product["entities"]}
+            for match in matches:
+                name = match.get("name", "").upper()
+                c1, c2 = st.columns([4, 1])
+                with c1:
+                    desc = f" — _{match['description']}_" if match.get("description") else ""
+                    st.markdown(f"`{name}`{desc}")
+                with c2:
+                    if st.button("Add", key=f"lookup_add_{match.get('id', name)}", disabled=name in existing):
+                        product["entities"].append({
+                            "name": name,
+                            "attributes": [],
+                            "collibra_id": match.get("id", ""),
+                            "description": match.get("description", ""),
+                        })
+                        mark_changed("data_model")
+                        st.rerun()
+
 st.divider()
 
 # ── Entity Panels ───────────────────────────────────────────────
@@ -56,7 +95,7 @@ if product["entities"]:
                     attr_name = st.text_input("Attribute Name", help="Auto-uppercased.")
                     data_type = st.selectbox(
                         "Data Type",
-                        ["STRING", "NUMBER", "FLOAT", "BOOLEAN", "DATE", "TIMESTAMP"],
+                        DATA_TYPE_OPTIONS,
                         help="STRING = VARCHAR, NUMBER = INTEGER, FLOAT = DECIMAL.",
                     )
                     nullable = st.checkbox("Nullable?", value=True, help="Uncheck for required fields (NOT NULL).")
@@ -81,6 +120,7 @@ if product["entities"]:
                             "pii": contains_pii,
                             "description": description,
                         })
+                        mark_changed("data_model")
                         if contains_pii:
                             product["pii"] = True
                         st.success(f"Attribute **{attr_name.upper()}** added to {entity['name']}.")
@@ -98,13 +138,62 @@ if product["entities"]:
 
             if st.button("Remove Entity", key=f"rm_ent_{idx}"):
                 product["entities"].pop(idx)
+                mark_changed("data_model")
                 st.rerun()
 else:
     st.info("No entities yet. Create your first entity above to start building the data model.")
 
+# ── PII scan ──────────────────────────────────────────
+if any(e.get("attributes") for e in product["entities"]):
+    st.divider()
+    st.markdown("#### Scan Model for PII")
+    st.caption(
+        "Checks every untagged attribute's name, description and type against the "
+        "PII dictionaries for this product's regulations."
+    )
+    if st.button("Scan Model"):
+        from config import PII_KEYWORDS
+        from core.pii_classifier import PIIClassifier
+
+        scope = set(product.get("regulatory_scope", [])) | set(product.get("compliance_frameworks", []))
+        regulations = [r for r in PII_KEYWORDS if r in scope] or None
+        st.session_state.pii_suggestions = PIIClassifier(regulations=regulations).scan(product["entities"])
+
+    suggestions = st.session_state.get("pii_suggestions")
+    if suggestions is not None:
+        if not suggestions:
+            st.success("No untagged PII found.")
+        else:
+            st.warning(f"{len(suggestions)} attributes look like PII.")
+            st.dataframe(
+                [
+                    {
+                        "Attribute": f"{s['entity']}.{s['attribute']}",
+                        "Confidence": s["confidence"],
+                        "Regulations": ", ".join(s["regulations"]),
+                        "Matched": ", ".join(s["terms"]),
+                    }
+                    for s in suggestions
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
+            if st.button("Tag All as PII"):
+                flagged = {(s["entity"], s["attribute"]) for s in suggestions}
+                for entity in product["entities"]:
+                    for attr in entity["attributes"]:
+                        if (entity["name"], attr["name"]) in flagged:
+                            attr["pii"] = True
+                mark_changed("data_model")
+                product["pii"] = True
+                st.session_state.pii_suggestions = None
+                st.rerun()
+
 # ── Step complete prompt ──────────────────────────────
 step_done = any(len(e.get("attributes", [])) > 0 for e in product.get("entities", []))
 render_step_complete(3, step_done)
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(3)
+
+render_debug_panel()
@@ -5,6 +5,7 @@ import streamlit as st
 from state_manager import initialize_state, mark_step_complete
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom, render_step_complete
 from config import CLASSIFICATION_OPTIONS, RETENTION_OPTIONS
 
@@ -120,3 +121,5 @@ render_step_complete(4, step_done)
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(4)
+
+render_debug_panel()
@@ -2,9 +2,10 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state, mark_step_complete
+from state_manager import initialize_state, mark_changed, mark_step_complete
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom, render_step_complete
 
 initialize_state()
@@ -192,6 +193,8 @@ else:
                     rule["custom_sql"] = custom_sql
 
                 product["attribute_rules"].append(rule)
+                # Saved quality_rules share this list
+                mark_changed("other", "data_quality")
                 st.success(f"Rule added for **{attr_select}**")
                 st.rerun()
 
@@ -237,6 +240,7 @@ if attr_rules:
 
             if st.button("Delete Rule", key=f"del_rule_{idx}"):
                 product["attribute_rules"].pop(idx)
+                mark_changed("other", "data_quality")
                 st.rerun()
 else:
     st.info("No attribute rules defined yet. Add one above to get started.")
@@ -258,3 +262,5 @@ render_step_complete(5, step_done)
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(5)
+
+render_debug_panel()
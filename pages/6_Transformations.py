@@ -2,9 +2,10 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state
+from state_manager import initialize_state, mark_changed
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom, render_step_complete
 
 initialize_state()
@@ -74,6 +75,7 @@ with st.form("add_transformation_form"):
                 "logic": logic,
                 "description": description,
             })
+            mark_changed("transformations")
             st.success(f"Transformation **{step_name}** added.")
 
 # ── Defined Transformations ─────────────────────────────────────
@@ -89,6 +91,7 @@ if product["transformations"]:
                 st.code(t["logic"], language="sql")
             if st.button("Remove", key=f"rm_tx_{i}"):
                 product["transformations"].pop(i)
+                mark_changed("transformations")
                 st.rerun()
 else:
     st.info("No transformations defined yet. Add your first processing step above.")
@@ -99,3 +102,5 @@ render_step_complete(6, step_done)
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(6)
+
+render_debug_panel()
@@ -3,11 +3,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import json
 import streamlit as st
-from state_manager import initialize_state, mark_step_complete, get_progress
+from state_manager import (
+    initialize_state, mark_step_complete, get_progress, get_product_fingerprint, validate_product,
+    get_artifact, get_data_model,
+)
 from components.layout import inject_custom_css, step_header
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import render_step_nav, render_step_nav_bottom
-from core.validation_engine import ValidationEngine
 from core.scoring_engine import ScoringEngine
 from core.snowflake_generator import SnowflakeGenerator
 from core.dbt_generator import DbtGenerator
@@ -44,8 +47,7 @@ st.progress(score / 100)
 st.divider()
 st.subheader("Validation Results")
 
-validator = ValidationEngine(product)
-results = validator.validate()
+results = validate_product()
 
 if results["valid"]:
     st.success(f"All validation checks passed. Readiness score: {results['score']}/100")
@@ -85,26 +87,30 @@ tab_ddl, tab_mask, tab_dbt, tab_collibra, tab_docs = st.tabs([
     "Documentation",
 ])
 
-sf = SnowflakeGenerator(product)
-dbt = DbtGenerator(product)
-collibra = CollibraGenerator(product)
-doc = DocumentEngine(product)
+# Reruns (tab switches, button clicks) reuse artifacts while the product is unchanged,
+# and every generator shares one normalised walk of the data model
+model = get_data_model()
+sf = SnowflakeGenerator(product, model)
+dbt = DbtGenerator(product, model)
+collibra = CollibraGenerator(product, model)
+doc = DocumentEngine(product, model)
+
 
 with tab_ddl:
-    ddl = sf.generate_ddl()
+    ddl = get_artifact("ddl", sf.generate_ddl)
     st.code(ddl, language="sql")
     st.download_button("Download DDL", data=ddl, file_name="snowflake_ddl.sql", mime="text/plain")
 
-    grants = sf.generate_grants()
+    grants = get_artifact("grants", sf.generate_grants)
     if grants and "No access roles" not in grants:
         st.markdown("#### Access Grants")
         st.code(grants, language="sql")
 
 with tab_mask:
-    masking = sf.generate_masking_policies()
+    masking = get_artifact("masking", sf.generate_masking_policies)
     st.code(masking, language="sql")
 
-    views = sf.generate_secure_views()
+    views = get_artifact("secure_views", sf.generate_secure_views)
     st.markdown("#### Secure Views")
     st.code(views, language="sql")
 
@@ -116,11 +122,11 @@ with tab_mask:
     )
 
 with tab_dbt:
-    schema_yaml = dbt.generate_schema_yaml()
+    schema_yaml = get_artifact("schema_yaml", dbt.generate_schema_yaml)
     st.markdown("#### schema.yml")
     st.code(schema_yaml, language="yaml")
 
-    models = dbt.generate_all_models()
+    models = get_artifact("dbt_models", dbt.generate_all_models)
     for filename, sql in models.items():
         st.markdown(f"#### {filename}")
         st.code(sql, language="sql")
@@ -128,7 +134,7 @@ with tab_dbt:
     st.download_button("Download schema.yml", data=schema_yaml, file_name="schema.yml", mime="text/plain")
 
 with tab_collibra:
-    collibra_json = collibra.to_json()
+    collibra_json = get_artifact("collibra_json", collibra.to_json)
     st.code(collibra_json, language="json")
     st.download_button(
         "Download Collibra Import",
@@ -138,7 +144,7 @@ with tab_collibra:
     )
 
 with tab_docs:
-    markdown = doc.generate_markdown()
+    markdown = get_artifact("markdown", doc.generate_markdown)
     st.markdown(markdown)
     st.download_button(
         "Download Documentation",
@@ -151,7 +157,16 @@ with tab_docs:
 st.divider()
 st.subheader("Full Export")
 
-full_json = json.dumps(product, indent=2, default=str)
+full_json = get_artifact("full_json", lambda: json.dumps(product, indent=2, default=str))
+
+if st.session_state.debug:
+    artifact_cache = st.session_state.artifact_cache
+    stats = artifact_cache.stats.as_dict()
+    st.caption(
+        f"Artifact cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"(hit rate {stats['hit_rate']:.0%}), {len(artifact_cache)} artifacts held · "
+        f"product {get_product_fingerprint()[:12]}"
+    )
 st.download_button(
     "Download Complete Definition (JSON)",
     data=full_json,
@@ -166,3 +181,5 @@ if results["valid"] and progress["pct"] >= 85:
 
 # ── Navigation buttons at bottom ─────────────────────
 render_step_nav_bottom(7)
+
+render_debug_panel()
@@ -4,11 +4,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 import json
 from datetime import datetime
 import streamlit as st
-from state_manager import initialize_state, get_progress
+from state_manager import initialize_state, get_progress, validate_product, get_artifact, get_data_model
 from components.layout import inject_custom_css
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import PAGE_MAP, STEP_NAMES
-from core.validation_engine import ValidationEngine
 from core.scoring_engine import ScoringEngine
 
 initialize_state()
@@ -127,12 +127,13 @@ for i, (label, ready, _step) in enumerate(deliverables):
 with st.expander("Download Artifacts", expanded=False):
     from core.document_engine import DocumentEngine
 
-    doc = DocumentEngine(product)
+    model = get_data_model()
+    doc = DocumentEngine(product, model)
     dl1, dl2, dl3, dl4 = st.columns(4)
     with dl1:
         st.download_button(
             "Docs (.md)",
-            data=doc.generate_markdown(),
+            data=get_artifact("markdown", doc.generate_markdown),
             file_name="data_product_spec.md",
             mime="text/markdown",
             key="_cvp_docs",
@@ -141,12 +142,12 @@ with st.expander("Download Artifacts", expanded=False):
         from core.snowflake_generator import SnowflakeGenerator
         from core.dbt_generator import DbtGenerator
 
-        sf = SnowflakeGenerator(product)
-        dbt = DbtGenerator(product)
+        sf = SnowflakeGenerator(product, model)
+        dbt = DbtGenerator(product, model)
         with dl2:
             st.download_button(
                 "DDL (.sql)",
-                data=sf.generate_ddl(),
+                data=get_artifact("ddl", sf.generate_ddl),
                 file_name="snowflake_ddl.sql",
                 mime="text/plain",
                 key="_cvp_ddl",
@@ -154,7 +155,7 @@ with st.expander("Download Artifacts", expanded=False):
         with dl3:
             st.download_button(
                 "dbt (.yml)",
-                data=dbt.generate_schema_yaml(),
+                data=get_artifact("schema_yaml", dbt.generate_schema_yaml),
                 file_name="schema.yml",
                 mime="text/plain",
                 key="_cvp_dbt",
@@ -162,7 +163,7 @@ with st.expander("Download Artifacts", expanded=False):
     with dl4:
         st.download_button(
             "JSON",
-            data=json.dumps(product, indent=2, default=str),
+            data=get_artifact("full_json", lambda: json.dumps(product, indent=2, default=str)),
             file_name="data_product.json",
             mime="application/json",
             key="_cvp_json",
@@ -313,8 +314,7 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-validator = ValidationEngine(product)
-results = validator.validate()
+results = validate_product()
 
 if results["errors"]:
     for err in results["errors"]:
@@ -376,3 +376,5 @@ else:
         f"Cannot sign off yet — {' and '.join(remaining)}. "
         "Use the **Edit** links above to complete each section."
     )
+
+render_debug_panel()
@@ -2,9 +2,11 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import streamlit as st
-from state_manager import initialize_state
+from state_manager import collibra_cache_options, initialize_state
 from components.layout import inject_custom_css
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
+from core.collibra_cache import get_default_cache
 
 initialize_state()
 inject_custom_css()
@@ -119,6 +121,7 @@ with st.expander("Collibra Configuration"):
                 base_url=collibra_url,
                 username=collibra_user,
                 password=collibra_pass,
+                **collibra_cache_options(),
             )
             if client.test_connection():
                 st.success("✅ Connected to Collibra!")
@@ -203,19 +206,32 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.markdown("### Cache Settings")
-    cache_enabled = st.checkbox("Enable Collibra data caching", value=True)
-    cache_ttl = st.slider("Cache TTL (seconds)", 300, 3600, 3600)
-
-    if cache_enabled:
-        st.caption(f"Collibra data will be cached for {cache_ttl} seconds")
+    # Applies to this session's Collibra clients only
+    cache_settings = st.session_state.collibra_cache
+    cache_settings["enabled"] = st.checkbox("Enable Collibra data caching", value=cache_settings["enabled"])
+    cache_settings["ttl_seconds"] = st.slider("Cache TTL (seconds)", 300, 3600, cache_settings["ttl_seconds"])
+    cache = get_default_cache()
+
+    if cache_settings["enabled"] and cache is not None:
+        stats = cache.stats.as_dict()
+        st.caption(f"Collibra data will be cached for {cache_settings['ttl_seconds']} seconds in this session")
+        st.caption(
+            f"Shared cache: {len(cache)} cached responses ({cache.size_bytes / 1024:.0f} KB) · "
+            f"{stats['hits']} hits · {stats['misses']} misses · {stats['evictions']} evictions"
+        )
+        if st.button("Clear Collibra Cache"):
+            cache.clear()
+            cache.stats.reset()
+            st.success("Collibra cache cleared")
 
 with col2:
     st.markdown("### Logging & Debugging")
-    debug_mode = st.checkbox("Enable debug logging", value=False)
+    debug_mode = st.checkbox("Enable debug logging", value=st.session_state.debug)
+    st.session_state.debug = debug_mode
     verbose_errors = st.checkbox("Show detailed error messages", value=True)
 
     if debug_mode:
-        st.caption("Debug logs will be printed to console")
+        st.caption("Debug logs will be printed to console, and a render profile is shown at the bottom of each page")
 
 # ── Reset & Clear ────────────────────────────────────────────────────────
 st.divider()
@@ -266,3 +282,5 @@ st.markdown(
     [Issues](https://github.com/vm799/Data-Product-Steward/issues)
     """
 )
+
+render_debug_panel()
@@ -1,5 +1,13 @@
+import hashlib
+import json
+
 import streamlit as st
 
+from config import CACHE_CONFIG, PRODUCT_SECTIONS
+from core.collibra_cache import SHARED
+from core.metadata_store import MetadataStore
+from core.profiler import profiled, start_profile, stop_profile
+
 
 def initialize_state():
     """Initialize the unified product session state."""
@@ -32,6 +40,35 @@ def initialize_state():
         st.session_state.steps_completed = set()
     if "theme" not in st.session_state:
         st.session_state.theme = "terminal"
+    if "debug" not in st.session_state:
+        st.session_state.debug = False
+    if "collibra_cache" not in st.session_state:
+        # Per-session cache options; CACHE_CONFIG only provides the defaults
+        st.session_state.collibra_cache = {
+            "enabled": CACHE_CONFIG["enabled"],
+            "ttl_seconds": CACHE_CONFIG["ttl_seconds"],
+        }
+    # One profile per rerun while debugging; shown by render_debug_panel()
+    if st.session_state.debug:
+        start_profile()
+    else:
+        stop_profile()
+    refresh_fingerprints()
+
+
+def collibra_cache_options():
+    """CollibraClient cache arguments for this session's cache settings."""
+    settings = st.session_state.collibra_cache
+    return {
+        "cache": SHARED if settings["enabled"] else None,
+        "cache_ttl": settings["ttl_seconds"],
+    }
+
+
+@st.cache_resource
+def get_metadata_store():
+    """The process-wide MetadataStore, opened once and shared by every session."""
+    return MetadataStore()
 
 
 def mark_step_complete(step_key):
@@ -39,10 +76,26 @@ def mark_step_complete(step_key):
     st.session_state.steps_completed.add(step_key)
 
 
+@profiled("get_progress")
 def get_progress(product):
-    """Compute workflow progress from actual product state."""
+    """Compute workflow progress from actual product state.
+
+    The session product's progress is computed once per product fingerprint
+    and set of completed steps, so the sidebar, step bar and page body share
+    one snapshot per rerun. Treat the returned dict as read-only.
+    """
     completed = st.session_state.get("steps_completed", set())
+    if product is not st.session_state.get("product"):
+        return _compute_progress(product, completed)
+
+    key = (get_product_fingerprint(), frozenset(completed))
+    snapshot = st.session_state.get("progress_snapshot")
+    if snapshot is None or snapshot[0] != key:
+        snapshot = st.session_state.progress_snapshot = (key, _compute_progress(product, completed))
+    return snapshot[1]
+
 
+def _compute_progress(product, completed):
     steps = {
         "Business Context": bool(
             product.get("name") and product.get("domain") and product.get("objective")
@@ -62,14 +115,145 @@ def get_progress(product):
     done = sum(1 for v in steps.values() if v)
     total = len(steps)
     pct = int(done / total * 100) if total > 0 else 0
+    next_step = next((i + 1 for i, v in enumerate(steps.values()) if not v), None)
 
-    return {"steps": steps, "done": done, "total": total, "pct": pct}
+    return {"steps": steps, "done": done, "total": total, "pct": pct, "next_step": next_step}
 
 
 def get_next_step(product):
     """Return 1-indexed number of the first incomplete step, or None if all done."""
-    progress = get_progress(product)
-    for i, done in enumerate(progress["steps"].values()):
-        if not done:
-            return i + 1
-    return None
+    return get_progress(product)["next_step"]
+
+
+def _section_values(product, section):
+    """The product keys belonging to one section ("other" = unowned keys)."""
+    if section == "other":
+        owned = {key for keys in PRODUCT_SECTIONS.values() for key in keys}
+        return {k: v for k, v in product.items() if k not in owned}
+    return {k: product.get(k) for k in PRODUCT_SECTIONS[section]}
+
+
+def section_hash(product, section):
+    """Content hash of the product keys belonging to one section ("other" = unowned keys)."""
+    encoded = json.dumps(_section_values(product, section), sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _section_shape(values):
+    """Scalars by value, containers by identity and size; holding the objects keeps their ids unique."""
+    return {
+        k: (v, None) if isinstance(v, (str, int, float, bool, type(None))) else (v, len(v))
+        for k, v in values.items()
+    }
+
+
+def _same_shape(before, after):
+    if before is None or before.keys() != after.keys():
+        return False
+    for key, (value, size) in after.items():
+        old_value, old_size = before[key]
+        if size is None:
+            if type(old_value) is not type(value) or old_value != value:
+                return False
+        elif old_value is not value or old_size != size:
+            return False
+    return True
+
+
+def mark_changed(*sections):
+    """Flag product sections that were edited in place.
+
+    Every edit that mutates a product value instead of assigning a new one to
+    a product key must call this: appending to or removing from a list,
+    setting a field of a nested dict (e.g. an attribute's "pii"), and so on.
+    refresh_fingerprints() does not look inside unchanged containers, so an
+    unflagged in-place edit leaves validation findings and cached artifacts
+    stale. Assigning product[key] needs no call.
+
+    Args:
+        sections: PRODUCT_SECTIONS names, or "other" for keys no section owns
+    """
+    dirty = st.session_state.get("dirty_sections", set())
+    dirty.update(sections)
+    st.session_state.dirty_sections = dirty
+
+
+@profiled("refresh_fingerprints")
+def refresh_fingerprints():
+    """Re-hash each changed product section and bump the version of every section whose content changed.
+
+    Called by initialize_state() at the top of every page, so versions
+    reflect all edits made before the current rerun. Call it again after
+    mutating the product mid-run if later code on the same page depends on it.
+
+    A section is re-hashed only if its top-level values were reassigned or
+    resized, or it was flagged with mark_changed(); large products are not
+    re-serialised on reruns that did not touch them. Code that edits the
+    product in place must therefore call mark_changed() (see there).
+    """
+    product = st.session_state.product
+    previous = st.session_state.get("section_hashes", {})
+    shapes = st.session_state.get("section_shapes", {})
+    versions = st.session_state.get("section_versions", {})
+    dirty = st.session_state.get("dirty_sections", set())
+    hashes = {}
+    for section in list(PRODUCT_SECTIONS) + ["other"]:
+        shape = _section_shape(_section_values(product, section))
+        if section in previous and section not in dirty and _same_shape(shapes.get(section), shape):
+            hashes[section] = previous[section]
+            continue
+        shapes[section] = shape
+        hashes[section] = section_hash(product, section)
+        if previous.get(section) != hashes[section]:
+            versions[section] = versions.get(section, 0) + 1
+    st.session_state.section_hashes = hashes
+    st.session_state.section_shapes = shapes
+    st.session_state.section_versions = versions
+    st.session_state.dirty_sections = set()
+    st.session_state.product_fingerprint = hashlib.sha1(
+        "".join(hashes[s] for s in sorted(hashes)).encode("utf-8")
+    ).hexdigest()
+
+
+def get_section_versions():
+    """Return {section: version}; a version changes only when that section's content does."""
+    return dict(st.session_state.get("section_versions", {}))
+
+
+def changed_sections(since):
+    """Sections whose version differs from a get_section_versions() result taken earlier."""
+    current = st.session_state.get("section_versions", {})
+    return {section for section, version in current.items() if since.get(section) != version}
+
+
+def get_product_fingerprint():
+    """Content hash of the whole product as of the last refresh_fingerprints()."""
+    return st.session_state.get("product_fingerprint", "")
+
+
+@profiled("validate_product")
+def validate_product():
+    """Validate the session product, re-running only rule groups whose sections changed."""
+    from core.validation_engine import IncrementalValidationEngine
+
+    if "validator" not in st.session_state:
+        st.session_state.validator = IncrementalValidationEngine()
+    return st.session_state.validator.validate(st.session_state.product, get_section_versions())
+
+
+@profiled(lambda name, build: f"artifact {name}")
+def get_artifact(name, build):
+    """Return a generated artifact for the session product, rebuilding it only after the product changes."""
+    from core.artifact_cache import ArtifactCache
+
+    if "artifact_cache" not in st.session_state:
+        st.session_state.artifact_cache = ArtifactCache()
+    return st.session_state.artifact_cache.get(get_product_fingerprint(), name, build)
+
+
+def get_data_model():
+    """Normalised data model of the session product, shared by every generator."""
+    from core.model_ir import build_model
+
+    product = st.session_state.product
+    return get_artifact("model", lambda: build_model(product))
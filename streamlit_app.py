@@ -2,6 +2,7 @@ import streamlit as st
 from state_manager import initialize_state, get_progress, get_next_step
 from components.layout import inject_custom_css, get_bot_svg
 from components.sidebar import render_sidebar
+from components.debug_panel import render_debug_panel
 from components.helpers import PAGE_MAP, STEP_NAMES
 
 st.set_page_config(
@@ -435,3 +436,5 @@ elif step == 2:
     _canvas_guide()
 else:
     _dashboard()
+
+render_debug_panel()